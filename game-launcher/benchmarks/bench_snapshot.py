@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# benchmarks/bench_snapshot.py
+# مقارنة زمن التحميل والذاكرة: pickle مقابل اللقطة العمودية
+"""
+Snapshot Load Benchmark
+
+    python benchmarks/bench_snapshot.py --games 100000
+
+كل حالة تُقاس في عملية منفصلة حتى لا تتأثر قراءة الذاكرة (أقصى RSS) بالحالات السابقة.
+الحالات:
+- pickle: DatabaseManager.load_games
+- columnar-load: ColumnarDatabaseManager.load_games (بناء كل القواميس)
+- columnar-open: فتح اللقطة عبر mmap وقراءة لعبة واحدة (التحميل الكسول)
+- pickle-library / columnar-library: بناء GameLibrary كاملة (مسار الإقلاع الفعلي)
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+CASES = ("pickle", "columnar-load", "columnar-open", "pickle-library", "columnar-library")
+
+
+def _max_rss_kb():
+    """أقصى RSS للعملية بالكيلوبايت (None إذا تعذرت القراءة)"""
+    # لينكس: VmHWM خاص بهذه العملية، بينما ru_maxrss قد يُورث من العملية الأم عند fork
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS يعيد البايتات
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def run_case(case, path):
+    """تنفيذ حالة واحدة داخل العملية الحالية"""
+    from src.database.storage import DatabaseManager
+    from src.database.columnar import ColumnarDatabaseManager
+    from src.core.library import GameLibrary
+
+    rss_before = _max_rss_kb()
+    start = time.perf_counter()
+    if case == "pickle":
+        count = len(DatabaseManager(path).load_games())
+    elif case == "columnar-load":
+        count = len(ColumnarDatabaseManager(path).load_games())
+    elif case == "columnar-open":
+        with ColumnarDatabaseManager(path).open_snapshot() as snapshot:
+            count = len(snapshot)
+            snapshot.row(count // 2)
+    else:
+        storage = DatabaseManager(path) if case == "pickle-library" else ColumnarDatabaseManager(path)
+        count = len(GameLibrary(storage, write_behind=False).games)
+    seconds = time.perf_counter() - start
+    rss_after = _max_rss_kb()
+    return {
+        'case': case,
+        'games': count,
+        'seconds': seconds,
+        'rss_delta_kb': None if rss_before is None else rss_after - rss_before,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="pickle vs columnar snapshot load benchmark")
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3, help="عدد التكرارات لكل حالة (يؤخذ الأسرع)")
+    parser.add_argument("--child", nargs=2, metavar=("CASE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_case(*args.child)))
+        return 0
+
+    from benchmarks.synthetic import make_game_dicts
+    from src.database.storage import DatabaseManager
+    from src.database.columnar import write_snapshot
+
+    games = make_game_dicts(args.games)
+    with tempfile.TemporaryDirectory() as folder:
+        paths = {
+            "pickle": os.path.join(folder, "games.db"),
+            "columnar": os.path.join(folder, "games.glcs"),
+        }
+        DatabaseManager(paths["pickle"]).save_games(games)
+        write_snapshot(paths["columnar"], games)
+        del games
+
+        results = []
+        for case in CASES:
+            path = paths["pickle" if case.startswith("pickle") else "columnar"]
+            runs = []
+            for _ in range(args.repeat):
+                out = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--child", case, path],
+                    check=True, capture_output=True, text=True, cwd=ROOT,
+                )
+                runs.append(json.loads(out.stdout))
+            best = min(runs, key=lambda r: r['seconds'])
+            best['file_bytes'] = os.path.getsize(path)
+            results.append(best)
+
+    for r in results:
+        rss = "n/a" if r['rss_delta_kb'] is None else f"{r['rss_delta_kb'] / 1024:.1f} MiB"
+        print(f"{r['case']:<15} {r['games']:>8} games  {r['seconds'] * 1000:9.1f} ms  "
+              f"RSS +{rss:<11} file {r['file_bytes'] / 1024 / 1024:.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# benchmarks/suite.py
+# مجموعة قياسات الأداء: التخزين، عمليات المكتبة، وإعادة بناء شبكة الواجهة
+"""
+Benchmark Suite
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json --threshold 0.25
+    python benchmarks/suite.py --baseline benchmarks/baseline.json --update-baseline
+
+- مكتبات اصطناعية بأحجام 1k / 10k / 100k (أسماء عربية ولاتينية، بذرة ثابتة)
+- كل قياس يُكرر ويُحفظ الأسرع والوسيط بالثواني
+- النتائج JSON؛ مع --baseline يُقارن الأسرع بالأساس وتُعاد 1 عند وجود تراجع
+- قياس معايرة ثابت (calibrate) يُحفظ مع النتائج: المقارنة تُصحح بنسبة سرعة الجهاز
+  الحالية إلى سرعته عند تسجيل الأساس، فلا يُعد تباطؤ الجهاز كله تراجعاً
+- --update-baseline يدمج النتائج الحالية في ملف الأساس (الحالات غير المقاسة تبقى كما هي)؛
+  يُشغّل في كل تعديل يغير سلوك حالة مقاسة، وتُعطى الحالة اسماً جديداً إذا تغير معناها
+- الحالات بلا أساس (جديدة، أو لم تُسجل لغياب Qt مثلاً) تُذكر ولا تُعد تراجعاً
+- حالات الواجهة تعمل على منصة Qt غير مرئية (offscreen) وتُتخطى إذا لم يتوفر Qt
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import SIZES, GENRES, make_game_dicts  # noqa: E402
+
+SEARCH_QUERIES = ("Dragon", "الصحراء", "fall 12", "فارس", "zz-no-match")
+# فرق أقل من هذا (بالثواني) لا يُعد تراجعاً: الحالات الأقصر من ملّي ثانية يغلب عليها التشويش
+DEFAULT_MIN_DELTA = 0.0005
+DEFAULT_UI_MAX_SIZE = 10_000  # MainWindow ينشئ ودجت لكل بطاقة: الأحجام الأكبر بطيئة جداً
+
+
+def measure(func, repeat, setup=None):
+    """
+    تشغيل func عدة مرات
+    Args:
+        func: الدالة المقاسة (تستقبل نتيجة setup إن وُجد)
+        repeat: عدد التكرارات
+        setup: تجهيز غير مقاس قبل كل تكرار
+    Returns:
+        dict: best / median بالثواني وعدد التكرارات
+    """
+    times = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        if setup:
+            func(arg)
+        else:
+            func()
+        times.append(time.perf_counter() - start)
+    return {'best': min(times), 'median': statistics.median(times), 'repeat': repeat}
+
+
+def calibrate(repeat=7):
+    """
+    زمن عمل ثابت لا يتغير مع الكود (فرز نصوص وعمليات قاموس) لقياس سرعة الجهاز الحالية
+    Returns:
+        float: أسرع زمن بالثواني
+    """
+    words = [f"{i * 7919 % 10007:05d}-{i}" for i in range(20000)]
+
+    def work():
+        index = {}
+        for word in sorted(words):
+            index.setdefault(word[:3], []).append(word)
+        return len(index)
+
+    return measure(work, repeat)['best']
+
+
+class _NullStorage:
+    """مدير تخزين في الذاكرة: يقدم الألعاب الاصطناعية ولا يكتب شيئاً (نقيس المكتبة وحدها)"""
+
+    def __init__(self, games_data):
+        self.games_data = games_data
+
+    def load_games(self):
+        return self.games_data
+
+    def save_games(self, games_data):
+        pass
+
+    def apply_changes(self, changes):
+        pass
+
+
+@contextlib.contextmanager
+def _quiet():
+    # المكتبة تطبع رسالة لكل إضافة؛ الطباعة ليست جزءاً من القياس
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def bench_storage(results, size, games, repeat):
+    from src.database.storage import DatabaseManager
+
+    with tempfile.TemporaryDirectory() as folder:
+        manager = DatabaseManager(os.path.join(folder, "games.db"))
+        results[f"storage.save_games[{size}]"] = measure(lambda: manager.save_games(games), repeat)
+        results[f"storage.load_games[{size}]"] = measure(manager.load_games, repeat)
+
+
+def bench_library(results, size, games, repeat):
+    from src.core.library import GameLibrary
+
+    with _quiet():
+        # التحميل مكلف في الأحجام الكبيرة: يُكرر في الأحجام الصغيرة فقط (المكتبة الأخيرة تُستخدم بعده)
+        libraries = []
+
+        def load():
+            libraries[:] = [GameLibrary(_NullStorage(games), write_behind=False)]
+
+        results[f"library.load[{size}]"] = measure(load, repeat if size <= 10_000 else 1)
+        library = libraries[0]
+
+        batch = [(f"Bench Add {size} {i}", f"/bench/add/{size}/{i}.exe") for i in range(200)]
+        counter = iter(range(10 ** 9))
+
+        def add_batch():
+            run = next(counter)
+            for name, path in batch:
+                library.add_game(f"{name}-{run}", path + f".{run}")
+
+        results[f"library.add_game x200[{size}]"] = measure(add_batch, repeat)
+
+    def search_all(fuzzy):
+        for query in SEARCH_QUERIES:
+            library.search_games(query, fuzzy=fuzzy)
+
+    # المطابقة الحرفية المرتبة (نفس قياس ما قبل البحث التقريبي) والبحث التقريبي قياسان منفصلان
+    results[f"library.search_games x{len(SEARCH_QUERIES)}[{size}]"] = measure(
+        lambda: search_all(False), repeat
+    )
+    results[f"library.search_games fuzzy x{len(SEARCH_QUERIES)}[{size}]"] = measure(
+        lambda: search_all(True), repeat
+    )
+
+    def filter_all():
+        for genre in GENRES:
+            library.filter_by_genre(genre)
+
+    results[f"library.filter_by_genre x{len(GENRES)}[{size}]"] = measure(filter_all, repeat)
+    results[f"library.get_statistics[{size}]"] = measure(library.get_statistics, repeat)
+
+
+def _qt_app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from src.ui.qt_compat import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def bench_ui(results, size, games, repeat):
+    app = _qt_app()
+    from src.ui.card_view import CardGridView, GameCardData
+    from src.ui.main_window import MainWindow
+
+    cards = [
+        GameCardData(id=g['id'], title=g['name'], image_path="", category=g['genre'], executable=g['path'])
+        for g in games
+    ]
+    grid = CardGridView(lambda key: key)
+    grid.set_data_provider(lambda: cards)
+    grid.refresh()
+    # البحث الأولي يعمل على دفعات عبر حلقة الأحداث: ننتظر ظهور كل البطاقات
+    while grid.model.rowCount() < len(cards):
+        app.processEvents()
+
+    def apply_filters(category_index):
+        grid.category.blockSignals(True)
+        grid.category.setCurrentIndex(category_index)
+        grid.category.blockSignals(False)
+        # فلتر الفئة عملية bitwise على نتائج البحث الحالية (دون إعادة البحث)
+        grid._apply_filters()
+
+    categories = max(1, grid.category.count())
+    indexes = iter(range(10 ** 9))
+    # فلتر أوجه متزامن (bitset) منذ فهرس الأوجه؛ الاسم القديم _apply_filters كان إعادة بحث كاملة
+    results[f"ui.CardGridView.facet_filter[{size}]"] = measure(
+        apply_filters, repeat, setup=lambda: next(indexes) % categories
+    )
+    grid.deleteLater()
+
+    window = MainWindow(games=games)
+
+    def show_all():
+        # الشبكة الافتراضية تبدل صفوف النموذج فقط: لا تُنشأ عناصر لكل لعبة
+        window.reset_filters()
+        while window.filter._running:
+            app.processEvents()
+
+    results[f"ui.MainWindow.reset_filters[{size}]"] = measure(show_all, repeat)
+    window.deleteLater()
+    app.processEvents()
+
+
+def compare(results, baseline, threshold, calibration=None, base_calibration=None,
+            min_delta=DEFAULT_MIN_DELTA):
+    """
+    مقارنة أسرع زمن بالأساس
+    Args:
+        calibration: زمن المعايرة في التشغيل الحالي
+        base_calibration: زمن المعايرة للحالات المسجلة بدون معايرة خاصة بها
+        min_delta: أقل فرق مطلق (بالثواني) يُعد تراجعاً
+    Returns:
+        list: التراجعات (الحالات الأبطأ من الأساس بأكثر من threshold بعد تصحيح سرعة الجهاز)
+    """
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base or not base.get('best'):
+            continue
+        # كل حالة تُصحح بمعايرة التشغيل الذي سُجلت فيه (التحديث الجزئي يخلط تشغيلات)
+        reference = base.get('calibration', base_calibration)
+        scale = calibration / reference if calibration and reference else 1.0
+        expected = base['best'] * scale
+        ratio = current['best'] / expected
+        current['baseline'] = base['best']
+        current['ratio'] = ratio
+        if ratio > 1 + threshold and current['best'] - expected > min_delta:
+            regressions.append({'case': name, 'baseline': base['best'], 'current': current['best'], 'ratio': ratio})
+    return regressions
+
+
+def update_baseline(path, report):
+    """
+    دمج نتائج التشغيل الحالي في ملف الأساس
+    الحالات المقاسة الآن تُستبدل، والبقية (أحجام أو أقسام لم تُشغل) تبقى كما هي.
+    """
+    baseline = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            baseline = json.load(f)
+    results = dict(baseline.get('results', {}))
+    for name, r in report['results'].items():
+        results[name] = {'best': r['best'], 'median': r['median'], 'repeat': r['repeat'],
+                         'calibration': report['meta']['calibration']}
+
+    def measured(skip):
+        # "ui[1000]" لم يعد متخطى إذا قيست الآن أي حالة "ui.*[1000]"
+        section, size = skip.split("[", 1)
+        return any(case.startswith(section + ".") and case.endswith("[" + size) for case in report['results'])
+
+    skipped = {name: reason for name, reason in baseline.get('skipped', {}).items() if not measured(name)}
+    skipped.update(report['skipped'])
+    meta = dict(report['meta'])
+    meta['sizes'] = sorted(set(baseline.get('meta', {}).get('sizes', [])) | set(meta['sizes']))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({'meta': meta, 'results': results, 'skipped': skipped},
+                           ensure_ascii=False, indent=2) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Game Launcher benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", choices=("storage", "library", "ui"), nargs="+",
+                        default=["storage", "library", "ui"])
+    parser.add_argument("--ui-max-size", type=int, default=DEFAULT_UI_MAX_SIZE)
+    parser.add_argument("--output", help="ملف JSON للنتائج (افتراضياً الطباعة فقط)")
+    parser.add_argument("--baseline", help="ملف JSON سابق للمقارنة")
+    parser.add_argument("--threshold", type=float, default=0.25, help="نسبة التباطؤ المسموحة (0.25 = 25%%)")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA,
+                        help="أقل فرق بالثواني يُعد تراجعاً")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="دمج النتائج في ملف --baseline بعد المقارنة")
+    args = parser.parse_args(argv)
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline يتطلب --baseline")
+
+    calibration = calibrate()
+    results = {}
+    skipped = {}
+    for size in args.sizes:
+        games = make_game_dicts(size)
+        if "storage" in args.only:
+            bench_storage(results, size, games, args.repeat)
+        if "library" in args.only:
+            bench_library(results, size, games, args.repeat)
+        if "ui" in args.only:
+            if size > args.ui_max_size:
+                skipped[f"ui[{size}]"] = f"size above --ui-max-size {args.ui_max_size}"
+            else:
+                try:
+                    bench_ui(results, size, games, args.repeat)
+                except ImportError as e:
+                    skipped[f"ui[{size}]"] = f"Qt not available: {e}"
+        print(f"size {size}: done", file=sys.stderr)
+
+    # المعايرة قبل القياسات وبعدها: الأسرع منهما كما في القياسات نفسها
+    calibration = min(calibration, calibrate())
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec="seconds"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sizes': args.sizes,
+            'repeat': args.repeat,
+            'calibration': calibration,
+        },
+        'results': results,
+        'skipped': skipped,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline.get('results', {}), args.threshold,
+                              calibration, baseline.get('meta', {}).get('calibration'), args.min_delta)
+        report['regressions'] = regressions
+        report['threshold'] = args.threshold
+        report['unbaselined'] = sorted(name for name in results if name not in baseline.get('results', {}))
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for name, r in results.items():
+        ratio = f"  x{r['ratio']:.2f}" if 'ratio' in r else ""
+        print(f"{name:<48} {r['best'] * 1000:10.2f} ms{ratio}", file=sys.stderr)
+    print(f"calibration: {calibration * 1000:.2f} ms (ratios are corrected for machine speed)", file=sys.stderr)
+    for name in report.get('unbaselined', ()):
+        print(f"NO BASELINE {name}", file=sys.stderr)
+    for r in regressions:
+        print(f"REGRESSION {r['case']}: {r['baseline'] * 1000:.2f} ms -> {r['current'] * 1000:.2f} ms "
+              f"(x{r['ratio']:.2f})", file=sys.stderr)
+    if args.update_baseline:
+        update_baseline(args.baseline, report)
+        print(f"baseline updated: {args.baseline}", file=sys.stderr)
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# benchmarks/synthetic.py
+# توليد مكتبات ألعاب اصطناعية قابلة للتكرار لقياس الأداء
+"""
+Synthetic Libraries
+مكتبات ألعاب اصطناعية بأسماء عربية ولاتينية (نفس البذرة = نفس البيانات)
+"""
+
+import random
+from datetime import datetime, timedelta
+
+LATIN_WORDS = (
+    "Shadow", "Legends", "Racing", "Empire", "Quest", "Galaxy", "Knight", "Storm",
+    "Dragon", "Rise", "Fall", "Tactics", "Frontier", "Station", "Chronicles", "Zero",
+)
+ARABIC_WORDS = (
+    "أسطورة", "الصحراء", "فارس", "المملكة", "سباق", "الظل", "مغامرة", "النجوم",
+    "حرب", "القلعة", "الصقر", "رحلة", "الأبطال", "مدينة", "الكنز", "العاصفة",
+)
+GENRES = ("أكشن", "مغامرات", "RPG", "استراتيجية", "سباق", "رياضة", "ألغاز", "Shooter")
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+SIZES = (1_000, 10_000, 100_000)
+
+
+def make_game_dicts(count, seed=0):
+    """
+    قواميس ألعاب بصيغة Game.to_dict
+    Args:
+        count: عدد الألعاب
+        seed: بذرة التوليد
+    Returns:
+        list: قواميس الألعاب (نصف الأسماء عربية تقريباً)
+    """
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    games = []
+    for i in range(count):
+        words = ARABIC_WORDS if rng.random() < 0.5 else LATIN_WORDS
+        name = f"{' '.join(rng.sample(words, rng.randint(1, 3)))} {i}"
+        added = base + timedelta(minutes=rng.randint(0, 500_000))
+        played = rng.random() < 0.6
+        games.append({
+            'id': f"bench_{i:07d}",
+            'name': name,
+            'path': f"C:/Games/{i // 1000:03d}/{i}/game.exe",
+            'genre': rng.choice(GENRES),
+            'description': rng.choice(("", name, "وصف قصير للعبة", "A short description")),
+            'added_date': added.strftime(DATE_FORMAT),
+            'last_played': (added + timedelta(minutes=rng.randint(1, 50_000))).strftime(DATE_FORMAT)
+            if played else None,
+            'play_time': rng.randint(1, 6000) if played else 0,
+            'play_count': rng.randint(1, 200) if played else 0,
+            'key': i + 1,
+        })
+    return games
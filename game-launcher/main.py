@@ -8,12 +8,36 @@ Version: 1.0.0
 License: Open Source
 """
 
-# تشغيل واجهة التطبيق مباشرة
-from src.ui.main_window import run_application
+import argparse
+import time
 
+# لحظة بدء العملية لقياس زمن الإقلاع
+_START = time.perf_counter()
 
-def main():
+
+def parse_args(argv=None):
+    """قراءة خيارات سطر الأوامر"""
+    parser = argparse.ArgumentParser(description="Game Launcher - مشغل الألعاب")
+    parser.add_argument("--db", default="games.db",
+                        help="مسار قاعدة بيانات الألعاب (ملف pickle قديم يُرحّل إلى SQLite بجانبه عند أول تشغيل)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="طباعة أزمنة الاستيراد وأول رسم والوصول للتفاعل")
+    parser.add_argument("--startup-budget-ms", type=float, default=None,
+                        help="ميزانية زمن الوصول للتفاعل بالمللي ثانية (مع --profile-startup)")
+    parser.add_argument("--metrics", action="store_true",
+                        help="قياس زمن العمليات وطباعة p50/p99 عند الخروج (F12 يعرضها في النافذة)")
+    parser.add_argument("--metrics-trace", default=None, metavar="PATH",
+                        help="تسجيل كل قياس في ملف JSON lines (يفعّل --metrics)")
+    parser.add_argument("--theme", choices=("dark", "light"), default="dark",
+                        help="سمة الواجهة (يمكن تبديلها أثناء التشغيل)")
+    parser.add_argument("--lang", choices=("ar", "en"), default="ar",
+                        help="لغة الواجهة (يمكن تبديلها أثناء التشغيل)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """نقطة دخول التطبيق"""
+    args = parse_args(argv)
     print("=" * 50)
     print("🎮 Game Launcher v1.0.0")
     print("📝 مشروع مكتبة الألعاب الحديثة")
@@ -21,8 +45,24 @@ def main():
     print("بدء تشغيل التطبيق...")
     print("=" * 50)
 
-    # تشغيل واجهة المستخدم PyQt5
-    run_application()
+    from src.utils.profiling import StartupProfiler
+    profiler = StartupProfiler(enabled=args.profile_startup, budget_ms=args.startup_budget_ms, start=_START)
+
+    if args.metrics or args.metrics_trace:
+        from src.utils import metrics
+        metrics.enable(trace_path=args.metrics_trace)
+
+    # استيراد الواجهة مؤجل حتى هنا: ربط Qt واحد والنافذة المستخدمة فقط
+    with profiler.measure("import ui"):
+        from src.ui.main_window import run_application
+
+    # تشغيل واجهة المستخدم؛ المكتبة تُحمّل بعد أول رسم للنافذة
+    try:
+        return run_application(db_path=args.db, profiler=profiler, theme_name=args.theme,
+                               language=args.lang)
+    finally:
+        if args.metrics or args.metrics_trace:
+            metrics.dump()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,226 @@
+# src/core/facets.py
+# فهرس الأوجه (facets) - فلترة بالفئة والنوع والوسوم عبر مجموعات بتات
+"""
+Facet Index Module
+لكل قيمة في كل وجه (الفئة، النوع، الوسوم) مجموعة بتات (int) بعدد العناصر:
+- كل عنصر يأخذ موضع بت ثابتاً (المواضع المحررة بالحذف يُعاد استخدامها)
+- الإضافة والحذف تعدّل بتات العنصر فقط، دون إعادة بناء أي فهرس
+- الفلترة: OR داخل الوجه الواحد و AND بين الأوجه، عمليات bitwise على أعداد صحيحة
+- العدادات: عدد البتات في (قناع القيمة AND قناع النتائج الحالية)
+- version(facet) يتغير فقط عند ظهور قيمة جديدة أو اختفاء قيمة، فتُحدَّث القوائم المنسدلة عند الحاجة فقط
+"""
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+    def _popcount(mask):
+        return bin(mask).count("1")
+
+
+class FacetIndex:
+    """مجموعات بتات لكل قيمة في كل وجه"""
+
+    def __init__(self, facets):
+        """
+        Args:
+            facets: {اسم الوجه: دالة تعطي قيم العنصر في هذا الوجه (قائمة أو مجموعة)}
+        """
+        self._extractors = dict(facets)
+        self._masks = {name: {} for name in self._extractors}  # {الوجه: {القيمة: int}}
+        self._versions = {name: 0 for name in self._extractors}
+        self._slots = {}  # {المعرف: موضع البت}
+        self._ids = []  # المعرف في كل موضع (None للمواضع المحررة)
+        self._free = []  # مواضع محررة لإعادة الاستخدام
+        self._values = {}  # {المعرف: {الوجه: القيم}} لحذف العنصر دون إعادة حساب قيمه
+        self._all = 0  # كل المواضع المستخدمة
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, item_id):
+        return item_id in self._slots
+
+    def version(self, facet):
+        """رقم يتغير عند تغير مجموعة قيم الوجه (وليس عند تغير العدادات فقط)"""
+        return self._versions[facet]
+
+    def values(self, facet):
+        """القيم الموجودة حالياً في الوجه (بترتيب ظهورها الأول)"""
+        return list(self._masks[facet])
+
+    def add(self, item_id, item):
+        """إضافة عنصر أو تحديث قيمه بعد تعديله"""
+        values = {name: frozenset(extract(item) or ()) for name, extract in self._extractors.items()}
+        old = self._values.get(item_id)
+        if old == values:
+            return
+        if old is not None:
+            self._clear_values(self._slots[item_id], old)
+            slot = self._slots[item_id]
+        else:
+            slot = self._free.pop() if self._free else len(self._ids)
+            if slot == len(self._ids):
+                self._ids.append(item_id)
+            else:
+                self._ids[slot] = item_id
+            self._slots[item_id] = slot
+            self._all |= 1 << slot
+        self._values[item_id] = values
+        bit = 1 << slot
+        for name, facet_values in values.items():
+            masks = self._masks[name]
+            for value in facet_values:
+                mask = masks.get(value)
+                if mask is None:
+                    masks[value] = bit
+                    self._versions[name] += 1
+                else:
+                    masks[value] = mask | bit
+
+    def update(self, items):
+        """
+        إضافة دفعة عناصر (مثلاً دفعة تحميل): العناصر الجديدة تُجمع مواضعها لكل قيمة
+        ثم يُضاف قناع كل قيمة بعملية OR واحدة بدلاً من عملية لكل عنصر
+
+        Args:
+            items: أزواج (المعرف, العنصر)
+        """
+        pending = {name: {} for name in self._extractors}  # {الوجه: {القيمة: [المواضع]}}
+        added = []
+        for item_id, item in items:
+            if item_id in self._slots:
+                self.add(item_id, item)
+                continue
+            values = {name: frozenset(extract(item) or ()) for name, extract in self._extractors.items()}
+            slot = self._free.pop() if self._free else len(self._ids)
+            if slot == len(self._ids):
+                self._ids.append(item_id)
+            else:
+                self._ids[slot] = item_id
+            self._slots[item_id] = slot
+            self._values[item_id] = values
+            added.append(slot)
+            for name, facet_values in values.items():
+                facet_pending = pending[name]
+                for value in facet_values:
+                    facet_pending.setdefault(value, []).append(slot)
+        if not added:
+            return
+        self._all |= self._mask_of_slots(added)
+        for name, facet_pending in pending.items():
+            masks = self._masks[name]
+            for value, slots in facet_pending.items():
+                mask = masks.get(value)
+                if mask is None:
+                    self._versions[name] += 1
+                    mask = 0
+                masks[value] = mask | self._mask_of_slots(slots)
+
+    def discard(self, item_id):
+        slot = self._slots.pop(item_id, None)
+        if slot is None:
+            return
+        self._clear_values(slot, self._values.pop(item_id))
+        self._ids[slot] = None
+        self._free.append(slot)
+        self._all &= ~(1 << slot)
+
+    def _clear_values(self, slot, values):
+        bit = 1 << slot
+        for name, facet_values in values.items():
+            masks = self._masks[name]
+            for value in facet_values:
+                mask = masks[value] & ~bit
+                if mask:
+                    masks[value] = mask
+                else:
+                    del masks[value]
+                    self._versions[name] += 1
+
+    def clear(self):
+        self._masks = {name: {} for name in self._extractors}
+        for name in self._versions:
+            self._versions[name] += 1
+        self._slots = {}
+        self._ids = []
+        self._free = []
+        self._values = {}
+        self._all = 0
+
+    def mask(self, facet, value):
+        return self._masks[facet].get(value, 0)
+
+    def mask_of(self, item_ids):
+        """قناع مجموعة معرفات (مثلاً نتائج البحث النصي)"""
+        slots = self._slots
+        return self._mask_of_slots([slots[item_id] for item_id in item_ids if item_id in slots])
+
+    def _mask_of_slots(self, slots):
+        # bytearray ثم تحويل واحد: O(n) بدلاً من OR على عدد كبير لكل بت
+        bits = bytearray((len(self._ids) + 7) // 8)
+        for slot in slots:
+            bits[slot >> 3] |= 1 << (slot & 7)
+        return int.from_bytes(bits, "little")
+
+    def select(self, filters, match_all=(), within=None):
+        """
+        قناع العناصر المطابقة لعدة أوجه
+
+        Args:
+            filters: {الوجه: القيم المختارة}؛ الأوجه الفارغة أو None لا تُقيّد
+            match_all: أوجه تُطلب فيها كل القيم المختارة (AND) بدلاً من أي منها (OR)
+            within: قناع يُقيد النتائج (اختياري)
+
+        Returns:
+            int: قناع العناصر المطابقة
+        """
+        result = self._all if within is None else within & self._all
+        for facet, selected in filters.items():
+            if not selected:
+                continue
+            masks = self._masks[facet]
+            if facet in match_all:
+                for value in selected:
+                    result &= masks.get(value, 0)
+            else:
+                combined = 0
+                for value in selected:
+                    combined |= masks.get(value, 0)
+                result &= combined
+        return result
+
+    def count(self, mask=None):
+        """عدد العناصر في قناع (أو كل العناصر)"""
+        return len(self._slots) if mask is None else _popcount(mask)
+
+    def counts(self, facet, within=None):
+        """
+        عدد العناصر لكل قيمة في الوجه
+
+        Args:
+            within: قناع يُحسب داخله (مثلاً نتائج البحث)، None لكل العناصر
+
+        Returns:
+            dict: {القيمة: العدد}
+        """
+        masks = self._masks[facet]
+        if within is None:
+            return {value: _popcount(mask) for value, mask in masks.items()}
+        return {value: _popcount(mask & within) for value, mask in masks.items()}
+
+    def ids(self, mask):
+        """
+        معرفات العناصر في قناع (بترتيب مواضع البتات)
+
+        Returns:
+            list: المعرفات
+        """
+        ids = self._ids
+        # التمثيل الثنائي معكوساً: الحرف i هو البت i (أسرع من المرور بت ببت على عدد كبير)
+        bits = bin(mask)[:1:-1]
+        result = []
+        pos = bits.find("1")
+        while pos != -1:
+            result.append(ids[pos])
+            pos = bits.find("1", pos + 1)
+        return result
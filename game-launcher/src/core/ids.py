@@ -0,0 +1,59 @@
+# src/core/ids.py
+# مفاتيح الألعاب الصحيحة - بديل المعرفات النصية العشوائية
+"""
+Game Keys Module
+مولد مفاتيح صحيحة متزايدة دون تصادم (على طريقة ULID):
+- المفتاح = (الوقت بالمللي ثانية << SEQUENCE_BITS) + تسلسل داخل نفس المللي ثانية
+- متزايد دائماً داخل العملية حتى لو أُضيفت آلاف الألعاب في نفس الثانية
+- observe() عند التحميل يضمن ألا يُعاد إصدار مفتاح محفوظ (حتى لو رجعت الساعة للخلف)
+- المفاتيح تتسع في int64 (أعمدة SQLite واللقطة العمودية) وتجزئتها أرخص من النصوص
+
+المعرف النصي (game.id) يبقى للتوافق مع قواعد البيانات الحالية فقط.
+"""
+
+import threading
+import time
+
+SEQUENCE_BITS = 16  # حتى 65536 مفتاحاً لكل مللي ثانية قبل الاستعارة من التالية
+
+
+class KeyAllocator:
+    """مولد مفاتيح متزايدة آمن للاستخدام من عدة خيوط"""
+
+    def __init__(self):
+        self._last = 0
+        self._lock = threading.Lock()
+
+    def next(self):
+        """
+        Returns:
+            int: مفتاح جديد أكبر من كل المفاتيح السابقة
+        """
+        floor = int(time.time() * 1000) << SEQUENCE_BITS
+        with self._lock:
+            key = self._last + 1 if self._last >= floor else floor
+            self._last = key
+            return key
+
+    def observe(self, key):
+        """تسجيل مفتاح موجود (من قاعدة البيانات) حتى لا يُصدر مرة أخرى"""
+        with self._lock:
+            if key > self._last:
+                self._last = key
+
+
+_allocator = KeyAllocator()
+
+
+def next_key():
+    """مفتاح جديد من المولد المشترك للعملية"""
+    return _allocator.next()
+
+
+def observe_key(key):
+    _allocator.observe(key)
+
+
+def format_id(key):
+    """المعرف النصي للعبة جديدة (الألعاب القديمة تحتفظ بمعرفاتها game_<وقت>_<عشوائي>)"""
+    return f"game_{key}"
@@ -0,0 +1,188 @@
+# src/core/launcher.py
+# مشرف التشغيل - تشغيل الألعاب دون حجب الواجهة وقياس وقت اللعب الفعلي
+"""
+Launch Supervisor Module
+يشغل الألعاب في الخلفية ويتابع العمليات الفرعية:
+- التشغيل يتم في خيط عامل فلا ينتظر المستدعي (أو واجهة Qt)
+- لكل جلسة خيط مراقبة ينتظر انتهاء العملية ويحسب مدتها
+- تحديثات الإحصائيات تُجمع وتُحفظ كدفعة واحدة كل فترة (أو عند امتلاء الدفعة) بدلاً من حفظ لكل تشغيل
+- عند الإيقاف تُسجل مدة الجلسات التي لم تنته بعد ثم تُحفظ الدفعة الأخيرة
+"""
+
+import math
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from ..utils import metrics
+
+# امتدادات يمكن تشغيلها كعملية مباشرة على ويندوز (غيرها يُفتح عبر os.startfile)
+WINDOWS_EXECUTABLES = ('.exe', '.bat', '.cmd', '.com')
+
+
+class GameSession:
+    """جلسة لعب واحدة قيد التشغيل"""
+
+    def __init__(self, game_id, process):
+        self.game_id = game_id
+        self.process = process
+        self.started = time.monotonic()
+        self.started_at = datetime.now()
+        self.recorded = False  # سُجلت نهايتها (عند انتهاء العملية أو إيقاف المشرف)
+
+    @property
+    def pid(self):
+        return self.process.pid if self.process else None
+
+    def elapsed_seconds(self):
+        return time.monotonic() - self.started
+
+    def elapsed_minutes(self):
+        """مدة الجلسة بالدقائق مقربة للأعلى (جلسة أقصر من دقيقة تُحسب دقيقة)"""
+        return math.ceil(self.elapsed_seconds() / 60)
+
+
+class LaunchSupervisor:
+    """
+    مشرف تشغيل الألعاب
+
+    - launch(game): يجدول التشغيل ويعود فوراً
+    - يدعم عدة جلسات متزامنة
+    - عند انتهاء كل عملية تُسجل مدة الجلسة في play_time
+    - الأحداث تُطبق على المكتبة في دفعة واحدة كل flush_interval ثانية، أو عند بلوغها max_batch
+    """
+
+    def __init__(self, library, flush_interval=5.0, max_spawn_workers=2, max_batch=100):
+        """
+        Args:
+            library: مكتبة الألعاب (GameLibrary)
+            flush_interval: الفترة بالثواني بين دفعات حفظ الإحصائيات
+            max_spawn_workers: عدد الخيوط المخصصة لتشغيل العمليات
+            max_batch: عدد الأحداث الذي يفرض حفظ الدفعة قبل انتهاء الفترة
+        """
+        self.library = library
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._spawner = ThreadPoolExecutor(max_workers=max_spawn_workers, thread_name_prefix="game-spawn")
+        self._sessions = {}  # {pid أو معرف داخلي: GameSession}
+        self._events = []  # ("start", game_id, 0) / ("end", game_id, minutes)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="launch-flusher", daemon=True)
+        self._flusher.start()
+
+    # ========== التشغيل ==========
+    def launch(self, game):
+        """
+        جدولة تشغيل لعبة في الخلفية
+
+        Args:
+            game: كائن اللعبة
+
+        Returns:
+            Future: يكتمل بجلسة اللعبة (أو None إذا فشل التشغيل)
+        """
+        return self._spawner.submit(self._spawn, game.key, game.path, game.name)
+
+    @metrics.timed("launcher.spawn")
+    def _spawn(self, game_id, path, name):
+        try:
+            if os.name == 'nt' and not path.lower().endswith(WINDOWS_EXECUTABLES):
+                # اختصارات وملفات أخرى: لا توجد عملية يمكن متابعتها
+                os.startfile(path)
+                process = None
+            else:
+                process = subprocess.Popen([path], cwd=os.path.dirname(path) or None)
+        except FileNotFoundError as e:
+            # الملف اختفى بعد آخر فحص: تحديث ذاكرة صحة المسارات لتظهر البطاقة كمفقودة
+            self.library.path_health.update({path: False})
+            print(f"خطأ: ملف اللعبة غير موجود: {e}")
+            return None
+        except Exception as e:
+            print(f"خطأ في تشغيل اللعبة: {e}")
+            return None
+
+        session = GameSession(game_id, process)
+        self._queue_event("start", game_id, 0)
+        print(f"تم تشغيل اللعبة: {name}")
+        if process is not None:
+            with self._lock:
+                self._sessions[process.pid] = session
+            threading.Thread(
+                target=self._watch, args=(session,), name=f"game-watch-{process.pid}", daemon=True
+            ).start()
+        return session
+
+    def _watch(self, session):
+        """انتظار انتهاء العملية ثم تسجيل مدة الجلسة"""
+        try:
+            session.process.wait()
+        finally:
+            self._end_session(session)
+
+    def _end_session(self, session):
+        """تسجيل نهاية الجلسة مرة واحدة (من خيط المراقبة أو عند الإيقاف)"""
+        with self._lock:
+            self._sessions.pop(session.pid, None)
+            if session.recorded:
+                return
+            session.recorded = True
+            # الحدث يُضاف مع القفل: الإيقاف لا يرى الجلسة منتهية قبل وصول حدثها للدفعة
+            self._events.append(("end", session.game_id, session.elapsed_minutes()))
+            full = len(self._events) >= self.max_batch
+        if full:
+            self._wakeup.set()
+
+    def active_sessions(self):
+        """الجلسات قيد التشغيل حالياً"""
+        with self._lock:
+            return list(self._sessions.values())
+
+    # ========== حفظ الإحصائيات على دفعات ==========
+    def _queue_event(self, kind, game_id, minutes):
+        with self._lock:
+            self._events.append((kind, game_id, minutes))
+            full = len(self._events) >= self.max_batch
+        if full:
+            self._wakeup.set()
+
+    @metrics.timed("launcher.flush")
+    def flush(self):
+        """تطبيق أحداث الجلسات المتراكمة على المكتبة وحفظها مرة واحدة"""
+        with self._lock:
+            events, self._events = self._events, []
+        if not events:
+            return
+        with self.library.batch():
+            for kind, game_id, minutes in events:
+                if kind == "start":
+                    self.library.record_play(game_id)
+                else:
+                    self.library.record_play(game_id, minutes, new_session=False)
+
+    def _flush_loop(self):
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"خطأ في حفظ إحصائيات اللعب: {e}")
+
+    def shutdown(self):
+        """
+        إيقاف المشرف وحفظ الأحداث المتبقية
+        الألعاب الجارية تستمر دون متابعة: تُسجل مدتها حتى الآن، وخيوط مراقبتها لا تسجلها مرة أخرى.
+        """
+        self._stopped = True
+        # بعد انتهاء خيوط التشغيل لا تبدأ جلسات جديدة
+        self._spawner.shutdown(wait=True)
+        for session in self.active_sessions():
+            self._end_session(session)
+        self._wakeup.set()
+        self._flusher.join()
+        self.flush()
@@ -6,31 +6,122 @@ Game Library Module
 """
 
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import wraps
+
+from ..utils import metrics
+from .ids import format_id, next_key, observe_key
+from .path_health import MISSING, PathHealth
+from .persistence import WriteBehind
+from .search import SearchIndex, normalize
+from .stats import LibraryStats
+from .views import SORT_FIELDS, SortedView
+
+# صيغة التواريخ في قاعدة البيانات (للتوافق مع الملفات الحالية)
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+DEFAULT_GENRE = "غير محدد"
+
+
+def to_timestamp(value):
+    """تحويل تاريخ (نص بصيغة DATE_FORMAT أو رقم epoch) إلى ثوانٍ صحيحة منذ epoch"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(datetime.fromisoformat(value).timestamp())
+    except ValueError:
+        return int(datetime.strptime(value, DATE_FORMAT).timestamp())
+
+
+def format_timestamp(timestamp):
+    """تحويل ثوانٍ منذ epoch إلى نص بصيغة DATE_FORMAT"""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).strftime(DATE_FORMAT)
+
+
+def _synchronized(method):
+    """تنفيذ الدالة مع قفل المكتبة (قد تأتي التعديلات من خيوط الخلفية)"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class Game:
-    """فئة تمثل لعبة واحدة"""
+    """
+    فئة تمثل لعبة واحدة
+    
+    تمثيل مضغوط للمكتبات الكبيرة:
+    - __slots__ بدلاً من __dict__ لكل كائن
+    - التواريخ أرقام صحيحة (epoch) وتُنسق كنص عند الطلب فقط
+    - أسماء الأنواع مُدمجة (interned) فتتشارك الألعاب نفس النص
+    
+    key مفتاح صحيح فريد تستخدمه المكتبة داخلياً، و id المعرف النصي المحفوظ للتوافق
+    """
+    
+    __slots__ = (
+        'key', 'id', 'name', 'path', '_genre', 'description',
+        'added_ts', 'last_played_ts', 'play_time', 'play_count',
+    )
     
-    def __init__(self, name, path, genre="غير محدد", description=""):
-        self.id = self._generate_id()
+    def __init__(self, name, path, genre=DEFAULT_GENRE, description="", key=None):
+        self.key = next_key() if key is None else key
+        self.id = format_id(self.key)
         self.name = name
         self.path = path
         self.genre = genre
         self.description = description
-        self.added_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.last_played = None
+        self.added_ts = int(time.time())
+        self.last_played_ts = None
         self.play_time = 0  # بالدقائق
         self.play_count = 0
     
-    def _generate_id(self):
-        """توليد معرف فريد للعبة"""
-        from random import randint
-        return f"game_{datetime.now().strftime('%Y%m%d%H%M%S')}_{randint(1000, 9999)}"
+    @property
+    def genre(self):
+        return self._genre
     
-    def update_play_stats(self, duration_minutes=0):
-        """تحديث إحصائيات اللعب"""
-        self.last_played = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.play_count += 1
+    @genre.setter
+    def genre(self, value):
+        self._genre = sys.intern(value) if isinstance(value, str) else value
+    
+    @property
+    def added_date(self):
+        """تاريخ الإضافة كنص"""
+        return format_timestamp(self.added_ts)
+    
+    @added_date.setter
+    def added_date(self, value):
+        self.added_ts = to_timestamp(value)
+    
+    @property
+    def last_played(self):
+        """تاريخ آخر تشغيل كنص (أو None)"""
+        return format_timestamp(self.last_played_ts)
+    
+    @last_played.setter
+    def last_played(self, value):
+        self.last_played_ts = to_timestamp(value)
+    
+    def update_play_stats(self, duration_minutes=0, new_session=True):
+        """
+        تحديث إحصائيات اللعب
+        
+        Args:
+            duration_minutes: دقائق اللعب المضافة
+            new_session: جلسة جديدة (تحديث آخر تشغيل وعدد المرات)
+        """
+        if new_session:
+            self.last_played_ts = int(time.time())
+            self.play_count += 1
         self.play_time += duration_minutes
     
     def to_dict(self):
@@ -39,26 +130,30 @@ class Game:
             'id': self.id,
             'name': self.name,
             'path': self.path,
-            'genre': self.genre,
+            'genre': self._genre,
             'description': self.description,
-            'added_date': self.added_date,
-            'last_played': self.last_played,
+            'added_date': format_timestamp(self.added_ts),
+            'last_played': format_timestamp(self.last_played_ts),
             'play_time': self.play_time,
-            'play_count': self.play_count
+            'play_count': self.play_count,
+            'key': self.key,
         }
     
     @classmethod
     def from_dict(cls, data):
         """إنشاء لعبة من قاموس"""
-        game = cls(
-            name=data['name'],
-            path=data['path'],
-            genre=data.get('genre', 'غير محدد'),
-            description=data.get('description', '')
-        )
+        # تجاوز __init__: لا حاجة لتوليد معرف أو قراءة الوقت الحالي لكل لعبة محملة
+        game = cls.__new__(cls)
+        # قواعد البيانات القديمة بلا مفتاح: تمنحه المكتبة عند التحميل
+        game.key = data.get('key')
         game.id = data['id']
-        game.added_date = data.get('added_date', game.added_date)
-        game.last_played = data.get('last_played')
+        game.name = data['name']
+        game.path = data['path']
+        game.genre = data.get('genre', DEFAULT_GENRE)
+        game.description = data.get('description', '')
+        added_ts = to_timestamp(data.get('added_date'))
+        game.added_ts = added_ts if added_ts is not None else int(time.time())
+        game.last_played_ts = to_timestamp(data.get('last_played'))
         game.play_time = data.get('play_time', 0)
         game.play_count = data.get('play_count', 0)
         return game
@@ -75,40 +170,314 @@ class GameLibrary:
     - إحصائيات اللعب
     """
     
-    def __init__(self, storage_manager=None):
+    def __init__(self, storage_manager=None, autoload=True, write_behind=True,
+                 save_delay=0.5, max_pending_changes=200):
         """
         تهيئة مكتبة الألعاب
         
         Args:
             storage_manager: مدير قاعدة البيانات لحفظ واسترجاع البيانات
+            autoload: تحميل الألعاب فوراً؛ مع False يُستخدم iter_load للتحميل التدريجي
+            write_behind: الحفظ في خيط خلفي بدلاً من خيط المستدعي
+            save_delay: مهلة دمج التعديلات المتتالية قبل الكتابة (بالثواني)
+            max_pending_changes: عدد التعديلات المعلّقة الذي يفرض الكتابة فوراً
         """
-        self.games = {}  # dictionary: {game_id: Game}
+        self.games = {}  # dictionary: {game.key: Game}
+        self._ids = {}  # {المعرف النصي: المفتاح} للتوافق مع المستدعين القدامى
         self.storage = storage_manager
+        # اكتمال تحميل كل الألعاب في الذاكرة؛ قبله تُمرر الاستعلامات لقاعدة البيانات إن دعمتها
+        self._loaded = not storage_manager
+        # قفل التعديلات: مشرف التشغيل يحدث الإحصائيات من خيط خلفي
+        self.lock = threading.RLock()
+        self._launcher = None
+        self._path_health = None
+        self._search_index = SearchIndex()
+        # فهارس ثانوية: {المفتاح: {game.key: None}} (قاموس كمجموعة مرتبة)
+        self._by_name_path = {}  # (name, path)
+        self._by_name = {}  # الاسم الموحد
+        self._by_genre = {}  # النوع
+        self._by_path = {}  # مسار الملف التنفيذي
+        # إحصائيات جارية تُحدَّث مع كل تعديل
+        self._stats = LibraryStats()
+        # عروض مرتبة {حقل الترتيب: SortedView}، يُبنى كل عرض عند أول طلب ثم يُحدَّث تدريجياً
+        self._views = {}
+        # الدفعات: التغييرات تُجمع وتُحفظ مرة واحدة عند انتهاء الدفعة
+        self._batch_depth = 0
+        self._pending_changes = []
+        # سجل التراجع: دالة لكل تعديل داخل الدفعة تعيد المكتبة لحالتها قبله
+        self._undo = []
+        # الحفظ المؤجل: التعديلات تُدمج وتُكتب من خيط خلفي
+        self._writer = None
+        if self.storage and write_behind:
+            self._writer = WriteBehind(self._write_changes, save_delay, max_pending_changes)
         
         # تحميل الألعاب من قاعدة البيانات إن وجدت
-        if self.storage:
+        if self.storage and autoload:
             self._load_games()
     
+    @metrics.timed("library.load")
     def _load_games(self):
         """تحميل الألعاب من قاعدة البيانات"""
+        for _ in self.iter_load():
+            pass
+    
+    def iter_load(self, chunk_size=1000):
+        """
+        تحميل الألعاب من قاعدة البيانات على دفعات (مولد)
+        كل دفعة تُضاف للمكتبة وتُفهرس قبل إرجاعها، فيمكن للواجهة عرضها مباشرة
+        
+        Args:
+            chunk_size: عدد الألعاب في كل دفعة
+        
+        Yields:
+            list: كائنات الألعاب المحملة في هذه الدفعة
+        """
+        if not self.storage:
+            return
+        # ألعاب بلا مفتاح محفوظ (قواعد بيانات قديمة) تُحفظ مفاتيحها الجديدة بعد التحميل
+        rekeyed = []
         try:
-            games_data = self.storage.load_games()
-            for game_dict in games_data:
-                game = Game.from_dict(game_dict)
-                self.games[game.id] = game
+            if hasattr(self.storage, 'iter_games'):
+                chunks = self.storage.iter_games(chunk_size)
+            else:
+                games_data = self.storage.load_games()
+                chunks = (games_data[i:i + chunk_size] for i in range(0, len(games_data), chunk_size))
+            for chunk in chunks:
+                loaded = []
+                with self.lock:
+                    for game_dict in chunk:
+                        game = Game.from_dict(game_dict)
+                        old = self.games.get(self._ids.get(game.id))
+                        if old is not None:
+                            self._unindex_game(old)
+                            del self.games[old.key]
+                        if game.key is None or game.key in self.games:
+                            # بلا مفتاح، أو مفتاح مستخدم (ساعة رجعت للخلف): مفتاح جديد
+                            game.key = old.key if old is not None and game.key is None else next_key()
+                            rekeyed.append(game)
+                        else:
+                            observe_key(game.key)
+                        self.games[game.key] = game
+                        self._ids[game.id] = game.key
+                        self._index_game(game)
+                        loaded.append(game)
+                yield loaded
         except Exception as e:
             print(f"خطأ في تحميل الألعاب: {e}")
+            return
+        self._loaded = True
+        if rekeyed:
+            self._persist([("update", game.to_dict()) for game in rekeyed])
+    
+    def _secondary_keys(self, game):
+        """مفاتيح اللعبة في الفهارس الثانوية"""
+        return (
+            (self._by_name_path, (game.name, game.path)),
+            (self._by_name, normalize(game.name)),
+            (self._by_genre, game.genre),
+            (self._by_path, game.path),
+        )
+    
+    def _key(self, game_id):
+        """مفتاح اللعبة من مفتاحها الصحيح أو من معرفها النصي (للتوافق)"""
+        return self._ids.get(game_id) if isinstance(game_id, str) else game_id
+    
+    def _index_game(self, game):
+        """إضافة لعبة لفهرس البحث (أو تحديث بياناتها فيه) وللفهارس الثانوية والإحصائيات"""
+        self._search_index.add(game.key, game.name, game.genre, game.description, game.last_played_ts)
+        for index, key in self._secondary_keys(game):
+            index.setdefault(key, {})[game.key] = None
+        self._stats.add(game)
+        for view in self._views.values():
+            view.add(game.key, game)
+    
+    def _drop_secondary(self, game, forget=False):
+        """حذف لعبة من الفهارس الثانوية والإحصائيات (قبل تغيير حقولها أو حذفها)"""
+        for index, key in self._secondary_keys(game):
+            keys = index.get(key)
+            if keys is not None:
+                keys.pop(game.key, None)
+                if not keys:
+                    del index[key]
+        self._stats.remove(game, forget=forget)
+    
+    def _unindex_game(self, game):
+        """حذف لعبة من جميع الفهارس"""
+        self._search_index.remove(game.key)
+        self._drop_secondary(game, forget=True)
+        for view in self._views.values():
+            view.discard(game.key)
     
+    def _lookup(self, index, key):
+        return [self.games[game_key] for game_key in index.get(key, ())]
+    
+    @metrics.timed("library.save")
     def _save_games(self):
         """حفظ الألعاب في قاعدة البيانات"""
         if self.storage:
             try:
-                games_data = [game.to_dict() for game in self.games.values()]
+                # النسخ تحت القفل فقط؛ الكتابة على القرص خارجه
+                with self.lock:
+                    games_data = [game.to_dict() for game in self.games.values()]
                 self.storage.save_games(games_data)
             except Exception as e:
                 print(f"خطأ في حفظ الألعاب: {e}")
     
-    def add_game(self, name, path, genre="غير محدد", description=""):
+    def _write_changes(self, changes):
+        """
+        كتابة سجلات التغيير: جزئياً إن دعم مدير التخزين apply_changes،
+        وإلا تُعاد كتابة المكتبة كاملة (مع os.replace الذري في DatabaseManager)
+        """
+        if hasattr(self.storage, "apply_changes"):
+            try:
+                self.storage.apply_changes(changes)
+            except Exception as e:
+                print(f"خطأ في حفظ الألعاب: {e}")
+        else:
+            self._save_games()
+    
+    def _persist(self, changes):
+        """
+        حفظ تغييرات محددة في قاعدة البيانات
+        
+        إذا دعم مدير التخزين السجلات الجزئية (apply_changes) تُكتب التغييرات فقط،
+        وإلا تُعاد كتابة المكتبة كاملة. مع الحفظ المؤجل تُسلَّم التغييرات للخيط
+        الخلفي وتعود الدالة فوراً.
+        
+        Args:
+            changes: قائمة سجلات (العملية، الحمولة) مثل ("update", game.to_dict())
+        """
+        if not self.storage:
+            return
+        if self._batch_depth:
+            self._pending_changes.extend(changes)
+            return
+        if self._writer is not None:
+            self._writer.submit(changes)
+        else:
+            self._write_changes(changes)
+    
+    def flush(self):
+        """كتابة كل التعديلات المعلّقة على القرص الآن (تنتظر انتهاء الكتابة)"""
+        if self._writer is not None:
+            self._writer.flush()
+    
+    @contextmanager
+    def batch(self):
+        """
+        دفعة تعديلات: تؤجل الحفظ حتى نهاية الدفعة ثم تحفظ كل التغييرات مرة واحدة
+        
+        إذا خرج استثناء من الدفعة يُتراجع عن تعديلاتها في الذاكرة ولا يُحفظ منها شيء
+        (الدفعة الداخلية تتراجع عن تعديلاتها فقط)، ثم يُعاد رفع الاستثناء.
+        
+        مثال:
+            with library.batch():
+                library.add_game(...)
+                library.remove_game(...)
+        """
+        with self.lock:
+            self._batch_depth += 1
+            # كل تعديل يسجل تغييراً واحداً ودالة تراجع واحدة
+            changes_mark = len(self._pending_changes)
+            undo_mark = len(self._undo)
+            try:
+                yield self
+            except BaseException:
+                while len(self._undo) > undo_mark:
+                    self._undo.pop()()
+                del self._pending_changes[changes_mark:]
+                raise
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._undo = []
+                    if self._pending_changes:
+                        changes, self._pending_changes = self._pending_changes, []
+                        self._persist(changes)
+    
+    def _remember(self, undo):
+        """تسجيل دالة تراجع لتعديل داخل دفعة"""
+        if self._batch_depth:
+            self._undo.append(undo)
+    
+    def _restore_game(self, game, state):
+        """إعادة حقول لعبة لحالة محفوظة (للتراجع) مع تحديث الفهارس"""
+        self._drop_secondary(game)
+        for slot, value in zip(Game.__slots__, state):
+            setattr(game, slot, value)
+        self._index_game(game)
+    
+    def _state(self, game):
+        """حقول اللعبة الحالية (لإعادتها عند التراجع)"""
+        return tuple(getattr(game, slot) for slot in Game.__slots__)
+    
+    def _attach(self, game):
+        """إضافة كائن لعبة للمكتبة والفهارس"""
+        self.games[game.key] = game
+        self._ids[game.id] = game.key
+        self._index_game(game)
+    
+    def _detach(self, game):
+        """إزالة كائن لعبة من المكتبة والفهارس"""
+        del self.games[game.key]
+        del self._ids[game.id]
+        self._unindex_game(game)
+    
+    def _validate_new_game(self, name, path):
+        """التحقق من مدخلات لعبة جديدة. يعيد نص الخطأ أو None"""
+        if not name or not name.strip():
+            return "خطأ: اسم اللعبة فارغ"
+        if not path or not path.strip():
+            return "خطأ: مسار اللعبة فارغ"
+        return None
+    
+    def _insert_game(self, name, path, genre, description):
+        """إنشاء لعبة وإضافتها للمكتبة والفهارس وتسجيل التغيير (دون طباعة)"""
+        new_game = Game(name, path, genre, description)
+        self._attach(new_game)
+        self._remember(lambda: self._detach(new_game))
+        self._persist([("insert", new_game.to_dict())])
+        return new_game
+    
+    def _delete_game(self, game_id):
+        """حذف لعبة من المكتبة والفهارس وتسجيل التغيير. يعيد اللعبة المحذوفة أو None"""
+        game = self.games.get(self._key(game_id))
+        if game is not None:
+            self._detach(game)
+            self._remember(lambda: self._attach(game))
+            # التخزين يبقى مفهرساً بالمعرف النصي
+            self._persist([("delete", game.id)])
+        return game
+    
+    def _modify_game(self, game_id, fields):
+        """تحديث الحقول المسموح بها للعبة وتسجيل التغيير. يعيد اللعبة أو None"""
+        game = self.games.get(self._key(game_id))
+        if game is None:
+            return None
+        state = self._state(game)
+        self._remember(lambda: self._restore_game(game, state))
+        self._drop_secondary(game)
+        
+        # تحديث الحقول المسموح بها
+        allowed_fields = ['name', 'path', 'genre', 'description']
+        for field, value in fields.items():
+            if field in allowed_fields:
+                setattr(game, field, value)
+        self._index_game(game)
+        
+        self._persist([("update", game.to_dict())])
+        return game
+    
+    def _record_play(self, game, duration_minutes=0, new_session=True):
+        """تحديث إحصائيات لعب لعبة مع الحفاظ على المجاميع الجارية"""
+        state = self._state(game)
+        self._remember(lambda: self._restore_game(game, state))
+        self._drop_secondary(game)
+        game.update_play_stats(duration_minutes, new_session)
+        self._index_game(game)
+        self._persist([("update", game.to_dict())])
+    
+    def add_game(self, name, path, genre=DEFAULT_GENRE, description=""):
         """
         إضافة لعبة جديدة للمكتبة
         
@@ -122,35 +491,87 @@ class GameLibrary:
             Game: كائن اللعبة المضافة أو None في حالة الفشل
         """
         # التحقق من صحة المدخلات
-        if not name or not name.strip():
-            print("خطأ: اسم اللعبة فارغ")
-            return None
-        
-        if not path or not path.strip():
-            print("خطأ: مسار اللعبة فارغ")
+        error = self._validate_new_game(name, path)
+        if error:
+            print(error)
             return None
         
-        # التحقق من وجود المسار
-        if not os.path.exists(path):
+        # وجود المسار من ذاكرة صحة المسارات فقط (لا انتظار للقرص في مسار النقر):
+        # مسار لم يُفحص بعد يُجدول فحصه في الخلفية، ونتيجته تصل للبطاقة عبر مستمعي صحة المسارات
+        if self.path_health.status(path) == MISSING:
             print(f"تحذير: المسار غير موجود: {path}")
             # يمكن الاستمرار لكن يجب إعلام المستخدم
         
-        # التحقق من عدم تكرار اللعبة
-        for game in self.games.values():
-            if game.name == name and game.path == path:
+        with self.lock:
+            # التحقق من عدم تكرار اللعبة
+            if (name, path) in self._by_name_path:
                 print(f"اللعبة '{name}' موجودة بالفعل")
                 return None
-        
-        # إنشاء اللعبة الجديدة
-        new_game = Game(name, path, genre, description)
-        self.games[new_game.id] = new_game
-        
-        # حفظ التغييرات
-        self._save_games()
+            
+            # إنشاء اللعبة الجديدة وحفظ التغييرات
+            new_game = self._insert_game(name, path, genre, description)
         
         print(f"تمت إضافة اللعبة: {name}")
         return new_game
     
+    def add_games_bulk(self, items, check_paths=True, max_workers=None):
+        """
+        إضافة مجموعة ألعاب دفعة واحدة مع حفظ واحد في النهاية
+        
+        لا يطبع شيئاً؛ نتيجة كل عنصر تُعاد في قائمة بنفس ترتيب المدخلات.
+        
+        Args:
+            items: قواميس تحتوي name و path و genre و description (الأخيران اختياريان)
+            check_paths: التحقق من وجود المسارات (بالتوازي)
+            max_workers: عدد الخيوط لفحص المسارات (None: خيوط خدمة صحة المسارات)
+        
+        Returns:
+            list: قواميس نتائج {'name', 'path', 'status', 'game', 'path_exists', 'error'}
+                  حيث status إحدى: 'added' أو 'duplicate' أو 'invalid'
+        """
+        items = list(items)
+        
+        # فحص المسارات بالتوازي (قد تكون على أقراص شبكية أو نائمة)
+        # قبل أخذ القفل، فلا تنتظر القراءات من الواجهة انتهاء الفحص
+        exists = {}
+        if check_paths:
+            paths = list({item.get('path') for item in items if item.get('path')})
+            if paths and max_workers is not None:
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    exists = dict(zip(paths, pool.map(os.path.exists, paths)))
+                self.path_health.update(exists)
+            elif paths:
+                exists = self.path_health.exists_many(paths)
+        
+        results = []
+        # الدفعة تأخذ قفل المكتبة حتى نهاية الإضافة
+        with self.batch():
+            for item in items:
+                name = item.get('name')
+                path = item.get('path')
+                result = {
+                    'name': name,
+                    'path': path,
+                    'status': 'invalid',
+                    'game': None,
+                    'path_exists': exists.get(path) if check_paths else None,
+                    'error': self._validate_new_game(name, path),
+                }
+                if result['error'] is None:
+                    if (name, path) in self._by_name_path:
+                        result['status'] = 'duplicate'
+                        result['error'] = f"اللعبة '{name}' موجودة بالفعل"
+                    else:
+                        result['game'] = self._insert_game(
+                            name, path,
+                            item.get('genre', DEFAULT_GENRE),
+                            item.get('description', '')
+                        )
+                        result['status'] = 'added'
+                results.append(result)
+        return results
+    
+    @_synchronized
     def remove_game(self, game_id):
         """
         حذف لعبة من المكتبة
@@ -161,57 +582,127 @@ class GameLibrary:
         Returns:
             bool: True إذا تم الحذف بنجاح، False خلاف ذلك
         """
-        if game_id in self.games:
-            game_name = self.games[game_id].name
-            del self.games[game_id]
-            self._save_games()
-            print(f"تم حذف اللعبة: {game_name}")
+        game = self._delete_game(game_id)
+        if game is not None:
+            print(f"تم حذف اللعبة: {game.name}")
             return True
         else:
             print(f"خطأ: اللعبة غير موجودة (ID: {game_id})")
             return False
     
+    @_synchronized
+    def remove_games_bulk(self, game_ids):
+        """
+        حذف مجموعة ألعاب مع حفظ واحد في النهاية (دون طباعة)
+        
+        Args:
+            game_ids: معرفات الألعاب المراد حذفها
+        
+        Returns:
+            dict: {game_id: True إذا حُذفت، False إذا لم توجد}
+        """
+        with self.batch():
+            return {game_id: self._delete_game(game_id) is not None for game_id in game_ids}
+    
+    @_synchronized
     def get_game(self, game_id):
         """
         الحصول على لعبة معينة
         
         Args:
-            game_id: معرف اللعبة
+            game_id: مفتاح اللعبة (game.key) أو معرفها النصي (game.id)
         
         Returns:
             Game: كائن اللعبة أو None إذا لم يتم العثور عليها
         """
-        return self.games.get(game_id)
+        return self.games.get(self._key(game_id))
     
-    def get_all_games(self):
+    @_synchronized
+    def get_all_games(self, order_by=None, descending=False):
         """
         الحصول على جميع الألعاب
         
+        Args:
+            order_by: حقل الترتيب من SORT_FIELDS (اختياري، الافتراضي ترتيب الإضافة)
+            descending: ترتيب تنازلي
+        
         Returns:
             list: قائمة بجميع الألعاب
         """
-        return list(self.games.values())
+        if order_by is None:
+            return list(self.games.values())
+        view = self.view(order_by)
+        return [self.games[game_key] for game_key in view.page_after(None, len(view), descending)]
+    
+    def view(self, order_by):
+        """
+        العرض المرتب لحقل (يُبنى مرة واحدة ثم يُحدَّث مع كل تعديل بتكلفة O(log n))
+        
+        Args:
+            order_by: حقل الترتيب من SORT_FIELDS
+        
+        Returns:
+            SortedView: معرفات الألعاب (game.key) مرتبة تصاعدياً
+        """
+        view = self._views.get(order_by)
+        if view is None:
+            if order_by not in SORT_FIELDS:
+                raise ValueError(f"حقل ترتيب غير مدعوم: {order_by}")
+            with self.lock:
+                view = self._views.get(order_by)
+                if view is None:
+                    view = SortedView(SORT_FIELDS[order_by])
+                    view.update(self.games.items())
+                    self._views[order_by] = view
+        return view
     
-    def search_games(self, keyword):
+    @_synchronized
+    def page_after(self, order_by, after=None, limit=50, descending=False):
+        """
+        صفحة من الألعاب المرتبة تبدأ بعد لعبة معينة (تصفح بالمؤشر دون offset)
+        
+        Args:
+            order_by: حقل الترتيب من SORT_FIELDS
+            after: مفتاح آخر لعبة في الصفحة السابقة، أو مؤشرها من view(order_by).cursor()،
+                   أو None للصفحة الأولى
+            limit: عدد الألعاب في الصفحة
+            descending: ترتيب تنازلي
+        
+        Returns:
+            list: ألعاب الصفحة بالترتيب
+        """
+        view = self.view(order_by)
+        return [self.games[game_key] for game_key in view.page_after(after, limit, descending)]
+    
+    @metrics.timed("library.search")
+    def search_games(self, keyword, fuzzy=True, within=None, prefix_only=False):
         """
         البحث عن ألعاب باستخدام كلمة مفتاحية
         
+        يستخدم فهرس البحث: يتجاهل التشكيل ويوحد أشكال الألف والياء والتاء المربوطة،
+        ويتحمل الأخطاء الإملائية وكتابة الاسم بالعربية أو اللاتينية ("سايبربنك" تجد Cyberpunk).
+        النتائج مرتبة حسب جودة المطابقة (الاسم أولاً ثم النوع ثم الوصف) ثم حداثة آخر تشغيل.
+        
         Args:
             keyword: الكلمة المفتاحية للبحث
+            fuzzy: False للمطابقة الحرفية فقط
+            within: مفاتيح ألعاب يُبحث بينها فقط (نتائج استعلام سابق يضيّقه هذا الاستعلام)
+            prefix_only: الاستعلامات الأقصر من 3 أحرف تُطابق بدايات الكلمات فقط (البحث
+                         أثناء الكتابة)؛ افتراضياً تُطابق أي جزء من النص
         
         Returns:
             list: قائمة الألعاب المطابقة
         """
-        keyword = keyword.lower()
-        results = []
-        
-        for game in self.games.values():
-            if (keyword in game.name.lower() or 
-                keyword in game.genre.lower() or 
-                keyword in game.description.lower()):
-                results.append(game)
-        
-        return results
+        # المطابقة الحرفية تُمرر لقاعدة البيانات (LIKE) قبل اكتمال التحميل؛
+        # البحث التقريبي وترتيبه يحتاجان فهرس الذاكرة
+        if (not fuzzy and not prefix_only and within is None and keyword
+                and self._storage_answers("query_games")):
+            rows = self._query_storage("query_games", keyword=keyword)
+            if rows is not None:
+                return self._from_rows(rows)
+        with self.lock:
+            keys = self._search_index.search(keyword, fuzzy, within, prefix_only)
+            return [self.games[game_key] for game_key in keys]
     
     def filter_by_genre(self, genre):
         """
@@ -223,8 +714,136 @@ class GameLibrary:
         Returns:
             list: قائمة الألعاب من النوع المحدد
         """
-        return [game for game in self.games.values() if game.genre == genre]
+        if self._storage_answers("query_games"):
+            rows = self._query_storage("query_games", genre=genre)
+            if rows is not None:
+                return self._from_rows(rows)
+        with self.lock:
+            return self._lookup(self._by_genre, genre)
     
+    @_synchronized
+    def find_by_path(self, path):
+        """
+        البحث عن الألعاب حسب مسار الملف التنفيذي
+        
+        Args:
+            path: مسار ملف اللعبة
+        
+        Returns:
+            list: الألعاب التي تستخدم هذا المسار
+        """
+        return self._lookup(self._by_path, path)
+    
+    @_synchronized
+    def find_by_name(self, name):
+        """
+        البحث عن الألعاب بالاسم (دون تمييز حالة الأحرف أو التشكيل)
+        
+        Args:
+            name: اسم اللعبة
+        
+        Returns:
+            list: الألعاب التي تحمل هذا الاسم
+        """
+        return self._lookup(self._by_name, normalize(name))
+    
+    @_synchronized
+    def has_game(self, name, path):
+        """هل توجد لعبة بنفس الاسم والمسار"""
+        return (name, path) in self._by_name_path
+    
+    @_synchronized
+    def has_path(self, path):
+        """هل توجد لعبة بهذا المسار (O(1) عبر فهرس المسارات)"""
+        return path in self._by_path
+    
+    @_synchronized
+    def known_paths(self):
+        """كل مسارات الألعاب في المكتبة (دون تكرار)"""
+        return list(self._by_path)
+    
+    def _storage_answers(self, method):
+        """
+        هل تُجاب القراءة من قاعدة البيانات بدلاً من الذاكرة؟
+        فقط قبل اكتمال التحميل (مكتبة بلا autoload أو أثناء iter_load): بعده الفهارس
+        والإحصائيات الجارية في الذاكرة مكتملة وأسرع وتشمل التعديلات غير المكتوبة بعد
+        """
+        return not self._loaded and self.storage is not None and hasattr(self.storage, method)
+    
+    def _query_storage(self, method, **kwargs):
+        """
+        تنفيذ استعلام في قاعدة البيانات بعد كتابة التعديلات المعلّقة
+        
+        Returns:
+            نتيجة الاستعلام، أو None عند الفشل فيُجاب من الذاكرة
+        """
+        # خارج القفل: خيط الحفظ قد يحتاج القفل لإكمال الكتابة
+        self.flush()
+        try:
+            return getattr(self.storage, method)(**kwargs)
+        except ValueError:
+            raise
+        except Exception as e:
+            print(f"خطأ في الاستعلام من قاعدة البيانات: {e}")
+            return None
+    
+    def _from_rows(self, rows):
+        """تحويل صفوف قاعدة البيانات لكائنات الألعاب (المحملة منها تُعاد كما هي)"""
+        with self.lock:
+            return [self.games.get(self._ids.get(row['id'])) or Game.from_dict(row) for row in rows]
+    
+    def query_games(self, keyword=None, genre=None, order_by=None, descending=False,
+                    limit=None, offset=0):
+        """
+        فلترة وترتيب الألعاب مع تمرير الاستعلام إلى قاعدة البيانات إن دعمته
+        
+        Args:
+            keyword: كلمة مفتاحية للبحث (اختياري)
+            genre: نوع اللعبة (اختياري)
+            order_by: اسم الحقل للترتيب (اختياري)
+            descending: ترتيب تنازلي
+            limit: الحد الأقصى لعدد النتائج (اختياري)
+            offset: عدد النتائج المتخطاة
+        
+        Returns:
+            list: قائمة الألعاب المطابقة
+        """
+        if self.storage and hasattr(self.storage, "query_games"):
+            rows = self._query_storage("query_games", keyword=keyword, genre=genre, order_by=order_by,
+                                       descending=descending, limit=limit, offset=offset)
+            if rows is not None:
+                return self._from_rows(rows)
+        with self.lock:
+            return self._query_games(keyword, genre, order_by, descending, limit, offset)
+    
+    def _query_games(self, keyword, genre, order_by, descending, limit, offset):
+        if not keyword and order_by in SORT_FIELDS:
+            # العرض المرتب يعطي الصفحة مباشرة دون ترتيب كل الألعاب
+            # (ترتيب الأسماء هنا حسب مفتاح الترتيب العربي وليس ترتيب SQLite الثنائي)
+            view = self.view(order_by)
+            if genre is None:
+                if limit is None:
+                    limit = len(view)
+                keys = view.page_after(None, offset + limit, descending)[offset:]
+            else:
+                # ألعاب النوع من فهرسه ثم ترتيبها بمفاتيحها المحسوبة مسبقاً
+                keys = sorted(self._by_genre.get(genre, ()), key=view.cursor, reverse=descending)
+                keys = keys[offset:] if limit is None else keys[offset:offset + limit]
+            return [self.games[game_key] for game_key in keys]
+        
+        # مطابقة حرفية كما في LIKE عند تمرير الاستعلام لقاعدة البيانات
+        results = self.search_games(keyword, fuzzy=False) if keyword else self.get_all_games()
+        if genre is not None:
+            results = [game for game in results if game.genre == genre]
+        if order_by is not None:
+            # القيم الفارغة (مثل last_played) تأتي أولاً تصاعدياً كما في SQLite
+            results.sort(key=lambda g: (getattr(g, order_by) is not None, getattr(g, order_by) or 0),
+                         reverse=descending)
+        if limit is not None:
+            return results[offset:offset + limit]
+        return results[offset:]
+    
+    @_synchronized
     def update_game(self, game_id, **kwargs):
         """
         تحديث معلومات لعبة
@@ -236,26 +855,39 @@ class GameLibrary:
         Returns:
             bool: True إذا تم التحديث بنجاح
         """
-        if game_id not in self.games:
+        game = self._modify_game(game_id, kwargs)
+        if game is None:
             print(f"خطأ: اللعبة غير موجودة (ID: {game_id})")
             return False
         
-        game = self.games[game_id]
-        
-        # تحديث الحقول المسموح بها
-        allowed_fields = ['name', 'path', 'genre', 'description']
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                setattr(game, field, value)
-        
-        self._save_games()
         print(f"تم تحديث اللعبة: {game.name}")
         return True
     
+    @_synchronized
+    def update_games_bulk(self, updates):
+        """
+        تحديث مجموعة ألعاب مع حفظ واحد في النهاية (دون طباعة)
+        
+        Args:
+            updates: قاموس {game_id: {الحقل: القيمة}}
+        
+        Returns:
+            dict: {game_id: True إذا حُدثت، False إذا لم توجد}
+        """
+        with self.batch():
+            return {
+                game_id: self._modify_game(game_id, fields) is not None
+                for game_id, fields in updates.items()
+            }
+    
+    @metrics.timed("library.launch")
     def launch_game(self, game_id):
         """
         تشغيل لعبة وتحديث إحصائياتها
         
+        يعود فوراً: التشغيل يتم في الخلفية عبر LaunchSupervisor الذي يقيس مدة الجلسة
+        ويسجلها في play_time عند انتهاء العملية.
+        
         Args:
             game_id: معرف اللعبة
         
@@ -267,46 +899,151 @@ class GameLibrary:
             print(f"خطأ: اللعبة غير موجودة (ID: {game_id})")
             return False
         
-        if not os.path.exists(game.path):
+        # الحالة من الذاكرة المؤقتة؛ غير المعروفة تُجرب (الفشل يحدّث الحالة في الخلفية)
+        if self.path_health.status(game.path) == MISSING:
             print(f"خطأ: ملف اللعبة غير موجود: {game.path}")
             return False
         
         try:
-            # تحديث إحصائيات اللعب
-            game.update_play_stats()
-            self._save_games()
-            
-            # تشغيل اللعبة
-            import subprocess
-            if os.name == 'nt':  # Windows
-                os.startfile(game.path)
-            else:  # Linux/Mac
-                subprocess.Popen([game.path])
-            
-            print(f"تم تشغيل اللعبة: {game.name}")
+            # التشغيل ومتابعة الجلسة في الخلفية؛ الإحصائيات تُحفظ على دفعات
+            self.launcher.launch(game)
             return True
         except Exception as e:
             print(f"خطأ في تشغيل اللعبة: {e}")
             return False
     
+    @property
+    def launcher(self):
+        """مشرف التشغيل (يُنشأ عند أول تشغيل)"""
+        if self._launcher is None:
+            from .launcher import LaunchSupervisor
+            self._launcher = LaunchSupervisor(self)
+        return self._launcher
+    
+    @property
+    def path_health(self):
+        """خدمة صحة المسارات (تُنشأ عند أول استخدام)"""
+        if self._path_health is None:
+            with self.lock:
+                if self._path_health is None:
+                    self._path_health = PathHealth()
+        return self._path_health
+    
+    def check_paths(self, watch=False):
+        """
+        جدولة فحص ملفات كل الألعاب في الخلفية
+        
+        Args:
+            watch: مراقبة مجلدات الألعاب لتحديث الحالة عند تغيرها
+        """
+        paths = self.known_paths()
+        if watch:
+            self.path_health.watch(paths)
+        else:
+            self.path_health.check(paths)
+    
+    def close(self):
+        """إيقاف الخدمات الخلفية وحفظ ما تبقى من تغييرات"""
+        if self._launcher is not None:
+            self._launcher.shutdown()
+            self._launcher = None
+        if self._path_health is not None:
+            self._path_health.close()
+            self._path_health = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self.storage is not None and hasattr(self.storage, "close"):
+            # بعد كتابة آخر التغييرات: إغلاق اتصال قاعدة البيانات أو ملف السجل
+            self.storage.close()
+    
+    @_synchronized
+    def record_play(self, game_id, duration_minutes=0, new_session=True):
+        """
+        تسجيل جلسة لعب (بدلاً من استدعاء Game.update_play_stats مباشرة)
+        
+        Args:
+            game_id: معرف اللعبة
+            duration_minutes: مدة الجلسة بالدقائق
+            new_session: جلسة جديدة؛ False لإضافة وقت لعب لجلسة سُجلت سابقاً
+        
+        Returns:
+            bool: True إذا وُجدت اللعبة
+        """
+        game = self.get_game(game_id)
+        if not game:
+            return False
+        self._record_play(game, duration_minutes, new_session)
+        return True
+    
     def get_statistics(self):
         """
         الحصول على إحصائيات المكتبة
+        (من قاعدة البيانات قبل اكتمال التحميل، ومن الإحصائيات الجارية بعده)
         
         Returns:
             dict: قاموس يحتوي على الإحصائيات
         """
-        total_games = len(self.games)
-        total_play_time = sum(game.play_time for game in self.games.values())
-        total_plays = sum(game.play_count for game in self.games.values())
-        
-        most_played = None
-        if self.games:
-            most_played = max(self.games.values(), key=lambda g: g.play_count)
+        if self._storage_answers("get_statistics"):
+            stats = self._query_storage("get_statistics")
+            if stats is not None:
+                return stats
+        with self.lock:
+            return self._memory_statistics()
+    
+    def _memory_statistics(self):
+        stats = self._stats
+        top = stats.most_played.top(1)
+        most_played = self.games[top[0][0]] if top else None
         
         return {
-            'total_games': total_games,
-            'total_play_time': total_play_time,
-            'total_plays': total_plays,
+            'total_games': stats.total_games,
+            'total_play_time': stats.total_play_time,
+            'total_plays': stats.total_plays,
             'most_played': most_played.name if most_played else "لا يوجد"
         }
+    
+    def get_most_played(self, limit=10):
+        """
+        الألعاب الأكثر تشغيلاً
+        
+        Args:
+            limit: عدد الألعاب
+        
+        Returns:
+            list: الألعاب مرتبة تنازلياً حسب عدد مرات التشغيل
+        """
+        if self._storage_answers("query_games"):
+            rows = self._query_storage("query_games", order_by="play_count", descending=True, limit=limit)
+            if rows is not None:
+                return self._from_rows(rows)
+        with self.lock:
+            return [self.games[game_key] for game_key, _ in self._stats.most_played.top(limit)]
+    
+    def get_recently_played(self, limit=10):
+        """
+        الألعاب التي شُغلت مؤخراً
+        
+        Args:
+            limit: عدد الألعاب
+        
+        Returns:
+            list: الألعاب مرتبة من الأحدث تشغيلاً
+        """
+        if self._storage_answers("query_games"):
+            # القيم الفارغة تأتي أخيراً تنازلياً، فحذفها يبقي كل الألعاب المُشغلة ضمن الحد
+            rows = self._query_storage("query_games", order_by="last_played", descending=True, limit=limit)
+            if rows is not None:
+                return self._from_rows(row for row in rows if row.get('last_played') is not None)
+        with self.lock:
+            return [self.games[game_key] for game_key, _ in self._stats.recently_played.top(limit)]
+    
+    @_synchronized
+    def get_genre_breakdown(self):
+        """
+        تفصيل الإحصائيات حسب النوع
+        
+        Returns:
+            dict: {genre: {'count': عدد الألعاب, 'play_time': وقت اللعب, 'play_count': مرات التشغيل}}
+        """
+        return {genre: dict(values) for genre, values in self._stats.genres.items()}
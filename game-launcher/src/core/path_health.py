@@ -0,0 +1,269 @@
+# src/core/path_health.py
+# صحة المسارات - معرفة الألعاب المفقودة دون حجب الواجهة
+"""
+Path Health Module
+يتحقق من وجود ملفات الألعاب في الخلفية بدلاً من os.path.exists في مسار النقر:
+- فحوص غير متزامنة بعدد خيوط محدود (الأقراص الشبكية أو النائمة قد تتأخر ثوانٍ)
+- النتائج تُخزن مؤقتاً بمدة صلاحية (TTL): أطول للموجود وأقصر للمفقود
+- status(path) لا تنتظر أبداً: تعيد آخر نتيجة معروفة وتجدول فحصاً إن لزم
+- مراقبة اختيارية للمجلدات عبر watchdog (إن كان مثبتاً) وإلا فحص دوري (polling)
+- المستمعون يُبلَّغون عند تغير حالة أي مسار (من خيط خلفي)
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ..utils import metrics
+
+# حالات المسار
+UNKNOWN = "unknown"
+PRESENT = "present"
+MISSING = "missing"
+
+DEFAULT_TTL = 300.0  # صلاحية نتيجة "موجود" بالثواني
+DEFAULT_MISSING_TTL = 30.0  # صلاحية نتيجة "مفقود" (قد يُوصل القرص لاحقاً)
+DEFAULT_POLL_INTERVAL = 60.0
+
+
+class PathHealth:
+    """
+    خدمة صحة المسارات
+
+    مثال:
+        health = PathHealth()
+        health.add_listener(lambda path, status: print(path, status))
+        health.check(paths)             # جدولة فحص مجموعة مسارات
+        health.status(path)             # UNKNOWN / PRESENT / MISSING دون انتظار
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, missing_ttl=DEFAULT_MISSING_TTL, max_workers=4,
+                 poll_interval=DEFAULT_POLL_INTERVAL):
+        """
+        Args:
+            ttl: صلاحية نتيجة المسار الموجود بالثواني
+            missing_ttl: صلاحية نتيجة المسار المفقود بالثواني
+            max_workers: الحد الأقصى للفحوص المتزامنة
+            poll_interval: فترة الفحص الدوري عند عدم توفر watchdog
+        """
+        self.ttl = ttl
+        self.missing_ttl = missing_ttl
+        self.poll_interval = poll_interval
+        self._entries = {}  # {path: (status, وقت الانتهاء)}
+        self._pending = set()
+        self._listeners = []
+        self._lock = threading.Lock()
+        # خيوط الفحص تُنشأ عند أول فحص فقط (مكتبة لا تفحص مساراتها لا تملك خيوطاً)
+        self._max_workers = max_workers
+        self._pool = None
+        self._closed = False
+        # المراقبة
+        self._watched = set()  # المسارات المراقبة
+        self._observer = None
+        self._watched_dirs = set()
+        self._poller = None
+        self._stop = threading.Event()
+
+    # ========== المستمعون ==========
+    def add_listener(self, callback):
+        """callback(path, status) يُستدعى من خيط خلفي عند تغير الحالة"""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    # ========== القراءة ==========
+    def status(self, path):
+        """
+        آخر حالة معروفة للمسار (لا تنتظر القرص)
+        إذا كانت النتيجة غير معروفة أو منتهية الصلاحية يُجدول فحص في الخلفية.
+        Returns:
+            str: UNKNOWN أو PRESENT أو MISSING
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None:
+            self._schedule(path)
+            return UNKNOWN
+        status, expires = entry
+        if time.monotonic() >= expires:
+            self._schedule(path)
+        return status
+
+    def is_missing(self, path):
+        """True فقط إذا عُرف أن المسار مفقود (غير المعروف يُعامل كموجود)"""
+        return self.status(path) == MISSING
+
+    # ========== الفحص ==========
+    def check(self, paths):
+        """جدولة فحص مجموعة مسارات (تُتجاوز النتائج الصالحة)"""
+        now = time.monotonic()
+        with self._lock:
+            stale = [p for p in paths if p not in self._entries or now >= self._entries[p][1]]
+        for path in stale:
+            self._schedule(path)
+
+    def refresh(self, path):
+        """إعادة فحص مسار حتى لو كانت نتيجته صالحة"""
+        self._schedule(path)
+
+    def update(self, results):
+        """تسجيل نتائج معروفة مسبقاً {path: exists} (مثل فحص add_games_bulk)"""
+        for path, exists in results.items():
+            self._store(path, exists)
+
+    def exists_many(self, paths):
+        """
+        فحص مجموعة مسارات الآن بالتوازي على خيوط الخدمة (ينتظر النتائج)
+        النتائج تُخزن كما في الفحص الخلفي.
+        Returns:
+            dict: {path: exists}
+        """
+        paths = [p for p in dict.fromkeys(paths) if p]
+        pool = None
+        if len(paths) > 1:
+            with self._lock:
+                pool = None if self._closed else self._executor()
+        if pool is None:
+            exists = [os.path.exists(p) for p in paths]
+        else:
+            exists = list(pool.map(os.path.exists, paths))
+        results = dict(zip(paths, exists))
+        self.update(results)
+        return results
+
+    def _executor(self):
+        # يُستدعى مع القفل
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="path-health")
+        return self._pool
+
+    def _schedule(self, path):
+        if not path:
+            return
+        with self._lock:
+            if self._closed or path in self._pending:
+                return
+            self._pending.add(path)
+            self._executor().submit(self._check_one, path)
+
+    def _check_one(self, path):
+        try:
+            with metrics.timer("path_health.check"):
+                exists = os.path.exists(path)
+        except Exception:
+            exists = False
+        with self._lock:
+            self._pending.discard(path)
+        self._store(path, exists)
+
+    def _store(self, path, exists):
+        status = PRESENT if exists else MISSING
+        expires = time.monotonic() + (self.ttl if exists else self.missing_ttl)
+        with self._lock:
+            old = self._entries.get(path)
+            self._entries[path] = (status, expires)
+            listeners = list(self._listeners) if old is None or old[0] != status else ()
+        for callback in listeners:
+            try:
+                callback(path, status)
+            except Exception as e:
+                print(f"خطأ في مستمع صحة المسارات: {e}")
+
+    def forget(self, path):
+        """حذف المسار من الذاكرة المؤقتة والمراقبة"""
+        with self._lock:
+            self._entries.pop(path, None)
+            self._watched.discard(path)
+
+    # ========== المراقبة ==========
+    def watch(self, paths):
+        """
+        مراقبة مسارات: تغير مجلداتها يعيد فحصها فوراً
+        يستخدم watchdog إن كان مثبتاً، وإلا (أو إذا تعذرت مراقبة بعض المجلدات)
+        فحصاً دورياً كل poll_interval ثانية للمسارات منتهية الصلاحية.
+        تسجيل المجلدات يتم في خيط خلفي لأنه يلمس القرص أيضاً.
+        """
+        paths = [p for p in paths if p]
+        with self._lock:
+            if self._closed:
+                return
+            self._watched.update(paths)
+            self._executor().submit(self._start_watching, paths)
+        self.check(paths)
+
+    def _start_watching(self, paths):
+        if not self._start_observer(paths):
+            with self._lock:
+                if self._poller is not None or self._closed:
+                    return
+                self._poller = threading.Thread(target=self._poll_loop, name="path-health-poll", daemon=True)
+            self._poller.start()
+
+    def _start_observer(self, paths):
+        """تسجيل مجلدات المسارات في watchdog؛ False إذا بقيت مسارات بلا مراقبة"""
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            return False
+
+        health = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                for attr in ("src_path", "dest_path"):
+                    changed = getattr(event, attr, None)
+                    if changed and changed in health._watched:
+                        health.refresh(changed)
+
+        with self._lock:
+            if self._closed:
+                return True
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.daemon = True
+                self._observer.start()
+                self._handler = _Handler()
+            observer = self._observer
+            # المجلدات تُحجز مع القفل فلا يسجلها خيطان معاً، وتُحرر إذا تعذرت مراقبتها
+            folders = list({os.path.dirname(p) for p in paths} - self._watched_dirs)
+            self._watched_dirs.update(folders)
+        complete = True
+        for position, folder in enumerate(folders):
+            if not os.path.isdir(folder):
+                # مجلد غير موجود (قرص مفصول مثلاً): يُتابع بالفحص الدوري
+                complete = False
+                with self._lock:
+                    self._watched_dirs.discard(folder)
+                continue
+            try:
+                observer.schedule(self._handler, folder, recursive=False)
+            except Exception as e:
+                # مثل تجاوز حد inotify: البقية تعتمد على الفحص الدوري
+                print(f"تعذرت مراقبة المجلد {folder}: {e}")
+                with self._lock:
+                    self._watched_dirs.difference_update(folders[position:])
+                return False
+        return complete
+
+    def _poll_loop(self):
+        while not self._stop.wait(self.poll_interval):
+            with self._lock:
+                watched = list(self._watched)
+            self.check(watched)
+
+    def close(self):
+        """إيقاف الفحوص والمراقبة"""
+        with self._lock:
+            self._closed = True
+            observer, self._observer = self._observer, None
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+        self._stop.set()
+        if observer is not None:
+            observer.stop()
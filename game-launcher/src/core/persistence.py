@@ -0,0 +1,124 @@
+# src/core/persistence.py
+# الحفظ المؤجل (write-behind) - الكتابة على القرص في خيط خلفي
+"""
+Write-Behind Persistence Module
+يفصل تعديلات المكتبة عن الكتابة على القرص:
+- كل تعديل يُسجل كتغيير معلّق ويعود فوراً (لا ينتظر خيط الواجهة القرص)
+- خيط خلفي يدمج التغييرات المتتالية ويكتبها مرة واحدة بعد مهلة قصيرة
+  أو عند تراكم عدد محدد منها
+- التغييرات على نفس اللعبة تُدمج في سجل واحد (آخر حالة فقط)
+- flush() يكتب كل ما تبقى فوراً، و close() يوقف الخيط بعد الكتابة
+- السجلات التي فشلت كتابتها تبقى معلّقة وتُعاد في المحاولة التالية
+"""
+
+import atexit
+import threading
+import time
+
+from ..utils import metrics
+
+
+def _change_key(change):
+    """مفتاح الدمج: معرف اللعبة التي يخصها السجل"""
+    op, payload = change
+    return payload if op == "delete" else payload['id']
+
+
+class WriteBehind:
+    """
+    كاتب مؤجل يدمج دفعات التغيير
+
+    Args:
+        write: دالة تستقبل قائمة السجلات المدمجة وتكتبها (تُستدعى من الخيط الخلفي)
+        delay: المهلة بالثواني منذ أول تغيير معلّق قبل الكتابة
+        max_pending: عدد السجلات المعلّقة الذي يفرض الكتابة دون انتظار المهلة
+    """
+
+    def __init__(self, write, delay=0.5, max_pending=200):
+        self._write = write
+        self.delay = delay
+        self.max_pending = max_pending
+        self._pending = {}  # {game_id: آخر سجل}
+        self._first_pending = None  # وقت أول تغيير لم يُكتب
+        self._cond = threading.Condition()
+        # قفل الكتابة: flush() من المستدعي والخيط الخلفي لا يكتبان معاً
+        self._write_lock = threading.Lock()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, changes):
+        """تسجيل تغييرات للكتابة لاحقاً (يعود فوراً)"""
+        with self._cond:
+            for change in changes:
+                self._pending[_change_key(change)] = change
+            if self._first_pending is None:
+                self._first_pending = time.monotonic()
+            self._cond.notify()
+
+    @property
+    def pending(self):
+        """عدد السجلات التي لم تُكتب بعد"""
+        with self._cond:
+            return len(self._pending)
+
+    def _take(self):
+        with self._cond:
+            changes = list(self._pending.values())
+            self._pending = {}
+            self._first_pending = None
+            return changes
+
+    def _write_pending(self):
+        with self._write_lock:
+            changes = self._take()
+            if changes:
+                metrics.count("persistence.coalesced_writes")
+                metrics.count("persistence.changes", len(changes))
+                try:
+                    with metrics.timer("persistence.write"):
+                        self._write(changes)
+                except Exception as e:
+                    print(f"خطأ في حفظ الألعاب: {e}")
+                    self._restore(changes)
+
+    def _restore(self, changes):
+        """إعادة سجلات فشلت كتابتها للانتظار، دون استبدال تغييرات أحدث منها"""
+        with self._cond:
+            for change in changes:
+                self._pending.setdefault(_change_key(change), change)
+            if self._first_pending is None:
+                self._first_pending = time.monotonic()
+
+    def flush(self):
+        """كتابة كل التغييرات المعلّقة الآن وانتظار انتهائها"""
+        self._write_pending()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if self._first_pending is not None:
+                        if len(self._pending) >= self.max_pending:
+                            break
+                        remaining = self._first_pending + self.delay - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if self._stopped:
+                    return
+            self._write_pending()
+
+    def close(self):
+        """إيقاف الخيط الخلفي وكتابة ما تبقى"""
+        with self._cond:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+        atexit.unregister(self.close)
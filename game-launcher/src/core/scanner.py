@@ -0,0 +1,397 @@
+# src/core/scanner.py
+# فاحص المكتبة - اكتشاف الألعاب المثبتة تلقائياً
+"""
+Library Scanner Module
+يكتشف الألعاب المثبتة ويضيفها للمكتبة دفعة واحدة:
+- يمر على مجلدات الجذر (مثل D:/Games) بخيوط متوازية عبر os.scandir
+- كل مجلد مباشر تحت الجذر يُعتبر لعبة، ويُختار ملفها التنفيذي الرئيسي بقواعد بسيطة
+- يقرأ ملفات Steam (appmanifest_*.acf) و GOG (goggame-*.info) و Epic (*.item)
+- يتخطى المجلدات التي تحتوي ألعاباً معروفة (فهرس المسارات في المكتبة)
+- الفحص التالي تدريجي: المجلد الذي لم يتغير mtime له لا يُعاد سرده، وشجرته
+  الفرعية كلها تُقرأ من ملف الذاكرة المؤقتة دون stat لكل مجلد فيها
+  (تغيير عميق داخل مجلد لم يتغير يظهر مع scan(full=True))
+"""
+
+import glob
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from ..utils import metrics
+
+# امتدادات الملفات التنفيذية المقبولة
+EXECUTABLE_EXTENSIONS = ('.exe', '.bat', '.cmd', '.lnk', '.url', '.sh', '.x86_64', '.appimage')
+
+# مجلدات لا تحتوي ألعاباً (تُقارن بأحرف صغيرة)
+SKIP_DIRS = frozenset({
+    '$recycle.bin', 'system volume information', '__pycache__', 'node_modules',
+    '_commonredist', 'commonredist', 'redist', 'redistributables', 'directx', 'vcredist',
+    'dotnet', 'support', 'installers', '__installer', 'steamworks shared',
+})
+
+# ملفات تنفيذية ليست اللعبة نفسها
+SKIP_EXECUTABLE = re.compile(
+    r"unins|setup|install|crash|report|redist|dxsetup|prereq|dotnet|update|helper|"
+    r"launcherpatcher|vc_|cleanup|benchmark|config|settings",
+    re.IGNORECASE,
+)
+
+DEFAULT_MAX_DEPTH = 6
+CACHE_VERSION = 1
+
+_VDF_PAIR = re.compile(r'"([^"]+)"\s+"([^"]*)"')
+
+
+def _simple_key(text):
+    """مفتاح مقارنة اسم المجلد باسم الملف: أحرف وأرقام فقط بأحرف صغيرة"""
+    return re.sub(r"[\W_]+", "", text).casefold()
+
+
+def default_store_locations():
+    """
+    مواقع Steam و GOG و Epic الافتراضية الموجودة على هذا الجهاز
+    Returns:
+        dict: {'steam': [...], 'gog': [...], 'epic': [...]}
+    """
+    home = os.path.expanduser("~")
+    if os.name == 'nt':
+        program_files_x86 = os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)")
+        program_data = os.environ.get("ProgramData", r"C:\ProgramData")
+        candidates = {
+            'steam': [os.path.join(program_files_x86, "Steam", "steamapps")],
+            'gog': [os.path.join(program_files_x86, "GOG Galaxy", "Games"), r"C:\GOG Games"],
+            'epic': [os.path.join(program_data, "Epic", "EpicGamesLauncher", "Data", "Manifests")],
+        }
+    else:
+        candidates = {
+            'steam': [os.path.join(home, ".steam", "steam", "steamapps"),
+                      os.path.join(home, ".local", "share", "Steam", "steamapps")],
+            'gog': [os.path.join(home, "GOG Games")],
+            'epic': [],
+        }
+    return {store: [p for p in paths if os.path.isdir(p)] for store, paths in candidates.items()}
+
+
+class ScanResult:
+    """نتيجة فحص: الألعاب المكتشفة ونتائج الإضافة وإحصائيات المرور"""
+
+    def __init__(self):
+        self.candidates = []  # قواميس {'name', 'path', 'source'}
+        self.results = []  # نتائج add_games_bulk
+        self.dirs_listed = 0  # مجلدات سُردت عبر scandir
+        self.dirs_cached = 0  # مجلدات لم تتغير (من الذاكرة المؤقتة)
+        self.dirs_skipped = 0  # مجلدات ألعاب معروفة لم يُمر عليها
+        self.elapsed = 0.0
+
+    @property
+    def added(self):
+        return [r['game'] for r in self.results if r['status'] == 'added']
+
+
+class LibraryScanner:
+    """
+    فاحص مجلدات الألعاب
+
+    مثال:
+        scanner = LibraryScanner(library, roots=["D:/Games"], cache_path="games.db.scan.json")
+        result = scanner.scan()
+        print(len(result.added))
+    """
+
+    def __init__(self, library, roots=(), steam_libraries=(), gog_roots=(), epic_manifest_dirs=(),
+                 cache_path=None, max_workers=8, max_depth=DEFAULT_MAX_DEPTH,
+                 extensions=EXECUTABLE_EXTENSIONS):
+        """
+        Args:
+            library: مكتبة الألعاب (GameLibrary)
+            roots: مجلدات تحتوي مجلداً لكل لعبة
+            steam_libraries: مجلدات steamapps (فيها appmanifest_*.acf و common/)
+            gog_roots: مجلدات ألعاب GOG (كل لعبة فيها goggame-*.info)
+            epic_manifest_dirs: مجلدات ملفات Epic (*.item)
+            cache_path: ملف JSON لحفظ حالة المجلدات بين عمليات الفحص (اختياري)
+            max_workers: عدد خيوط سرد المجلدات
+            max_depth: أقصى عمق للبحث داخل مجلد اللعبة
+            extensions: امتدادات الملفات التنفيذية
+        """
+        self.library = library
+        self.roots = list(roots)
+        self.steam_libraries = list(steam_libraries)
+        self.gog_roots = list(gog_roots)
+        self.epic_manifest_dirs = list(epic_manifest_dirs)
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+        self.extensions = tuple(e.lower() for e in extensions)
+        self._cache = self._load_cache()
+
+    # ========== الذاكرة المؤقتة ==========
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                return data.get('dirs', {})
+        except Exception as e:
+            print(f"تعذر قراءة ذاكرة الفحص المؤقتة: {e}")
+        return {}
+
+    def _save_cache(self, dirs):
+        if not self.cache_path:
+            return
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({'version': CACHE_VERSION, 'dirs': dirs}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"تعذر حفظ ذاكرة الفحص المؤقتة: {e}")
+
+    def _merge_cache(self, visited):
+        """
+        الذاكرة المؤقتة الجديدة: المجلدات التي زيرت الآن مع القديمة التي لم تُزر
+        (مثل مجلدات الألعاب المعروفة)، بعد حذف ما اختفى من المجلدات الأب
+        """
+        merged = dict(self._cache)
+        merged.update(visited)
+        dropped = set()
+        for path in sorted(merged, key=len):
+            if path in visited:
+                continue
+            parent, name = os.path.split(path)
+            if parent in dropped or (parent in visited and name not in visited[parent]['dirs']):
+                dropped.add(path)
+        for path in dropped:
+            del merged[path]
+        return merged
+
+    # ========== سرد المجلدات ==========
+    def _list_dir(self, path, use_cache=True):
+        """
+        محتوى مجلد واحد: الملفات التنفيذية (الاسم، الحجم) والمجلدات الفرعية
+        إذا لم يتغير mtime يُعاد المحتوى من الذاكرة المؤقتة دون scandir
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None, False
+        cached = self._cache.get(path) if use_cache else None
+        if cached is not None and cached['mtime'] == mtime:
+            return cached, True
+        files = []
+        dirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.') and entry.name.lower() not in SKIP_DIRS:
+                                dirs.append(entry.name)
+                        elif entry.name.lower().endswith(self.extensions):
+                            files.append([entry.name, entry.stat().st_size])
+                    except OSError:
+                        continue
+        except OSError:
+            return None, False
+        return {'mtime': mtime, 'files': files, 'dirs': dirs}, False
+
+    def _walk(self, tasks, result, visited, full=False):
+        """
+        سرد متوازٍ لشجرة مجلدات
+        المجلد الذي لم يتغير mtime له تُؤخذ شجرته الفرعية من الذاكرة المؤقتة دون المرور على القرص
+        Args:
+            tasks: ثلاثيات (المسار، العمق المتبقي، المالك) حيث المالك مجلد اللعبة أو None
+            result: ScanResult لتحديث الإحصائيات
+            visited: قاموس {المسار: المحتوى} يُملأ بكل مجلد تمت زيارته
+            full: تجاهل الذاكرة المؤقتة وسرد كل المجلدات
+        Returns:
+            dict: {المالك: [(العمق داخل مجلد اللعبة، المسار، المحتوى)]}
+        """
+        owned = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scan") as pool:
+            running = {pool.submit(self._list_dir, path, not full): (path, depth, owner)
+                       for path, depth, owner in tasks}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, depth, owner = running.pop(future)
+                    listing, from_cache = future.result()
+                    if listing is None:
+                        continue
+                    # (المسار، العمق، المحتوى، من الذاكرة المؤقتة): الشجرة الفرعية لمجلد لم يتغير
+                    stack = [(path, depth, listing, from_cache)]
+                    while stack:
+                        path, depth, listing, from_cache = stack.pop()
+                        visited[path] = listing
+                        if from_cache:
+                            result.dirs_cached += 1
+                        else:
+                            result.dirs_listed += 1
+                        if owner is not None:
+                            owned.setdefault(owner, []).append((self.max_depth - depth, path, listing))
+                        if depth <= 0:
+                            continue
+                        for name in listing['dirs']:
+                            child = os.path.join(path, name)
+                            cached = self._cache.get(child) if from_cache else None
+                            if cached is not None:
+                                stack.append((child, depth - 1, cached, True))
+                            else:
+                                running[pool.submit(self._list_dir, child, not full)] = (child, depth - 1, owner)
+        return owned
+
+    # ========== اختيار الملف التنفيذي ==========
+    @staticmethod
+    def _pick_executable(game_dir, listings):
+        """
+        أفضل ملف تنفيذي داخل مجلد لعبة: اسم يطابق المجلد، ثم الأقل عمقاً، ثم الأكبر حجماً
+        Args:
+            game_dir: مجلد اللعبة
+            listings: (العمق، المسار، المحتوى) لكل مجلد داخله
+        """
+        key = _simple_key(os.path.basename(game_dir))
+        best = None
+        for depth, path, listing in listings:
+            for name, size in listing['files']:
+                stem = os.path.splitext(name)[0]
+                if SKIP_EXECUTABLE.search(stem):
+                    continue
+                score = (0 if key and _simple_key(stem) == key else 1, depth, -size)
+                if best is None or score < best[0]:
+                    best = (score, os.path.join(path, name))
+        return best[1] if best else None
+
+    # ========== مصادر المتاجر ==========
+    def _steam_games(self):
+        """(الاسم، مجلد التثبيت) من ملفات appmanifest_*.acf"""
+        games = []
+        for steamapps in self.steam_libraries:
+            for manifest in glob.glob(os.path.join(steamapps, "appmanifest_*.acf")):
+                try:
+                    with open(manifest, encoding="utf-8", errors="replace") as f:
+                        fields = dict(_VDF_PAIR.findall(f.read()))
+                except OSError:
+                    continue
+                name = fields.get('name')
+                install_dir = fields.get('installdir')
+                if name and install_dir:
+                    games.append((name, os.path.join(steamapps, "common", install_dir)))
+        return games
+
+    def _gog_games(self):
+        """(الاسم، المسار) من ملفات goggame-*.info داخل مجلدات الألعاب"""
+        games = []
+        for root in self.gog_roots:
+            for info in glob.glob(os.path.join(root, "*", "goggame-*.info")):
+                try:
+                    with open(info, encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                tasks = data.get('playTasks') or []
+                primary = next((t for t in tasks if t.get('isPrimary') and t.get('path')), None)
+                if data.get('name') and primary:
+                    games.append((data['name'], os.path.join(os.path.dirname(info), primary['path'])))
+        return games
+
+    def _epic_games(self):
+        """(الاسم، المسار) من ملفات Epic (*.item)"""
+        games = []
+        for folder in self.epic_manifest_dirs:
+            for item in glob.glob(os.path.join(folder, "*.item")):
+                try:
+                    with open(item, encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                name = data.get('DisplayName')
+                location = data.get('InstallLocation')
+                executable = data.get('LaunchExecutable')
+                if name and location and executable:
+                    games.append((name, os.path.join(location, executable)))
+        return games
+
+    # ========== الفحص ==========
+    def _known_dirs(self):
+        """كل المجلدات الأب لمسارات الألعاب الموجودة في المكتبة"""
+        known = set()
+        for path in self.library.known_paths():
+            folder = os.path.dirname(os.path.abspath(path))
+            while folder and folder not in known:
+                known.add(folder)
+                parent = os.path.dirname(folder)
+                if parent == folder:
+                    break
+                folder = parent
+        return known
+
+    @metrics.timed("scanner.scan")
+    def scan(self, dry_run=False, full=False):
+        """
+        فحص كل المصادر وإضافة الألعاب الجديدة للمكتبة
+        Args:
+            dry_run: اكتشاف فقط دون إضافة للمكتبة
+            full: إعادة سرد كل المجلدات حتى التي لم يتغير mtime لها
+        Returns:
+            ScanResult: الألعاب المكتشفة ونتائج الإضافة
+        """
+        started = time.perf_counter()
+        result = ScanResult()
+        known_dirs = self._known_dirs()
+        candidates = {}  # {path: candidate}
+
+        def offer(name, path, source):
+            path = os.path.abspath(path)
+            if path not in candidates and not self.library.has_path(path):
+                candidates[path] = {'name': name, 'path': path, 'source': source}
+
+        # Epic و GOG يحددان الملف التنفيذي مباشرة
+        for name, path in self._epic_games():
+            if os.path.exists(path):
+                offer(name, path, "epic")
+        for name, path in self._gog_games():
+            if os.path.exists(path):
+                offer(name, path, "gog")
+
+        # مجلدات الألعاب التي يجب البحث فيها عن ملف تنفيذي: (المجلد، الاسم، المصدر)
+        game_dirs = [(os.path.abspath(d), name, "steam") for name, d in self._steam_games()]
+        roots = [os.path.abspath(r) for r in self.roots]
+        visited = {}
+        self._walk([(root, 0, None) for root in roots], result, visited, full)
+        for root in roots:
+            listing = visited.get(root)
+            if listing is None:
+                continue
+            for dirname in listing['dirs']:
+                game_dirs.append((os.path.join(root, dirname), dirname, "folder"))
+            # ملفات تنفيذية مباشرة في الجذر: كل ملف لعبة مستقلة
+            for filename, _size in listing['files']:
+                stem = os.path.splitext(filename)[0]
+                if not SKIP_EXECUTABLE.search(stem):
+                    offer(stem, os.path.join(root, filename), "folder")
+
+        pending = []
+        for game_dir, name, source in game_dirs:
+            if game_dir in known_dirs:
+                # اللعبة موجودة في المكتبة: لا حاجة للمرور على ملفاتها
+                result.dirs_skipped += 1
+                continue
+            pending.append((game_dir, name, source))
+        owned = self._walk([(d, self.max_depth, d) for d, _, _ in pending], result, visited, full)
+        for game_dir, name, source in pending:
+            executable = self._pick_executable(game_dir, owned.get(game_dir, ()))
+            if executable:
+                offer(name, executable, source)
+
+        self._cache = self._merge_cache(visited)
+        self._save_cache(self._cache)
+
+        result.candidates = list(candidates.values())
+        if not dry_run and result.candidates:
+            items = [{'name': c['name'], 'path': c['path']} for c in result.candidates]
+            result.results = self.library.add_games_bulk(items, check_paths=False)
+        result.elapsed = time.perf_counter() - started
+        return result
@@ -0,0 +1,445 @@
+# src/core/search.py
+# فهرس البحث - بحث سريع في مكتبة الألعاب مع توحيد النص العربي
+"""
+Search Index Module
+فهرس مقلوب (inverted index) مبني على الثلاثيات الحرفية (trigrams)
+يُحدَّث تدريجياً عند إضافة أو تعديل أو حذف لعبة
+
+البحث التقريبي (fuzzy):
+- هيكل صوتي مشترك للعربية واللاتينية (skeleton): الحروف الساكنة بحروف لاتينية
+  فيصبح "سايبربنك" و "Cyberpunk" كلاهما sbrbnk
+- فهرس ثلاثيات ثانٍ على هياكل الأسماء لاختيار المرشحين دون مقارنة كل الألعاب
+- مسافة تحرير (Levenshtein) محدودة على المرشحين فقط لتحمّل الأخطاء الإملائية
+- ترتيب النتائج حسب جودة المطابقة ثم حداثة آخر تشغيل
+"""
+
+import heapq
+import re
+import time
+
+# نفس نمط إزالة التشكيل في مثال عداد الكلمات (مع التطويل)
+ARABIC_DIACRITICS = re.compile(r"[\u0617-\u061A\u064B-\u0652\u0640]")
+WHITESPACE = re.compile(r"\s+")
+
+# توحيد أشكال الألف والياء والتاء المربوطة
+ARABIC_LETTER_MAP = str.maketrans({
+    "أ": "ا",
+    "إ": "ا",
+    "آ": "ا",
+    "ٱ": "ا",
+    "ى": "ي",
+    "ة": "ه",
+})
+
+# أوزان الحقول في ترتيب النتائج
+FIELD_WEIGHTS = (3, 2, 1)  # name, genre, description
+
+GRAM_SIZE = 3
+
+# ===== الهيكل الصوتي (transliteration skeleton) =====
+# تحويلات لاتينية قبل الجدول: الحروف المركبة و c الناعمة
+LATIN_DIGRAPHS = (("ph", "f"), ("ck", "k"), ("kh", "k"), ("th", "t"), ("gh", "j"), ("ch", "sh"), ("qu", "k"))
+SOFT_C = re.compile(r"c(?=[eiy])")
+# التاء المربوطة (بعد توحيدها إلى ه) في آخر الكلمة تُنطق حركة
+ARABIC_FINAL_HEH = re.compile(r"ه\b")
+SKELETON_MAP = str.maketrans({
+    # حروف العلة تُحذف (العربية تكتبها غالباً حروف مد أو لا تكتبها)
+    "a": None, "e": None, "i": None, "o": None, "u": None, "y": None, "w": None,
+    "ا": None, "و": None, "ي": None, "ء": None, "ئ": None, "ؤ": None, "ع": None,
+    # حروف لاتينية بلا مقابل عربي مباشر
+    "c": "k", "q": "k", "x": "ks", "v": "f", "p": "b", "g": "j",
+    # الحروف العربية بأقرب حرف لاتيني
+    "ب": "b", "ت": "t", "ث": "t", "ج": "j", "ح": "h", "خ": "k", "د": "d", "ذ": "z",
+    "ر": "r", "ز": "z", "س": "s", "ش": "sh", "ص": "s", "ض": "d", "ط": "t", "ظ": "z",
+    "غ": "j", "ف": "f", "ق": "k", "ك": "k", "ل": "l", "م": "m", "ن": "n", "ه": "h",
+    "پ": "b", "گ": "j", "چ": "sh", "ڤ": "f",
+})
+NON_SKELETON = re.compile(r"[^a-z0-9]")
+REPEATED = re.compile(r"(.)\1+")
+
+# ===== البحث التقريبي والترتيب =====
+MIN_FUZZY_LENGTH = 3  # أقصر هيكل يُبحث عنه تقريبياً (بهذا الطول يُطابق بداية الاسم فقط)
+FUZZY_CANDIDATES = 200  # أقصى عدد مرشحين تُحسب لهم مسافة التحرير
+# درجات المطابقة (الاسم الحرفي 3-6، النوع 2، الوصف 1)
+TRANSLIT_SCORE = 2.5  # الهيكل الصوتي للاسم يحتوي الاستعلام
+TYPO_SCORE = 2.0  # ناقص 0.5 لكل تعديل
+# مكافأة الحداثة أقل من أصغر فرق بين درجتين فلا تقلب جودة المطابقة
+RECENCY_WEIGHT = 0.45
+RECENCY_HALF_LIFE_DAYS = 30.0
+
+
+def normalize(text):
+    """
+    توحيد النص للبحث
+
+    - إزالة التشكيل والتطويل
+    - توحيد الألف والياء والتاء المربوطة
+    - توحيد المسافات وتحويل الحروف اللاتينية إلى صغيرة
+    """
+    if not text:
+        return ""
+    text = ARABIC_DIACRITICS.sub("", text)
+    text = text.translate(ARABIC_LETTER_MAP)
+    text = WHITESPACE.sub(" ", text).strip()
+    return text.casefold()
+
+
+def skeleton(text):
+    """
+    الهيكل الصوتي لنص موحد (بعد normalize): حروف ساكنة لاتينية بلا مسافات أو تكرار
+
+    مثال: skeleton(normalize("سايبربنك")) == skeleton(normalize("Cyberpunk")) == "sbrbnk"
+    """
+    if not text:
+        return ""
+    if "ه" in text:
+        text = ARABIC_FINAL_HEH.sub("", text)
+    text = SOFT_C.sub("s", text)
+    for digraph, replacement in LATIN_DIGRAPHS:
+        text = text.replace(digraph, replacement)
+    text = NON_SKELETON.sub("", text.translate(SKELETON_MAP))
+    # دالة بدلاً من القالب r"\1": توسيع القوالب أبطأ بكثير في re
+    return REPEATED.sub(_first_group, text)
+
+
+def _first_group(match):
+    return match.group(1)
+
+
+def substring_distance(pattern, text):
+    """
+    أقل مسافة تحرير (Levenshtein) بين pattern وأي جزء متصل من text
+    (البداية في text مجانية فيُطابق الاستعلام جزءاً من العنوان)
+
+    خوارزمية Myers المتوازية بالبتات: عمود مصفوفة المسافات كله في عددين صحيحين
+    (بت لكل حرف من pattern)، فكل حرف من text بضع عمليات bitwise بدلاً من حلقة على pattern
+    """
+    m = len(pattern)
+    if not m:
+        return 0
+    peq = {}  # {الحرف: بتات مواضعه في pattern}
+    bit = 1
+    for char in pattern:
+        peq[char] = peq.get(char, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    high = bit >> 1
+    pv, mv = mask, 0  # فروق العمود الموجبة والسالبة
+    score = best = m
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+            if score < best:
+                best = score
+        # الإزاحة دون إدخال 1: الصف الأول أصفار (بداية المطابقة مجانية)
+        ph = (ph << 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return best
+
+
+def max_edits(length):
+    """عدد الأخطاء المسموح بها حسب طول الاستعلام"""
+    if length < 4:
+        return 0
+    return 1 if length <= 7 else 2
+
+
+def max_skeleton_edits(length):
+    """عدد الأخطاء المسموح بها في الهيكل (أقصر من النص فيُشدد الحد)"""
+    if length < 5:
+        return 0
+    return 1 if length <= 8 else 2
+
+
+def _grams(text):
+    """الثلاثيات الحرفية لنص موحد"""
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def _word_prefixes(fields):
+    """بدايات كلمات الاسم والنوع الأقصر من ثلاثية (مرشحو الاستعلامات القصيرة)"""
+    return {word[:n] for text in fields[:2] for word in text.split() for n in range(1, GRAM_SIZE)}
+
+
+def narrows(previous, query, prefix_only=False):
+    """
+    هل كل نتيجة لـ query نتيجة أيضاً لـ previous؟ عندها يُبحث عن query داخل نتائج previous فقط
+    (كما يضيّق الاستعلام الأطول نتائج الأقصر في الفلترة الحرفية)
+
+    يتحقق ذلك عندما يحتوي query على previous بنفس نمط المطابقة: أي جزء من النص للاستعلامات
+    القصيرة (أو بدايات الكلمات مع prefix_only كما في search)، ونفس حد الأخطاء ونفس حالة
+    البحث الصوتي للأطول منها.
+    """
+    previous, query = normalize(previous), normalize(query)
+    if not previous or previous not in query:
+        return False
+    if len(query) < GRAM_SIZE:
+        return query.startswith(previous) if prefix_only else True
+    if len(previous) < GRAM_SIZE:
+        return False
+    previous_skel, query_skel = skeleton(previous), skeleton(query)
+    return (
+        previous_skel in query_skel
+        and max_edits(len(previous)) == max_edits(len(query))
+        and max_skeleton_edits(len(previous_skel)) == max_skeleton_edits(len(query_skel))
+        and (len(previous_skel) >= MIN_FUZZY_LENGTH) == (len(query_skel) >= MIN_FUZZY_LENGTH)
+        and (len(previous_skel) > MIN_FUZZY_LENGTH) == (len(query_skel) > MIN_FUZZY_LENGTH)
+    )
+
+
+class SearchIndex:
+    """
+    فهرس بحث تدريجي لمكتبة الألعاب
+
+    - يحتفظ بالنصوص الموحدة لكل لعبة (الاسم، النوع، الوصف)
+    - قوائم ثلاثيات: {trigram: set(doc_id)} لتضييق المرشحين قبل المطابقة
+    - قوائم ثلاثيات للهياكل الصوتية للأسماء (البحث التقريبي وبين العربية واللاتينية)
+    - يرتب النتائج حسب جودة المطابقة (الاسم أولاً) ثم حداثة التشغيل ثم ترتيب الإضافة
+    """
+
+    def __init__(self):
+        self._docs = {}  # {doc_id: (seq, (name, genre, description))}
+        self._postings = {}  # {trigram: set(doc_id)}
+        self._prefixes = {}  # {بداية كلمة من حرف أو حرفين: set(doc_id)}
+        self._skeletons = {}  # {doc_id: هيكل الاسم}
+        self._skeleton_postings = {}  # {trigram: set(doc_id)}
+        self._last_played = {}  # {doc_id: ثوانٍ منذ epoch}
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._docs
+
+    def add(self, doc_id, name, genre="", description="", last_played=None):
+        """
+        إضافة لعبة للفهرس (أو استبدال بياناتها إن كانت موجودة)
+
+        Args:
+            doc_id: معرف اللعبة
+            name: اسم اللعبة
+            genre: نوع اللعبة
+            description: وصف اللعبة
+            last_played: آخر تشغيل بالثواني منذ epoch (لترتيب النتائج)
+        """
+        if last_played is None:
+            self._last_played.pop(doc_id, None)
+        else:
+            self._last_played[doc_id] = last_played
+        fields = (normalize(name), normalize(genre), normalize(description))
+        old = self._docs.get(doc_id)
+        if old is not None:
+            if old[1] == fields:
+                return
+            self._unindex(doc_id, old[1])
+            seq = old[0]
+        else:
+            seq = self._seq
+            self._seq += 1
+        self._docs[doc_id] = (seq, fields)
+        self._post(self._postings, set().union(*(_grams(f) for f in fields)), doc_id)
+        self._post(self._prefixes, _word_prefixes(fields), doc_id)
+        skel = skeleton(fields[0])
+        self._skeletons[doc_id] = skel
+        self._post(self._skeleton_postings, _grams(skel), doc_id)
+
+    def remove(self, doc_id):
+        """حذف لعبة من الفهرس"""
+        old = self._docs.pop(doc_id, None)
+        self._last_played.pop(doc_id, None)
+        if old is not None:
+            self._unindex(doc_id, old[1])
+
+    @staticmethod
+    def _post(postings, grams, doc_id):
+        for gram in grams:
+            ids = postings.get(gram)
+            if ids is None:
+                postings[gram] = {doc_id}
+            else:
+                ids.add(doc_id)
+
+    @staticmethod
+    def _discard(postings, grams, doc_id):
+        for gram in grams:
+            ids = postings.get(gram)
+            if ids is not None:
+                ids.discard(doc_id)
+                if not ids:
+                    del postings[gram]
+
+    def _unindex(self, doc_id, fields):
+        self._discard(self._postings, set().union(*(_grams(f) for f in fields)), doc_id)
+        self._discard(self._prefixes, _word_prefixes(fields), doc_id)
+        self._discard(self._skeleton_postings, _grams(self._skeletons.pop(doc_id, "")), doc_id)
+
+    def clear(self):
+        self._docs.clear()
+        self._postings.clear()
+        self._prefixes.clear()
+        self._skeletons.clear()
+        self._skeleton_postings.clear()
+        self._last_played.clear()
+        self._seq = 0
+
+    def _candidates(self, query, postings_index=None, within=None, literal=False):
+        """
+        المرشحون المحتملون: تقاطع قوائم ثلاثيات الاستعلام
+
+        Args:
+            within: مجموعة معرفات تُقيد المرشحين (نتائج استعلام سابق يضيّقها هذا الاستعلام)
+            literal: الاستعلامات القصيرة تُطابق أي جزء من النص (كل المكتبة مرشحة)
+                     بدلاً من بدايات الكلمات فقط
+        """
+        if len(query) < GRAM_SIZE:
+            # أقصر من ثلاثية: بدايات كلمات الاسم والنوع بدلاً من المرور على كل المكتبة
+            postings = [self._docs.keys() if literal else self._prefixes.get(query, ())]
+        else:
+            index = self._postings if postings_index is None else postings_index
+            postings = []
+            for gram in _grams(query):
+                ids = index.get(gram)
+                if not ids:
+                    return ()
+                postings.append(ids)
+        if within is not None:
+            postings.append(within)
+        if len(postings) == 1:
+            return postings[0]
+        postings.sort(key=len)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+    @staticmethod
+    def _score(query, fields):
+        """درجة المطابقة: أعلى وزن حقل يحتوي الاستعلام، مع مكافأة لبداية الاسم أو تطابقه"""
+        # الحقول بترتيب أوزانها التنازلي: أول حقل يحتوي الاستعلام يحدد الدرجة
+        name_weight, genre_weight, description_weight = FIELD_WEIGHTS
+        name, genre, description = fields
+        if query in name:
+            if name.startswith(query):
+                return name_weight + (2 if name == query else 1)
+            return name_weight
+        if query in genre:
+            return genre_weight
+        if query in description:
+            return description_weight
+        return 0
+
+    @staticmethod
+    def _overlap_candidates(text, edits, postings):
+        """
+        مرشحو البحث التقريبي: المستندات التي تشارك النص أكبر عدد من الثلاثيات
+        (استعلام بـ k أخطاء يحتفظ بـ n - 3k ثلاثية على الأقل من ثلاثياته n)
+        """
+        grams = _grams(text)
+        need = max(1, len(grams) - GRAM_SIZE * edits)
+        counts = {}
+        for gram in grams:
+            for doc_id in postings.get(gram, ()):
+                counts[doc_id] = counts.get(doc_id, 0) + 1
+        if len(counts) > FUZZY_CANDIDATES:
+            best = heapq.nlargest(FUZZY_CANDIDATES, counts.items(), key=lambda item: item[1])
+        else:
+            best = counts.items()
+        return [doc_id for doc_id, count in best if count >= need]
+
+    def _fuzzy_scores(self, query, scores, within=None):
+        """إضافة مطابقات الهيكل الصوتي والأخطاء الإملائية إلى scores"""
+        skel = skeleton(query)
+        if len(skel) < MIN_FUZZY_LENGTH:
+            return
+        skeletons = self._skeletons
+        # نفس الهيكل: كتابة الاسم بحروف أخرى أو خطأ في حروف العلة
+        for doc_id in self._candidates(skel, self._skeleton_postings, within):
+            name_skel = skeletons[doc_id]
+            if name_skel.startswith(skel):
+                score = TRANSLIT_SCORE + 0.5
+            elif len(skel) > MIN_FUZZY_LENGTH and skel in name_skel:
+                score = TRANSLIT_SCORE
+            else:
+                continue
+            if score > scores.get(doc_id, 0):
+                scores[doc_id] = score
+        # أخطاء في الحروف: مسافة تحرير محدودة على مرشحين قليلين، كل نوع بثلاثياته
+        # (النص نفسه لنفس الكتابة، والهيكل بين العربية واللاتينية)
+        docs = self._docs
+        passes = (
+            (query, max_edits(len(query)), self._postings, lambda doc_id: docs[doc_id][1][0]),
+            (skel, max_skeleton_edits(len(skel)), self._skeleton_postings, skeletons.__getitem__),
+        )
+        for pattern, edits, postings, target in passes:
+            if not edits:
+                continue
+            for doc_id in self._overlap_candidates(pattern, edits, postings):
+                if scores.get(doc_id, 0) >= TYPO_SCORE or (within is not None and doc_id not in within):
+                    continue
+                distance = substring_distance(pattern, target(doc_id))
+                if distance <= edits:
+                    score = TYPO_SCORE - 0.5 * distance
+                    if score > scores.get(doc_id, 0):
+                        scores[doc_id] = score
+
+    def _recency_bonus(self, doc_id, now):
+        last_played = self._last_played.get(doc_id)
+        if last_played is None:
+            return 0.0
+        age_days = max(0.0, now - last_played) / 86400.0
+        return RECENCY_WEIGHT / (1.0 + age_days / RECENCY_HALF_LIFE_DAYS)
+
+    def search(self, keyword, fuzzy=True, within=None, prefix_only=False):
+        """
+        البحث في الفهرس
+
+        الاستعلامات الأقصر من ثلاثية أحرف تُطابق أي جزء من النص كما في LIKE (بالمرور على
+        كل المكتبة)، ومع prefix_only تُطابق بدايات كلمات الاسم والنوع فقط عبر فهرسها
+        (البحث أثناء الكتابة في الواجهة).
+
+        Args:
+            keyword: الكلمة المفتاحية
+            fuzzy: إضافة المطابقات التقريبية (الكتابة بالعربية/اللاتينية والأخطاء الإملائية)
+            within: معرفات يُبحث بينها فقط (نتائج استعلام سابق، انظر narrows)
+            prefix_only: الاستعلامات القصيرة تُطابق بدايات الكلمات فقط
+
+        Returns:
+            list: معرفات الألعاب المطابقة مرتبة من الأفضل (جودة المطابقة ثم حداثة التشغيل)
+        """
+        if within is not None and not isinstance(within, (set, frozenset)):
+            within = set(within)
+        query = normalize(keyword)
+        if not query:
+            return list(self._docs) if within is None else [d for d in self._docs if d in within]
+
+        docs = self._docs
+        score_of = self._score
+        scores = {}
+        for doc_id in self._candidates(query, within=within, literal=not prefix_only):
+            score = score_of(query, docs[doc_id][1])
+            if score:
+                scores[doc_id] = score
+        if fuzzy:
+            self._fuzzy_scores(query, scores, within)
+
+        if self._last_played:
+            now = time.time()
+            recency = self._recency_bonus
+            scored = [(-(score + recency(doc_id, now)), docs[doc_id][0], doc_id)
+                      for doc_id, score in scores.items()]
+        else:
+            scored = [(-score, docs[doc_id][0], doc_id) for doc_id, score in scores.items()]
+        scored.sort()
+        return [doc_id for _, _, doc_id in scored]
@@ -0,0 +1,139 @@
+# src/core/stats.py
+# إحصائيات المكتبة - تُحدَّث تدريجياً بدلاً من إعادة الحساب
+"""
+Library Statistics Module
+إحصائيات مكتبة الألعاب محفوظة كمجاميع جارية:
+- المجاميع الكلية (عدد الألعاب، وقت اللعب، مرات التشغيل)
+- تفصيل حسب النوع
+- ترتيب الأكثر لعباً والأحدث تشغيلاً عبر كومة (heap) بحذف كسول
+كل تحديث O(log n) ولا يحتاج أي استعلام للمرور على المكتبة كاملة
+"""
+
+import heapq
+from itertools import count
+
+
+class RankedIndex:
+    """
+    ترتيب تنازلي لمعرفات حسب مفتاح رقمي
+
+    - set/discard: O(log n)
+    - top(n): أعلى n عنصر؛ المدخلات القديمة في الكومة تُهمل عند ظهورها
+    - التعادل يُحسم بترتيب أول إضافة للمعرف
+    """
+
+    def __init__(self):
+        self._keys = {}  # {item_id: key}
+        self._order = {}  # {item_id: ترتيب أول إضافة}
+        self._heap = []  # (-key, order, item_id)
+        self._counter = count()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def set(self, item_id, key):
+        """تعيين مفتاح العنصر (None يحذفه من الترتيب)"""
+        if key is None:
+            self.discard(item_id)
+            return
+        if self._keys.get(item_id) == key:
+            return
+        self._keys[item_id] = key
+        order = self._order.get(item_id)
+        if order is None:
+            order = self._order[item_id] = next(self._counter)
+        heapq.heappush(self._heap, (-key, order, item_id))
+        self._maybe_compact()
+
+    def discard(self, item_id):
+        self._keys.pop(item_id, None)
+
+    def forget(self, item_id):
+        """حذف العنصر نهائياً (بما في ذلك ترتيب إضافته)"""
+        self._keys.pop(item_id, None)
+        self._order.pop(item_id, None)
+
+    def _is_current(self, entry):
+        neg_key, order, item_id = entry
+        return self._keys.get(item_id) == -neg_key and self._order.get(item_id) == order
+
+    def _maybe_compact(self):
+        # إعادة بناء الكومة عندما تتراكم المدخلات القديمة
+        if len(self._heap) > 2 * len(self._keys) + 64:
+            self._heap = [(-key, self._order[item_id], item_id) for item_id, key in self._keys.items()]
+            heapq.heapify(self._heap)
+
+    def top(self, n=1):
+        """
+        لا تعدّل الكومة (آمنة مع القراءة المتزامنة): تمر على الكومة كشجرة بترتيب
+        الأفضل أولاً عبر كومة مساعدة، فتكلفتها O((n + المدخلات القديمة المارة) log n)
+
+        Returns:
+            list: أزواج (item_id, key) مرتبة تنازلياً
+        """
+        heap = self._heap
+        found = []
+        seen = set()
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(found) < n:
+            entry, pos = heapq.heappop(frontier)
+            if entry[2] not in seen and self._is_current(entry):
+                seen.add(entry[2])
+                found.append(entry)
+            for child in (2 * pos + 1, 2 * pos + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return [(item_id, -neg_key) for neg_key, _, item_id in found]
+
+
+class LibraryStats:
+    """
+    مجاميع جارية لمكتبة الألعاب
+
+    تُستدعى add(game) بعد إضافة اللعبة أو تعديلها، و remove(game) قبل تعديلها أو حذفها،
+    بحيث تُطرح القيم القديمة وتُضاف الجديدة.
+    """
+
+    def __init__(self):
+        self.total_games = 0
+        self.total_play_time = 0
+        self.total_plays = 0
+        self.genres = {}  # {genre: {'count', 'play_time', 'play_count'}}
+        self.most_played = RankedIndex()  # حسب play_count
+        self.recently_played = RankedIndex()  # حسب last_played_ts
+
+    def add(self, game):
+        self.total_games += 1
+        self.total_play_time += game.play_time
+        self.total_plays += game.play_count
+        genre = self.genres.get(game.genre)
+        if genre is None:
+            genre = self.genres[game.genre] = {'count': 0, 'play_time': 0, 'play_count': 0}
+        genre['count'] += 1
+        genre['play_time'] += game.play_time
+        genre['play_count'] += game.play_count
+        self.most_played.set(game.key, game.play_count)
+        self.recently_played.set(game.key, game.last_played_ts)
+
+    def remove(self, game, forget=False):
+        """
+        Args:
+            game: اللعبة بقيمها الحالية (قبل التعديل)
+            forget: اللعبة حُذفت نهائياً (وليس مجرد تعديل)
+        """
+        self.total_games -= 1
+        self.total_play_time -= game.play_time
+        self.total_plays -= game.play_count
+        genre = self.genres.get(game.genre)
+        if genre is not None:
+            genre['count'] -= 1
+            genre['play_time'] -= game.play_time
+            genre['play_count'] -= game.play_count
+            if not genre['count']:
+                del self.genres[game.genre]
+        if forget:
+            self.most_played.forget(game.key)
+            self.recently_played.forget(game.key)
+        else:
+            self.most_played.discard(game.key)
+            self.recently_played.discard(game.key)
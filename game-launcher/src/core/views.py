@@ -0,0 +1,256 @@
+# src/core/views.py
+# عروض مرتبة للمكتبة - مفاتيح ترتيب محسوبة مسبقاً وتصفح بالمؤشر
+"""
+Sorted Views Module
+عرض مرتب لكل حقل ترتيب (الاسم، تاريخ الإضافة، آخر تشغيل، مرات التشغيل، وقت اللعب):
+- مفتاح الترتيب يُحسب مرة واحدة عند إضافة اللعبة أو تعديلها وليس عند كل عرض
+- ترتيب الأسماء يراعي العربية: بلا تشكيل أو تطويل، أشكال الألف موحدة، والأرقام بقيمتها
+  ("Game 2" قبل "Game 10" و "لعبة ٣" مثل "لعبة 3")
+- التخزين قائمة مرتبة مقسمة لدلاء صغيرة: البحث O(log n) والإدراج/الحذف يحرك دلواً واحداً
+- page_after(key, n): تصفح بالمؤشر (keyset) يبدأ من آخر لعبة معروضة دون offset
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right, insort
+
+from .search import normalize
+
+# الأرقام العربية الهندية والفارسية تُرتب كأرقام لاتينية
+DIGITS_MAP = str.maketrans("٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹", "01234567890123456789")
+NUMBER = re.compile(r"(\d+)")
+
+BUCKET_SIZE = 512  # يُقسم الدلو عند ضعف هذا الحجم
+
+
+def collation_key(text):
+    """
+    مفتاح ترتيب نص (اسم لعبة)
+
+    Returns:
+        tuple: أجزاء نصية ورقمية متناوبة، تُقارن مباشرة بين أي اسمين
+    """
+    if not text:
+        return ("",)
+    text = normalize(unicodedata.normalize("NFKC", text))
+    if not text.isascii():
+        text = text.translate(DIGITS_MAP)
+    parts = NUMBER.split(text)
+    # الأجزاء الفردية أرقام دائماً فتبقى المقارنة بين نفس الأنواع
+    for i in range(1, len(parts), 2):
+        parts[i] = int(parts[i])
+    return tuple(parts)
+
+
+def _nullable(value):
+    # القيم الفارغة أولاً تصاعدياً (كما في SQLite)
+    return (value is not None, value or 0)
+
+
+# حقول الترتيب المدعومة: اسم الحقل -> دالة مفتاح الترتيب للعبة
+SORT_FIELDS = {
+    'name': lambda game: collation_key(game.name),
+    'genre': lambda game: collation_key(game.genre),
+    'added_date': lambda game: _nullable(game.added_ts),
+    'last_played': lambda game: _nullable(game.last_played_ts),
+    'play_count': lambda game: game.play_count,
+    'play_time': lambda game: game.play_time,
+}
+
+
+class SortedView:
+    """
+    معرفات عناصر مرتبة حسب مفتاح ترتيب محسوب مسبقاً
+
+    كل عنصر مخزن كـ (مفتاح الترتيب, المعرف)، فالتعادل يُحسم بالمعرف
+    (مفاتيح الألعاب متزايدة فيحسم بترتيب الإضافة) ويكون الترتيب كلياً وثابتاً.
+    """
+
+    def __init__(self, sort_key):
+        """
+        Args:
+            sort_key: دالة تعطي مفتاح الترتيب لعنصر
+        """
+        self._sort_key = sort_key
+        self._buckets = []  # قوائم مرتبة من (مفتاح الترتيب, المعرف)
+        self._maxes = []  # آخر مدخل في كل دلو
+        self._entries = {}  # {المعرف: (مفتاح الترتيب, المعرف)}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, item_id):
+        return item_id in self._entries
+
+    def __iter__(self):
+        for bucket in self._buckets:
+            for entry in bucket:
+                yield entry[1]
+
+    def cursor(self, item_id):
+        """
+        مؤشر عنصر (مدخله في الترتيب)؛ يبقى صالحاً لـ page_after حتى بعد حذف العنصر
+
+        Returns:
+            tuple: (مفتاح الترتيب, المعرف) أو None إن لم يكن العنصر في العرض
+        """
+        return self._entries.get(item_id)
+
+    def add(self, item_id, item):
+        """إضافة عنصر أو تحديث موضعه بعد تعديل حقوله"""
+        entry = (self._sort_key(item), item_id)
+        old = self._entries.get(item_id)
+        if old is not None:
+            if old == entry:
+                return
+            self._remove_entry(old)
+        self._entries[item_id] = entry
+        if not self._buckets:
+            self._buckets.append([entry])
+            self._maxes.append(entry)
+            return
+        pos = bisect_left(self._maxes, entry)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._buckets[pos].append(entry)
+            self._maxes[pos] = entry
+        else:
+            insort(self._buckets[pos], entry)
+        if len(self._buckets[pos]) > 2 * BUCKET_SIZE:
+            bucket = self._buckets[pos]
+            self._buckets[pos:pos + 1] = [bucket[:BUCKET_SIZE], bucket[BUCKET_SIZE:]]
+            self._maxes[pos:pos + 1] = [bucket[BUCKET_SIZE - 1], bucket[-1]]
+
+    def update(self, items):
+        """
+        إضافة مجموعة عناصر؛ في عرض فارغ تُرتب مرة واحدة بدلاً من الإدراج واحداً واحداً
+
+        Args:
+            items: أزواج (المعرف, العنصر)
+        """
+        if self._entries:
+            for item_id, item in items:
+                self.add(item_id, item)
+            return
+        sort_key = self._sort_key
+        entries = sorted((sort_key(item), item_id) for item_id, item in items)
+        self._entries = {entry[1]: entry for entry in entries}
+        self._buckets = [entries[i:i + BUCKET_SIZE] for i in range(0, len(entries), BUCKET_SIZE)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+
+    def discard(self, item_id):
+        entry = self._entries.pop(item_id, None)
+        if entry is not None:
+            self._remove_entry(entry)
+
+    def _remove_entry(self, entry):
+        pos = bisect_left(self._maxes, entry)
+        bucket = self._buckets[pos]
+        del bucket[bisect_left(bucket, entry)]
+        if not bucket:
+            del self._buckets[pos]
+            del self._maxes[pos]
+        elif pos < len(self._maxes) and self._maxes[pos] == entry:
+            self._maxes[pos] = bucket[-1]
+
+    def clear(self):
+        self._buckets = []
+        self._maxes = []
+        self._entries = {}
+
+    def index(self, item_id):
+        """
+        موضع عنصر في الترتيب التصاعدي
+
+        Returns:
+            int: الموضع أو -1 إن لم يكن العنصر في العرض
+        """
+        entry = self._entries.get(item_id)
+        if entry is None:
+            return -1
+        pos = bisect_left(self._maxes, entry)
+        before = sum(len(bucket) for bucket in self._buckets[:pos])
+        return before + bisect_left(self._buckets[pos], entry)
+
+    def page_after(self, after=None, n=50, reverse=False):
+        """
+        الصفحة التالية بعد مؤشر (keyset pagination)
+
+        Args:
+            after: معرف آخر عنصر في الصفحة السابقة، أو مؤشره من cursor()، أو None للبداية
+            n: عدد العناصر
+            reverse: التصفح تنازلياً
+
+        Returns:
+            list: معرفات العناصر التالية بالترتيب
+        """
+        if after is None:
+            entry = None
+        elif isinstance(after, tuple):
+            entry = after
+        else:
+            entry = self._entries.get(after)
+            if entry is None:
+                raise KeyError(after)
+        if reverse:
+            return self._page_before(entry, n)
+        result = []
+        if entry is None:
+            pos, start = 0, 0
+        else:
+            pos = bisect_right(self._maxes, entry)
+            start = bisect_right(self._buckets[pos], entry) if pos < len(self._buckets) else 0
+        buckets = self._buckets
+        while pos < len(buckets) and len(result) < n:
+            bucket = buckets[pos]
+            result.extend(item_id for _, item_id in bucket[start:start + n - len(result)])
+            pos += 1
+            start = 0
+        return result
+
+    def _page_before(self, entry, n):
+        result = []
+        buckets = self._buckets
+        if not buckets:
+            return result
+        if entry is None:
+            pos, end = len(buckets) - 1, len(buckets[-1])
+        else:
+            pos = bisect_left(self._maxes, entry)
+            if pos == len(buckets):
+                pos, end = pos - 1, len(buckets[-1])
+            else:
+                end = bisect_left(buckets[pos], entry)
+        while pos >= 0 and len(result) < n:
+            bucket = buckets[pos]
+            start = max(0, end - (n - len(result)))
+            result.extend(item_id for _, item_id in reversed(bucket[start:end]))
+            pos -= 1
+            if pos >= 0:
+                end = len(buckets[pos])
+        return result
+
+    def window(self, start, n, reverse=False):
+        """
+        n عنصراً ابتداءً من الموضع start (للعرض حسب موضع التمرير)
+
+        Returns:
+            list: معرفات العناصر بالترتيب
+        """
+        total = len(self._entries)
+        if reverse:
+            first = max(0, total - start - n)
+            return list(reversed(self._slice(first, total - start)))
+        return self._slice(start, min(total, start + n))
+
+    def _slice(self, start, stop):
+        result = []
+        offset = 0
+        for bucket in self._buckets:
+            size = len(bucket)
+            if offset + size > start:
+                result.extend(item_id for _, item_id in bucket[max(0, start - offset):stop - offset])
+            offset += size
+            if offset >= stop:
+                break
+        return result
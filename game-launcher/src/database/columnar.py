@@ -0,0 +1,435 @@
+# src/database/columnar.py
+# لقطة ثنائية عمودية تُقرأ عبر mmap
+"""
+Columnar Snapshot Module
+صيغة ثنائية بإصدار لحفظ مكتبة الألعاب بديلاً عن pickle:
+- أعمدة ثابتة العرض للحقول الرقمية (التواريخ كثوانٍ منذ epoch، وقت اللعب، مرات التشغيل)
+- جدول نصوص مشترك (الأسماء، المسارات، الأنواع، الأوصاف) تُخزن فيه كل قيمة مرة واحدة
+- فهرس إزاحات لجدول النصوص ولكل قسم في الملف
+
+الملف يُفتح عبر mmap فلا تُقرأ إلا الصفحات المطلوبة، وكل لعبة تُبنى عند طلبها فقط.
+
+التخطيط (little-endian):
+    الرأس: MAGIC, VERSION, عدد الألعاب, عدد النصوص, إزاحات الأقسام
+    أعمدة النصوص: id, name, path, genre, description  (uint32 = رقم النص)
+    الأعمدة الرقمية: added, last_played, play_time, play_count, key  (int64)
+    (الإصدار 1 بلا عمود key ويُقرأ كما هو: المكتبة تمنح مفاتيح عند التحميل)
+    إزاحات النصوص: uint64 × (عدد النصوص + 1) بالبايت، ثم مثلها بالحروف
+    بيانات النصوص: UTF-8 متتالية
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Optional
+
+from ..utils import metrics
+from .storage import DatabaseManager, DEFAULT_CHUNK_SIZE
+
+MAGIC = b"GLCS"
+VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+
+# MAGIC, VERSION, محجوز, عدد الألعاب, عدد النصوص, إزاحة الأعمدة, إزاحة جدول الإزاحات, إزاحة النصوص
+_HEADER = struct.Struct("<4sHHIIQQQ")
+
+STRING_COLUMNS = ('id', 'name', 'path', 'genre', 'description')
+NUMERIC_COLUMNS = ('added_date', 'last_played', 'play_time', 'play_count', 'key')
+DATE_COLUMNS = ('added_date', 'last_played')
+
+# قيمة تمثل None في الأعمدة الرقمية
+NULL = -(2 ** 63)
+
+# صيغة التواريخ النصية في قواميس Game.to_dict (عند الكتابة)
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# أقصى فجوة (بعدد النصوص) بين نصين يُفكان معاً بعملية واحدة في iter_rows
+_RUN_GAP = 64
+
+
+def _date_to_int(value) -> int:
+    if value is None or value == "":
+        return NULL
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(datetime.fromisoformat(value).timestamp())
+    except ValueError:
+        return int(datetime.strptime(value, DATE_FORMAT).timestamp())
+
+
+def _column(typecode: str, values) -> bytes:
+    data = array(typecode, values)
+    if not _LITTLE_ENDIAN:
+        data.byteswap()
+    return data.tobytes()
+
+
+def write_snapshot(path: str, games_data: List[Dict[str, Any]]) -> None:
+    """
+    كتابة قائمة قواميس الألعاب كلقطة عمودية (ملف مؤقت ثم os.replace)
+    Args:
+        path: مسار الملف
+        games_data: قواميس الألعاب بصيغة Game.to_dict
+    """
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(value) -> int:
+        value = "" if value is None else str(value)
+        index = string_ids.get(value)
+        if index is None:
+            index = string_ids[value] = len(strings)
+            strings.append(value)
+        return index
+
+    defaults = {'genre': "غير محدد", 'description': ""}
+    string_columns = [
+        _column("I", [intern(g.get(name, defaults.get(name))) for g in games_data])
+        for name in STRING_COLUMNS
+    ]
+    numeric_columns = [
+        _column("q", [_date_to_int(g.get(name)) for g in games_data])
+        for name in DATE_COLUMNS
+    ] + [
+        _column("q", [int(g.get(name, 0) or 0) for g in games_data])
+        for name in ('play_time', 'play_count')
+    ] + [
+        _column("q", [NULL if g.get('key') is None else g['key'] for g in games_data])
+    ]
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = [0]
+    char_offsets = [0]
+    for text, blob in zip(strings, encoded):
+        offsets.append(offsets[-1] + len(blob))
+        char_offsets.append(char_offsets[-1] + len(text))
+
+    columns_offset = _HEADER.size
+    columns_size = sum(len(c) for c in string_columns + numeric_columns)
+    offsets_offset = columns_offset + columns_size
+    data_offset = offsets_offset + 16 * len(offsets)
+
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, 0, len(games_data), len(strings),
+                                 columns_offset, offsets_offset, data_offset))
+            for column in string_columns + numeric_columns:
+                f.write(column)
+            f.write(_column("Q", offsets))
+            f.write(_column("Q", char_offsets))
+            for blob in encoded:
+                f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        # استبدال آمن (على ويندوز يجب إغلاق أي لقطة مفتوحة على نفس المسار أولاً)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+class ColumnarSnapshot:
+    """
+    قارئ لقطة عمودية عبر mmap
+
+    - len(snapshot): عدد الألعاب دون قراءة أي نص
+    - value(column, row): قيمة واحدة (النصوص تُفك عند طلبها فقط)
+    - row(i) / get(game_id): بناء قاموس لعبة واحدة (التواريخ كثوانٍ منذ epoch)
+    - iter_rows(chunk_size): قواميس على دفعات
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # ملف فارغ لا يمكن ربطه
+            self._file.close()
+            raise ValueError(f"لقطة غير صالحة: {path}")
+        try:
+            magic, version, _, count, string_count, columns_offset, offsets_offset, data_offset = \
+                _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise ValueError(f"ليست لقطة عمودية: {path}")
+            if version not in SUPPORTED_VERSIONS:
+                raise ValueError(f"إصدار لقطة غير مدعوم: {version}")
+        except Exception:
+            self.close()
+            raise
+        self.count = count
+        self.string_count = string_count
+        self._data_offset = data_offset
+        self._view = memoryview(self._mm)
+
+        self._columns = {}
+        position = columns_offset
+        for name in STRING_COLUMNS:
+            self._columns[name] = self._cast(position, "I", count)
+            position += 4 * count
+        for name in NUMERIC_COLUMNS if version > 1 else NUMERIC_COLUMNS[:-1]:
+            self._columns[name] = self._cast(position, "q", count)
+            position += 8 * count
+        # لقطات الإصدار 1: عمود key فارغ
+        self._keys = self._columns.get('key')
+        self._offsets = self._cast(offsets_offset, "Q", string_count + 1)
+        self._char_offsets = self._cast(offsets_offset + 8 * (string_count + 1), "Q", string_count + 1)
+        self._genres: Dict[int, str] = {}
+        self._rows_by_id: Optional[Dict[str, int]] = None
+
+    def _cast(self, offset: int, typecode: str, count: int):
+        raw = self._view[offset:offset + array(typecode).itemsize * count]
+        if _LITTLE_ENDIAN:
+            return raw.cast(typecode)
+        # أجهزة big-endian: نسخة مقلوبة بدلاً من العرض المباشر
+        data = array(typecode, raw.tobytes())
+        data.byteswap()
+        return data
+
+    def __len__(self) -> int:
+        return self.count
+
+    def string(self, index: int) -> str:
+        """فك نص واحد من جدول النصوص"""
+        start = self._data_offset + self._offsets[index]
+        end = self._data_offset + self._offsets[index + 1]
+        return str(self._mm[start:end], "utf-8")
+
+    def _genre(self, index: int) -> str:
+        # الأنواع قليلة ومتكررة: تُفك مرة واحدة وتُشارك بين الألعاب
+        value = self._genres.get(index)
+        if value is None:
+            value = self._genres[index] = self.string(index)
+        return value
+
+    def _slice_strings(self, column, start: int, end: int) -> List[str]:
+        """
+        نصوص عمود لمجال صفوف (دفعة)
+        النصوص المتقاربة في الجدول تُفك بعملية واحدة ثم تُقتطع بإزاحات الحروف؛
+        فلا يُفك إلا ما تشير إليه الدفعة (تقريباً) من صفحات mmap.
+        """
+        indexes = column[start:end]
+        if not indexes:
+            return []
+        offsets = self._offsets
+        chars = self._char_offsets
+        base = self._data_offset
+        first, last = min(indexes), max(indexes)
+        if last - first <= 2 * len(indexes) + _RUN_GAP:
+            # الحالة الشائعة: نصوص الدفعة متجاورة في الجدول (كُتبت بترتيب الصفوف)
+            text = str(self._mm[base + offsets[first]:base + offsets[last + 1]], "utf-8")
+            origin = chars[first]
+            return [text[chars[s] - origin:chars[s + 1] - origin] for s in indexes]
+        # نصوص متباعدة (مثل قيمة مشتركة كُتبت مبكراً): تُجمع في مجموعات متقاربة
+        unique = sorted(set(indexes))
+        decoded: Dict[int, str] = {}
+        count = len(unique)
+        i = 0
+        while i < count:
+            j = i
+            while j + 1 < count and unique[j + 1] - unique[j] <= _RUN_GAP:
+                j += 1
+            first = unique[i]
+            text = str(self._mm[base + offsets[first]:base + offsets[unique[j] + 1]], "utf-8")
+            origin = chars[first]
+            for s in unique[i:j + 1]:
+                decoded[s] = text[chars[s] - origin:chars[s + 1] - origin]
+            i = j + 1
+        return [decoded[s] for s in indexes]
+
+    def column(self, name: str):
+        """عمود كامل كعرض بدون نسخ (أرقام النصوص أو القيم الرقمية)"""
+        return self._columns[name]
+
+    def value(self, name: str, row: int):
+        """قيمة حقل واحد؛ التواريخ كثوانٍ منذ epoch (أو None)"""
+        if name == 'key' and self._keys is None:
+            return None
+        raw = self._columns[name][row]
+        if name in STRING_COLUMNS:
+            return self.string(raw)
+        if name in DATE_COLUMNS or name == 'key':
+            return None if raw == NULL else raw
+        return raw
+
+    def row(self, row: int) -> Dict[str, Any]:
+        """
+        بناء قاموس لعبة واحدة بمفاتيح Game.to_dict
+        التواريخ تبقى أرقاماً (ثوانٍ منذ epoch) فيقرأها Game.from_dict دون تحليل نصوص.
+        """
+        if not 0 <= row < self.count:
+            raise IndexError(row)
+        c = self._columns
+        string = self.string
+        added = c['added_date'][row]
+        last = c['last_played'][row]
+        key = NULL if self._keys is None else self._keys[row]
+        return {
+            'id': string(c['id'][row]),
+            'name': string(c['name'][row]),
+            'path': string(c['path'][row]),
+            'genre': self._genre(c['genre'][row]),
+            'description': string(c['description'][row]),
+            'added_date': None if added == NULL else added,
+            'last_played': None if last == NULL else last,
+            'play_time': c['play_time'][row],
+            'play_count': c['play_count'][row],
+            'key': None if key == NULL else key,
+        }
+
+    def get(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """بحث عن لعبة بالمعرف (الفهرس يُبنى عند أول استدعاء من عمود المعرفات فقط)"""
+        if self._rows_by_id is None:
+            ids = self._columns['id']
+            self._rows_by_id = {self.string(ids[i]): i for i in range(self.count)}
+        row = self._rows_by_id.get(game_id)
+        return None if row is None else self.row(row)
+
+    def iter_rows(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        كل الألعاب على دفعات
+        كل دفعة تفك النصوص التي تشير إليها فقط (من صفحاتها في mmap)، فلا يُنسخ جدول
+        النصوص كاملاً ولا يُفك قبل الدفعة الأولى.
+        """
+        c = self._columns
+        ids, names, paths = c['id'], c['name'], c['path']
+        genres, descriptions = c['genre'], c['description']
+        added_col, last_col = c['added_date'], c['last_played']
+        play_time, play_count = c['play_time'], c['play_count']
+        keys = self._keys
+        genre = self._genre
+        strings = self._slice_strings
+        for start in range(0, self.count, chunk_size):
+            end = min(start + chunk_size, self.count)
+            chunk = []
+            for i, game_id, name, path, description in zip(
+                    range(start, end), strings(ids, start, end), strings(names, start, end),
+                    strings(paths, start, end), strings(descriptions, start, end)):
+                added = added_col[i]
+                last = last_col[i]
+                key = NULL if keys is None else keys[i]
+                chunk.append({
+                    'id': game_id,
+                    'name': name,
+                    'path': path,
+                    'genre': genre(genres[i]),
+                    'description': description,
+                    'added_date': None if added == NULL else added,
+                    'last_played': None if last == NULL else last,
+                    'play_time': play_time[i],
+                    'play_count': play_count[i],
+                    'key': None if key == NULL else key,
+                })
+            yield chunk
+
+    def close(self) -> None:
+        """تحرير الذاكرة المربوطة (العروض المأخوذة من column() تصبح غير صالحة)"""
+        view = getattr(self, "_view", None)
+        if view is not None:
+            for column in self._columns.values():
+                if isinstance(column, memoryview):
+                    column.release()
+            self._keys = None
+            self._offsets = None
+            self._char_offsets = None
+            view.release()
+            self._view = None
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def is_columnar(path: str) -> bool:
+    """هل الملف لقطة عمودية؟"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class ColumnarDatabaseManager:
+    """
+    مدير قاعدة بيانات يحفظ الألعاب كلقطة عمودية
+    - نفس واجهة DatabaseManager (load_games / iter_games / save_games / clear)
+    - open_snapshot() للقراءة الكسولة المباشرة عبر mmap
+    """
+
+    def __init__(self, db_path: str = "games.glcs"):
+        self.db_path = db_path
+        folder = os.path.dirname(self.db_path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+    def open_snapshot(self) -> Optional[ColumnarSnapshot]:
+        """فتح اللقطة للقراءة (أغلقها بعد الانتهاء)، أو None إذا لم يوجد الملف"""
+        if not os.path.exists(self.db_path):
+            return None
+        return ColumnarSnapshot(self.db_path)
+
+    @metrics.timed("storage.save")
+    def save_games(self, games_data: List[Dict[str, Any]]) -> None:
+        """حفظ الألعاب كلقطة جديدة بشكل ذري"""
+        write_snapshot(self.db_path, games_data)
+
+    @metrics.timed("storage.load")
+    def load_games(self) -> List[Dict[str, Any]]:
+        """تحميل جميع الألعاب"""
+        games: List[Dict[str, Any]] = []
+        for chunk in self.iter_games():
+            games.extend(chunk)
+        return games
+
+    def iter_games(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """تحميل الألعاب على دفعات؛ كل دفعة تُبنى من الصفحات التي تخصها فقط"""
+        try:
+            snapshot = self.open_snapshot()
+        except Exception as e:
+            print(f"خطأ في تحميل قاعدة البيانات: {e}")
+            return
+        if snapshot is None:
+            return
+        with snapshot:
+            yield from snapshot.iter_rows(chunk_size)
+
+    def clear(self) -> None:
+        """حذف ملف اللقطة"""
+        try:
+            if os.path.exists(self.db_path):
+                os.remove(self.db_path)
+        except Exception as e:
+            print(f"تعذر حذف قاعدة البيانات: {e}")
+
+
+def convert_pickle_to_columnar(pickle_path: str = "games.db",
+                               columnar_path: str = "games.glcs") -> int:
+    """
+    تحويل ملف games.db (pickle) إلى لقطة عمودية
+    Args:
+        pickle_path: مسار ملف pickle
+        columnar_path: مسار اللقطة الجديدة
+    Returns:
+        int: عدد الألعاب المحوّلة
+    """
+    games_data = DatabaseManager(pickle_path).load_games()
+    write_snapshot(columnar_path, games_data)
+    return len(games_data)
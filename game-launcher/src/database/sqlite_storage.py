@@ -0,0 +1,302 @@
+# src/database/sqlite_storage.py
+# إدارة التخزين باستخدام SQLite
+"""
+SQLite Storage Module
+يدير حفظ واسترجاع بيانات الألعاب في قاعدة SQLite بنفس واجهة DatabaseManager
+مع تعديل لعبة واحدة في كل عملية واستعلامات مفهرسة
+"""
+
+import os
+import sqlite3
+import threading
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from ..utils import metrics
+from .storage import DEFAULT_CHUNK_SIZE, JournaledDatabaseManager
+
+# ترتيب الأعمدة كما في Game.to_dict
+COLUMNS = (
+    'id', 'name', 'path', 'genre', 'description',
+    'added_date', 'last_played', 'play_time', 'play_count', 'key',
+)
+
+# امتدادات قواعد SQLite (المسارات الأخرى ملفات pickle قديمة)
+SQLITE_SUFFIXES = ('.sqlite3', '.sqlite')
+
+# الأعمدة المسموح بالترتيب حسبها (لا تُمرر أسماء أعمدة من المستخدم مباشرة)
+SORTABLE_COLUMNS = (
+    'name', 'genre', 'added_date', 'last_played', 'play_time', 'play_count',
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id          TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    path        TEXT NOT NULL,
+    genre       TEXT NOT NULL DEFAULT 'غير محدد',
+    description TEXT NOT NULL DEFAULT '',
+    added_date  TEXT,
+    last_played TEXT,
+    play_time   INTEGER NOT NULL DEFAULT 0,
+    play_count  INTEGER NOT NULL DEFAULT 0,
+    key         INTEGER
+);
+"""
+
+# تُنشأ بعد ترحيل الجداول القديمة (إضافة عمود key)
+_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_games_key ON games(key);
+CREATE INDEX IF NOT EXISTS idx_games_name ON games(name);
+CREATE INDEX IF NOT EXISTS idx_games_genre ON games(genre);
+CREATE INDEX IF NOT EXISTS idx_games_last_played ON games(last_played);
+CREATE INDEX IF NOT EXISTS idx_games_play_count ON games(play_count);
+"""
+
+# نصوص SQL ثابتة ليعيد sqlite3 استخدام العبارات المُحضّرة من ذاكرته المؤقتة
+_SELECT_ALL = f"SELECT {', '.join(COLUMNS)} FROM games ORDER BY rowid"
+_UPSERT = (
+    f"INSERT INTO games ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in COLUMNS)}) "
+    "ON CONFLICT(id) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in COLUMNS if c != 'id')
+)
+_DELETE = "DELETE FROM games WHERE id = ?"
+_STATS = (
+    "SELECT COUNT(*), COALESCE(SUM(play_time), 0), COALESCE(SUM(play_count), 0) "
+    "FROM games"
+)
+_MOST_PLAYED = "SELECT name FROM games ORDER BY play_count DESC, rowid LIMIT 1"
+
+
+def _row(game: Dict[str, Any]) -> Tuple[Any, ...]:
+    """تحويل قاموس لعبة إلى صف بترتيب COLUMNS"""
+    return (
+        game['id'],
+        game['name'],
+        game['path'],
+        game.get('genre', 'غير محدد'),
+        game.get('description', ''),
+        game.get('added_date'),
+        game.get('last_played'),
+        game.get('play_time', 0),
+        game.get('play_count', 0),
+        game.get('key'),
+    )
+
+
+class SQLiteDatabaseManager:
+    """
+    مدير قاعدة البيانات المبني على SQLite
+    - نفس واجهة DatabaseManager (load_games / save_games / clear)
+    - تعديل لعبة واحدة عبر upsert_game / delete_game / apply_changes
+    - وضع WAL وفهارس على name و genre و last_played و play_count
+    - استعلامات فلترة وترتيب وإحصائيات تُنفذ داخل قاعدة البيانات
+    """
+
+    def __init__(self, db_path: str = "games.sqlite3"):
+        """تهيئة مدير قاعدة البيانات وإنشاء الجداول"""
+        self.db_path = db_path
+        folder = os.path.dirname(self.db_path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._conn.executescript(_INDEXES)
+        self._conn.commit()
+
+    def _migrate(self) -> None:
+        """ترقية الجداول المنشأة قبل المفاتيح الصحيحة (الألعاب القديمة تأخذ مفاتيحها عند التحميل)"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(games)")}
+        if 'key' not in columns:
+            self._conn.execute("ALTER TABLE games ADD COLUMN key INTEGER")
+
+    @staticmethod
+    def _to_dict(row) -> Dict[str, Any]:
+        return dict(zip(COLUMNS, row))
+
+    # ========== واجهة DatabaseManager ==========
+    @metrics.timed("storage.save")
+    def save_games(self, games_data: List[Dict[str, Any]]) -> None:
+        """
+        استبدال محتوى قاعدة البيانات بقائمة الألعاب (في معاملة واحدة)
+        Args:
+            games_data: قائمة قواميس تمثل الألعاب
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM games")
+            self._conn.executemany(_UPSERT, (_row(g) for g in games_data))
+
+    @metrics.timed("storage.load")
+    def load_games(self) -> List[Dict[str, Any]]:
+        """تحميل جميع الألعاب بترتيب الإضافة"""
+        try:
+            with self._lock:
+                rows = self._conn.execute(_SELECT_ALL).fetchall()
+            return [self._to_dict(r) for r in rows]
+        except Exception as e:
+            print(f"خطأ في تحميل قاعدة البيانات: {e}")
+            return []
+
+    def iter_games(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """تحميل الألعاب تدريجياً على دفعات بترتيب الإضافة"""
+        try:
+            with self._lock:
+                cursor = self._conn.execute(_SELECT_ALL)
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield [self._to_dict(r) for r in rows]
+        except Exception as e:
+            print(f"خطأ في تحميل قاعدة البيانات: {e}")
+
+    def clear(self) -> None:
+        """حذف جميع الألعاب"""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM games")
+        except Exception as e:
+            print(f"تعذر حذف قاعدة البيانات: {e}")
+
+    def close(self) -> None:
+        """إغلاق الاتصال"""
+        with self._lock:
+            self._conn.close()
+
+    # ========== تعديل لعبة واحدة ==========
+    def upsert_game(self, game: Dict[str, Any]) -> None:
+        """إضافة لعبة أو تحديثها إن كانت موجودة"""
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT, _row(game))
+
+    def delete_game(self, game_id: str) -> None:
+        """حذف لعبة واحدة"""
+        with self._lock, self._conn:
+            self._conn.execute(_DELETE, (game_id,))
+
+    @metrics.timed("storage.apply_changes")
+    def apply_changes(self, changes: Iterable[Tuple[str, Any]]) -> None:
+        """
+        تطبيق سجلات التغيير في معاملة واحدة
+        Args:
+            changes: سجلات ("insert"|"update", dict) أو ("delete", game_id)
+        """
+        with self._lock, self._conn:
+            for op, payload in changes:
+                if op in ("insert", "update"):
+                    self._conn.execute(_UPSERT, _row(payload))
+                elif op == "delete":
+                    self._conn.execute(_DELETE, (payload,))
+
+    # ========== الاستعلامات ==========
+    @metrics.timed("storage.query")
+    def query_games(self, keyword: Optional[str] = None, genre: Optional[str] = None,
+                    order_by: Optional[str] = None, descending: bool = False,
+                    limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        فلترة وترتيب الألعاب داخل قاعدة البيانات
+        Args:
+            keyword: كلمة بحث في الاسم أو النوع أو الوصف
+            genre: نوع اللعبة (مطابقة تامة)
+            order_by: عمود الترتيب من SORTABLE_COLUMNS
+            descending: ترتيب تنازلي
+            limit: الحد الأقصى لعدد النتائج
+            offset: عدد النتائج المتخطاة
+        Returns:
+            list: قواميس الألعاب المطابقة
+        """
+        where = []
+        params: List[Any] = []
+        if genre is not None:
+            where.append("genre = ?")
+            params.append(genre)
+        if keyword:
+            pattern = "%" + keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            where.append(
+                "(name LIKE ? ESCAPE '\\' OR genre LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')"
+            )
+            params.extend([pattern] * 3)
+
+        sql = f"SELECT {', '.join(COLUMNS)} FROM games"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if order_by is not None:
+            if order_by not in SORTABLE_COLUMNS:
+                raise ValueError(f"عمود ترتيب غير مدعوم: {order_by}")
+            sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, rowid"
+        else:
+            sql += " ORDER BY rowid"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._to_dict(r) for r in rows]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """إحصائيات المكتبة محسوبة داخل قاعدة البيانات"""
+        with self._lock:
+            total_games, total_play_time, total_plays = self._conn.execute(_STATS).fetchone()
+            most_played = self._conn.execute(_MOST_PLAYED).fetchone()
+        return {
+            'total_games': total_games,
+            'total_play_time': total_play_time,
+            'total_plays': total_plays,
+            'most_played': most_played[0] if most_played else "لا يوجد"
+        }
+
+
+def migrate_pickle_to_sqlite(pickle_path: str = "games.db",
+                             sqlite_path: str = "games.sqlite3") -> int:
+    """
+    ترحيل ملف games.db (pickle) إلى قاعدة SQLite لمرة واحدة
+    الملف يُقرأ كما يقرأه مدير السجل الإلحاقي: اللقطة ثم سجلات games.db.journal
+    (و .journal.old)، فلا تضيع التعديلات المسجلة منذ آخر دمج. ملف بلا سجل يُقرأ كما هو.
+    لا يتم الترحيل إذا كانت قاعدة SQLite تحتوي ألعاباً بالفعل.
+    Args:
+        pickle_path: مسار ملف pickle القديم
+        sqlite_path: مسار قاعدة SQLite الجديدة
+    Returns:
+        int: عدد الألعاب المرحّلة
+    """
+    target = SQLiteDatabaseManager(sqlite_path)
+    try:
+        if target.get_statistics()['total_games']:
+            print(f"قاعدة SQLite تحتوي بيانات بالفعل، تم تخطي الترحيل: {sqlite_path}")
+            return 0
+        source = JournaledDatabaseManager(pickle_path, background=False)
+        try:
+            games_data = [game for chunk in source.iter_games() for game in chunk]
+        finally:
+            source.close()
+        target.save_games(games_data)
+        return len(games_data)
+    finally:
+        target.close()
+
+
+def open_sqlite_storage(db_path: str = "games.db") -> SQLiteDatabaseManager:
+    """
+    فتح قاعدة SQLite التي يستخدمها التطبيق لمسار قاعدة بيانات
+    - مسار بامتداد SQLite يُفتح مباشرة
+    - مسار ملف pickle (مثل games.db) تُستخدم بدلاً منه قاعدة بجانبه (games.sqlite3)،
+      ويُرحّل الملف القديم مع سجله الإلحاقي إليها عند أول تشغيل (ويبقى كما هو كنسخة احتياطية)
+    Args:
+        db_path: مسار قاعدة البيانات من سطر الأوامر
+    Returns:
+        SQLiteDatabaseManager: مدير قاعدة البيانات
+    """
+    if db_path.endswith(SQLITE_SUFFIXES):
+        return SQLiteDatabaseManager(db_path)
+    sqlite_path = os.path.splitext(db_path)[0] + SQLITE_SUFFIXES[0]
+    legacy = (db_path, db_path + ".journal", db_path + ".journal.old")
+    if not os.path.exists(sqlite_path) and any(os.path.exists(path) for path in legacy):
+        count = migrate_pickle_to_sqlite(db_path, sqlite_path)
+        print(f"تم ترحيل {count} لعبة من {db_path} إلى {sqlite_path}")
+    return SQLiteDatabaseManager(sqlite_path)
@@ -7,13 +7,21 @@ Storage Module
 
 import os
 import pickle
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from ..utils import metrics
+
+# رأس صيغة الملف المقسّم: يليه عدد من القوائم، كل قائمة دفعة من الألعاب.
+# الملفات القديمة (قائمة واحدة) تبقى مقروءة.
+CHUNKED_HEADER = {'format': 'games-chunked', 'version': 1}
+DEFAULT_CHUNK_SIZE = 1000
 
 
 class DatabaseManager:
     """
     مدير قاعدة البيانات المبني على pickle
-    - يحفظ البيانات في ملف ثنائي
+    - يحفظ البيانات في ملف ثنائي على دفعات (يمكن قراءته تدريجياً)
     - يوفر عمليات التحميل والحفظ بأمان
     """
 
@@ -25,6 +33,7 @@ class DatabaseManager:
         if folder and not os.path.exists(folder):
             os.makedirs(folder, exist_ok=True)
 
+    @metrics.timed("storage.save")
     def save_games(self, games_data: List[Dict[str, Any]]) -> None:
         """
         حفظ قائمة الألعاب إلى الملف
@@ -34,7 +43,10 @@ class DatabaseManager:
         tmp_path = self.db_path + ".tmp"
         try:
             with open(tmp_path, "wb") as f:
-                pickle.dump(games_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(CHUNKED_HEADER, f, protocol=pickle.HIGHEST_PROTOCOL)
+                for start in range(0, len(games_data), DEFAULT_CHUNK_SIZE):
+                    pickle.dump(games_data[start:start + DEFAULT_CHUNK_SIZE], f,
+                                protocol=pickle.HIGHEST_PROTOCOL)
             # استبدال آمن
             os.replace(tmp_path, self.db_path)
         finally:
@@ -45,23 +57,53 @@ class DatabaseManager:
                 except OSError:
                     pass
 
+    @metrics.timed("storage.load")
     def load_games(self) -> List[Dict[str, Any]]:
         """
         تحميل قائمة الألعاب من الملف. يعيد قائمة فارغة إذا لم يوجد الملف.
         """
-        if not os.path.exists(self.db_path):
-            return []
         try:
-            with open(self.db_path, "rb") as f:
-                data = pickle.load(f)
-                # تأكد من أن البيانات قائمة
-                if isinstance(data, list):
-                    return data
-                return []
+            games: List[Dict[str, Any]] = []
+            for chunk in self._read_chunks(DEFAULT_CHUNK_SIZE):
+                games.extend(chunk)
+            return games
         except Exception as e:
             print(f"خطأ في تحميل قاعدة البيانات: {e}")
             return []
 
+    def iter_games(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        تحميل الألعاب تدريجياً على دفعات (مولد)
+        لا يحتفظ في الذاكرة إلا بالدفعة الحالية.
+        Args:
+            chunk_size: الحد الأقصى لعدد الألعاب في كل دفعة
+        """
+        try:
+            yield from self._read_chunks(chunk_size)
+        except Exception as e:
+            print(f"خطأ في تحميل قاعدة البيانات: {e}")
+
+    def _read_chunks(self, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        if not os.path.exists(self.db_path):
+            return
+        with open(self.db_path, "rb") as f:
+            first = pickle.load(f)
+            if isinstance(first, list):
+                # الصيغة القديمة: قائمة واحدة
+                for start in range(0, len(first), chunk_size):
+                    yield first[start:start + chunk_size]
+                return
+            # تأكد من أن البيانات بالصيغة المقسّمة
+            if not isinstance(first, dict) or first.get('format') != CHUNKED_HEADER['format']:
+                return
+            while True:
+                try:
+                    chunk = pickle.load(f)
+                except EOFError:
+                    break
+                for start in range(0, len(chunk), chunk_size):
+                    yield chunk[start:start + chunk_size]
+
     def clear(self) -> None:
         """حذف ملف قاعدة البيانات"""
         try:
@@ -69,3 +111,251 @@ class DatabaseManager:
                 os.remove(self.db_path)
         except Exception as e:
             print(f"تعذر حذف قاعدة البيانات: {e}")
+
+
+# نوع سجل التغيير: (العملية، الحمولة)
+# - ("insert", dict) / ("update", dict): الحمولة قاموس اللعبة كاملاً
+# - ("delete", game_id): الحمولة معرف اللعبة
+Change = Tuple[str, Any]
+
+
+class JournaledDatabaseManager(DatabaseManager):
+    """
+    مدير قاعدة بيانات بسجل إلحاقي (journal)
+    - اللقطة الكاملة تبقى في db_path بنفس صيغة DatabaseManager
+    - كل تعديل يُلحق كسجل insert/update/delete في db_path + ".journal"
+    - عند تجاوز السجل حداً معيناً يُدمج مع اللقطة في خيط خلفي
+    - التحميل = اللقطة + إعادة تطبيق السجلات
+    """
+
+    def __init__(self, db_path: str = "games.db", compact_threshold: int = 1000,
+                 background: bool = True):
+        """
+        Args:
+            db_path: مسار ملف اللقطة
+            compact_threshold: عدد السجلات الذي يبدأ بعده الدمج
+            background: تنفيذ الدمج في خيط خلفي بدلاً من الخيط المستدعي
+        """
+        super().__init__(db_path)
+        self.journal_path = self.db_path + ".journal"
+        # السجل الذي يجري دمجه حالياً (أو الذي انقطع دمجه)
+        self.compacting_path = self.db_path + ".journal.old"
+        self.compact_threshold = compact_threshold
+        self.background = background
+        self._journal_lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._journal_file = None
+        self._journal_records = 0
+        self._compactor: Optional[threading.Thread] = None
+
+    # ========== السجل ==========
+    def _open_journal(self):
+        if self._journal_file is None:
+            self._journal_file = open(self.journal_path, "ab")
+        return self._journal_file
+
+    def _close_journal(self) -> None:
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+
+    @staticmethod
+    def _apply(games: Dict[str, Any], change: Change, keep_deletes: bool = False) -> None:
+        """
+        تطبيق سجل واحد على قاموس الألعاب {id: dict}
+        مع keep_deletes تُسجل اللعبة المحذوفة كـ None بدلاً من إزالتها
+        """
+        op, payload = change
+        if op in ("insert", "update"):
+            games[payload['id']] = payload
+        elif op == "delete":
+            if keep_deletes:
+                games[payload] = None
+            else:
+                games.pop(payload, None)
+
+    def _replay(self, path: str, games: Dict[str, Any], keep_deletes: bool = False) -> Tuple[int, int]:
+        """
+        إعادة تطبيق سجلات ملف على قاموس الألعاب
+        Returns:
+            (عدد السجلات السليمة، موضع نهاية آخر سجل سليم)
+        """
+        count = 0
+        good_offset = 0
+        if not os.path.exists(path):
+            return count, good_offset
+        with open(path, "rb") as f:
+            while True:
+                try:
+                    change = pickle.load(f)
+                except EOFError:
+                    break
+                except Exception:
+                    # سجل مبتور في النهاية (انقطاع أثناء الكتابة)
+                    print(f"تحذير: تم تجاهل سجل تالف في {path}")
+                    break
+                self._apply(games, change, keep_deletes)
+                count += 1
+                good_offset = f.tell()
+        return count, good_offset
+
+    def _read_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        games: Dict[str, Dict[str, Any]] = {}
+        for game_dict in super().load_games():
+            games[game_dict['id']] = game_dict
+        return games
+
+    @metrics.timed("storage.journal_append")
+    def apply_changes(self, changes: Iterable[Change]) -> None:
+        """
+        إلحاق سجلات التغيير بالسجل. تكلفة الكتابة تتناسب مع حجم التغيير فقط.
+        Args:
+            changes: سجلات (العملية، الحمولة)
+        """
+        with self._journal_lock:
+            f = self._open_journal()
+            for change in changes:
+                pickle.dump(tuple(change), f, protocol=pickle.HIGHEST_PROTOCOL)
+                self._journal_records += 1
+            f.flush()
+            should_compact = self._journal_records >= self.compact_threshold
+        if should_compact:
+            self.compact(wait=not self.background)
+
+    # ========== الدمج ==========
+    def _rotate_journal(self) -> bool:
+        """نقل السجل الحالي إلى ملف الدمج. يعيد False إذا كان هناك دمج جارٍ."""
+        with self._journal_lock:
+            if os.path.exists(self.compacting_path):
+                return False
+            self._close_journal()
+            if not os.path.exists(self.journal_path):
+                return False
+            os.replace(self.journal_path, self.compacting_path)
+            self._journal_records = 0
+            return True
+
+    @metrics.timed("storage.compact")
+    def _fold_compacting(self) -> None:
+        """دمج ملف الدمج مع اللقطة ثم حذفه"""
+        with self._snapshot_lock:
+            if not os.path.exists(self.compacting_path):
+                return
+            games = self._read_snapshot()
+            self._replay(self.compacting_path, games)
+            super().save_games(list(games.values()))
+            # إعادة تطبيق السجلات آمنة (upsert/delete) لو انقطع التنفيذ هنا
+            os.remove(self.compacting_path)
+
+    def compact(self, wait: bool = True) -> None:
+        """
+        دمج السجل في اللقطة
+        Args:
+            wait: انتظار انتهاء الدمج بدلاً من تشغيله في الخلفية
+        """
+        if self._compactor is not None and self._compactor.is_alive():
+            if wait:
+                self._compactor.join()
+            else:
+                return
+        # إكمال أي دمج سابق انقطع قبل تدوير السجل من جديد
+        self._fold_compacting()
+        if not self._rotate_journal():
+            return
+        if wait:
+            self._fold_compacting()
+        else:
+            self._compactor = threading.Thread(
+                target=self._fold_compacting, name="journal-compactor", daemon=True
+            )
+            self._compactor.start()
+
+    # ========== واجهة DatabaseManager ==========
+    def save_games(self, games_data: List[Dict[str, Any]]) -> None:
+        """حفظ لقطة كاملة وتفريغ السجل"""
+        with self._journal_lock, self._snapshot_lock:
+            super().save_games(games_data)
+            self._close_journal()
+            for path in (self.journal_path, self.compacting_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._journal_records = 0
+
+    def _replay_journals(self, games: Dict[str, Any], keep_deletes: bool = False) -> None:
+        """
+        إعادة تطبيق ملف الدمج ثم السجل على قاموس الألعاب، وقص أي ذيل تالف من السجل
+        (حتى لا تُلحق سجلات جديدة بعده فتضيع عند التحميل التالي) وتحديث عدد سجلاته.
+        يُستدعى مع قفلي السجل واللقطة.
+        """
+        self._replay(self.compacting_path, games, keep_deletes)
+        count, good_offset = self._replay(self.journal_path, games, keep_deletes)
+        self._close_journal()
+        if os.path.exists(self.journal_path) and os.path.getsize(self.journal_path) > good_offset:
+            # قص الذيل التالف حتى لا تُلحق سجلات جديدة بعده
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good_offset)
+        self._journal_records = count
+
+    def load_games(self) -> List[Dict[str, Any]]:
+        """تحميل اللقطة ثم إعادة تطبيق السجل (وملف الدمج إن وجد)"""
+        with self._journal_lock, self._snapshot_lock:
+            try:
+                games = self._read_snapshot()
+                self._replay_journals(games)
+            except Exception as e:
+                print(f"خطأ في تحميل قاعدة البيانات: {e}")
+                return []
+        return list(games.values())
+
+    def iter_games(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        تحميل تدريجي: دفعات اللقطة مع تطبيق السجل عليها أثناء القراءة
+        السجل وحده يُقرأ كاملاً (وهو صغير مقارنة باللقطة بفضل الدمج).
+        """
+        overrides: Dict[str, Any] = {}  # {id: dict أو None إذا حُذفت}
+        with self._journal_lock, self._snapshot_lock:
+            try:
+                self._replay_journals(overrides, keep_deletes=True)
+            except Exception as e:
+                print(f"خطأ في تحميل قاعدة البيانات: {e}")
+                return
+
+        seen = set()
+        for chunk in super().iter_games(chunk_size):
+            out = []
+            for game_dict in chunk:
+                game_id = game_dict['id']
+                if game_id in overrides:
+                    seen.add(game_id)
+                    game_dict = overrides[game_id]
+                    if game_dict is None:
+                        continue
+                out.append(game_dict)
+            if out:
+                yield out
+
+        # الألعاب المضافة بعد آخر لقطة
+        added = [g for game_id, g in overrides.items() if g is not None and game_id not in seen]
+        for start in range(0, len(added), chunk_size):
+            yield added[start:start + chunk_size]
+
+    def clear(self) -> None:
+        """حذف اللقطة والسجلات"""
+        self.close()
+        with self._journal_lock:
+            for path in (self.journal_path, self.compacting_path):
+                try:
+                    if os.path.exists(path):
+                        os.remove(path)
+                except Exception as e:
+                    print(f"تعذر حذف السجل: {e}")
+            self._journal_records = 0
+        super().clear()
+
+    def close(self) -> None:
+        """انتظار الدمج الجاري وإغلاق ملف السجل"""
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+        with self._journal_lock:
+            self._close_journal()
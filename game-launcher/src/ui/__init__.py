@@ -1,3 +1,13 @@
 # src/ui/__init__.py
 # UI modules initialization
-from .main_window import MainWindow, run_application
+# التصديرات كسولة: استيراد الحزمة لا يحمّل Qt ولا النوافذ حتى تُستخدم فعلاً
+
+
+def __getattr__(name):
+    if name in ("MainWindow", "run_application"):
+        from . import main_window
+        return getattr(main_window, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["MainWindow", "run_application"]
@@ -3,32 +3,40 @@ ui/card_view.py
 Grid Card View for Game Launcher with images, Play button, tags, search hooks, and i18n-ready strings.
 
 Expansion guide:
-- Add new card fields by extending GameCardData and updating GameCardWidget.render.
-- Hook data provider via set_data_provider(callable) to fetch games from DB/JSON/API.
-- Styling centralized in THEME; tweak to match other launchers.
+- Add new card fields by extending GameCardData and updating GameCardDelegate.paint.
+- Cards are painted by GameCardDelegate for visible rows only; filtering swaps GameCardModel rows.
+- Card images come from ThumbnailService (ui/thumbnails.py): decoded off-thread, placeholder until ready.
+- Missing executables come from a PathHealth service (core/path_health.py) via set_path_health();
+  the delegate only reads its cache, checks run in the background and repaint the grid when done.
+- Hook data provider via set_data_provider(callable) to fetch games from DB/JSON/API,
+  or stream large libraries with load_stream(chunks): one chunk is shown per event-loop turn.
+  Hosts that own the game list (MainWindow) push cards with set_cards()/append_cards() instead.
+- Strings come from the translator t(key); with a ui.i18n.Translator a language switch calls
+  retranslate(), which relabels existing widgets and repaints (RTL mirrors the card layout).
+- Category/tag filtering goes through a core FacetIndex (core/facets.py): one bitset per value,
+  updated as cards stream in. set_facet_filter() combines facets (OR within, AND across) and the
+  category dropdown shows live counts; it is rebuilt only when the set of categories changes.
+- set_sort(order) keeps the grid ordered through a core SortedView (core/views.py); add an
+  order by adding a key function to CARD_SORT_KEYS, or pass a key function of a card directly.
+- Styling lives in ui/theme.py: THEME is the active palette, the stylesheet is installed app-wide.
 """
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional, Dict
+from typing import Callable, Iterable, Iterator, List, Optional, Union
 
-from PySide6.QtCore import Qt, QSize, Signal, QObject
-from PySide6.QtGui import QPixmap, QIcon, QAction
-from PySide6.QtWidgets import (
-    QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QScrollArea, QLineEdit, QComboBox, QSizePolicy, QFrame, QMenu
+from .qt_compat import (
+    Qt, QSize, QRect, QRectF, QEvent, QTimer, Signal, QObject, QAbstractListModel, QModelIndex,
+    QAction, QPainter, QPainterPath, QPen, QFont, QFontMetrics,
+    QWidget, QVBoxLayout, QHBoxLayout, QListView, QLineEdit, QComboBox, QMenu,
+    QStyledItemDelegate, QStyleOptionViewItem, QStyle, event_pos, exec_
 )
-
-# Theming palette to resemble popular game launchers
-THEME: Dict[str, str] = {
-    "bg": "#0e141b",
-    "panel": "#141a22",
-    "accent": "#4cc2ff",
-    "accent_hover": "#71d2ff",
-    "text": "#e6eaf0",
-    "muted": "#98a2b3",
-    "card": "#1a212b",
-    "danger": "#ff5d5d",
-}
+from ..core.facets import FacetIndex
+from ..core.path_health import MISSING
+from ..core.views import SortedView, collation_key
+from ..utils import metrics
+from .filtering import FilterController
+from .theme import THEME, color  # noqa: F401  (THEME re-exported for existing imports)
+from .thumbnails import ThumbnailService
 
 @dataclass
 class GameCardData:
@@ -40,111 +48,414 @@ class GameCardData:
     executable: Optional[str] = None  # path or URI
     store_url: Optional[str] = None
     homepage_url: Optional[str] = None
+    key: Optional[int] = None  # GameLibrary surrogate key; id stays the stored string id
+    last_played: Optional[int] = None  # epoch seconds; breaks ties between equally good matches
+
+def game_to_card(game) -> GameCardData:
+    """Build card data from a core Game (or anything with id/name/path/genre)."""
+    return GameCardData(
+        id=game.id,
+        title=game.name,
+        image_path="",
+        category=game.genre or "All",
+        executable=game.path,
+        key=game.key,
+        last_played=game.last_played_ts,
+    )
+
+# Sort orders for CardGridView.set_sort: card -> precomputed sort key
+CARD_SORT_KEYS = {
+    "title": lambda c: collation_key(c.title),
+    "category": lambda c: collation_key(c.category),
+    "last_played": lambda c: (c.last_played is not None, c.last_played or 0),
+}
+
+# Facets of a card for CardGridView.set_facet_filter: card -> values
+CARD_FACETS = {
+    "category": lambda c: (c.category,) if c.category else (),
+    "tag": lambda c: c.tags,
+}
 
 class CardSignals(QObject):
-    play_clicked = Signal(str)
+    play_clicked = Signal(object)  # card key (int, 64-bit so not Signal(int)) or id for cards without one
     card_open_menu = Signal(str)
 
-class GameCardWidget(QFrame):
-    def __init__(self, data: GameCardData, t: Callable[[str], str]):
-        super().__init__()
-        self.data = data
+class GameCardModel(QAbstractListModel):
+    """List model over all cards; filtering only swaps the visible row set."""
+    CardRole = Qt.UserRole + 1
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._cards: List[GameCardData] = []
+        self._rows: List[int] = []  # indexes into _cards, in display order
+
+    def set_cards(self, cards: List[GameCardData]):
+        self.beginResetModel()
+        self._cards = list(cards)
+        self._rows = list(range(len(self._cards)))
+        self.endResetModel()
+
+    def cards(self) -> List[GameCardData]:
+        return self._cards
+
+    def append_cards(self, cards: List[GameCardData]):
+        """Add cards to the backing list; they become visible through set_rows."""
+        self._cards.extend(cards)
+
+    def set_rows(self, rows: List[int]):
+        """Show only the given card indexes. No widgets are created or destroyed."""
+        if rows == self._rows:
+            return
+        old = len(self._rows)
+        if len(rows) > old and rows[:old] == self._rows:
+            # Results grew at the end (streaming load): insert instead of resetting the view
+            self.beginInsertRows(QModelIndex(), old, len(rows) - 1)
+            self._rows = rows
+            self.endInsertRows()
+            return
+        with metrics.timer("ui.cards.reset"):
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+
+    def card_at(self, row: int) -> Optional[GameCardData]:
+        if 0 <= row < len(self._rows):
+            return self._cards[self._rows[row]]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        card = self.card_at(index.row()) if index.isValid() else None
+        if card is None:
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return card.title
+        if role == self.CardRole:
+            return card
+        return None
+
+class GameCardDelegate(QStyledItemDelegate):
+    """Paints one card (image, title, Play button, category) on demand for visible rows only."""
+    CARD_SIZE = QSize(256, 214)
+    IMAGE_SIZE = QSize(240, 135)  # 16:9 card image
+    MARGIN = 8
+
+    def __init__(self, t: Callable[[str], str], thumbnails: ThumbnailService, parent: Optional[QObject] = None):
+        super().__init__(parent)
         self.t = t
-        self.setObjectName("GameCard")
-        self.setStyleSheet(
-            f"""
-            QFrame#GameCard {{ background:{THEME['card']}; border-radius:10px; }}
-            QFrame#GameCard:hover {{ border:1px solid {THEME['accent']}; }}
-            QLabel#Title {{ color:{THEME['text']}; font-weight:600; }}
-            QLabel#Category {{ color:{THEME['muted']}; font-size:12px; }}
-            QPushButton#Play {{ background:{THEME['accent']}; color:#0b0f14; border:0; border-radius:6px; padding:6px 10px; }}
-            QPushButton#Play:hover {{ background:{THEME['accent_hover']}; }}
-            """
-        )
+        self.thumbnails = thumbnails
         self.signals = CardSignals()
-        self._build()
+        # path -> "unknown" / "present" / "missing"; must not block (cache lookup only)
+        self.path_status: Optional[Callable[[str], str]] = None
 
-    def _build(self):
-        v = QVBoxLayout(self)
-        v.setContentsMargins(8, 8, 8, 8)
-        v.setSpacing(6)
-
-        img = QLabel()
-        img.setFixedSize(240, 135)  # 16:9 card image
-        img.setStyleSheet("background:#0b0f14; border-radius:8px;")
-        pix = QPixmap(self.data.image_path)
-        if not pix.isNull():
-            img.setPixmap(pix.scaled(img.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
-        img.setAlignment(Qt.AlignCenter)
-
-        title = QLabel(self.data.title)
-        title.setObjectName("Title")
-        title.setWordWrap(True)
-
-        category = QLabel(self.data.category)
-        category.setObjectName("Category")
-
-        play = QPushButton(self.t("play"))
-        play.setObjectName("Play")
-        play.setCursor(Qt.PointingHandCursor)
-        play.clicked.connect(lambda: self.signals.play_clicked.emit(self.data.id))
-
-        top = QHBoxLayout()
-        top.addWidget(title, 1)
-        top.addWidget(play, 0)
-
-        v.addWidget(img)
-        v.addLayout(top)
-        v.addWidget(category)
+    def is_missing(self, card: GameCardData) -> bool:
+        return bool(card.executable) and self.path_status is not None and self.path_status(card.executable) == MISSING
 
-        # Context menu for extra links
-        self.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.customContextMenuRequested.connect(self._open_menu)
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return self.CARD_SIZE
 
-    def _open_menu(self, pos):
-        menu = QMenu(self)
-        if self.data.store_url:
-            act_store = QAction(self.t("open_store"), self)
-            act_store.triggered.connect(lambda: self.signals.card_open_menu.emit(self.data.store_url or ""))
-            menu.addAction(act_store)
-        if self.data.homepage_url:
-            act_home = QAction(self.t("open_homepage"), self)
-            act_home.triggered.connect(lambda: self.signals.card_open_menu.emit(self.data.homepage_url or ""))
-            menu.addAction(act_home)
-        if not menu.isEmpty():
-            menu.exec(self.mapToGlobal(pos))
+    def _image_rect(self, rect: QRect) -> QRect:
+        return QRect(rect.x() + self.MARGIN, rect.y() + self.MARGIN, self.IMAGE_SIZE.width(), self.IMAGE_SIZE.height())
+
+    def _play_rect(self, rect: QRect, direction=Qt.LeftToRight) -> QRect:
+        img = self._image_rect(rect)
+        return QStyle.visualRect(direction, rect, QRect(img.right() - 64, img.bottom() + 10, 64, 28))
+
+    def category_label(self, category: str) -> str:
+        label = getattr(self.t, "category", None)
+        return label(category) if label is not None else category
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        card: Optional[GameCardData] = index.data(GameCardModel.CardRole)
+        if card is None:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = option.rect
+
+        # Card background + hover border
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        painter.setPen(QPen(color('accent'), 1) if hovered else Qt.NoPen)
+        painter.setBrush(color('card'))
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+
+        # Image
+        img_rect = self._image_rect(rect)
+        clip = QPainterPath()
+        clip.addRoundedRect(QRectF(img_rect), 8, 8)
+        painter.fillPath(clip, color('placeholder'))
+        pix = self.thumbnails.get(card.image_path)
+        if pix is not None:
+            painter.save()
+            painter.setClipPath(clip)
+            painter.drawPixmap(img_rect, pix)
+            painter.restore()
+        elif card.title:
+            # Placeholder until the thumbnail service delivers the image
+            placeholder_font = QFont(option.font)
+            placeholder_font.setPixelSize(40)
+            painter.setFont(placeholder_font)
+            painter.setPen(color('muted'))
+            painter.drawText(img_rect, Qt.AlignCenter, card.title[0])
+
+        # Missing executable badge
+        missing = self.is_missing(card)
+        if missing:
+            badge_font = QFont(option.font)
+            badge_font.setPixelSize(11)
+            badge_font.setWeight(QFont.DemiBold)
+            painter.setFont(badge_font)
+            label = self.t("missing")
+            badge_rect = QStyle.visualRect(option.direction, rect, QRect(
+                img_rect.left() + 6, img_rect.top() + 6, QFontMetrics(badge_font).horizontalAdvance(label) + 12, 20))
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color('danger'))
+            painter.drawRoundedRect(QRectF(badge_rect), 4, 4)
+            painter.setPen(color('on_accent'))
+            painter.drawText(badge_rect, Qt.AlignCenter, label)
+            painter.setFont(option.font)
+
+        # Play button (greyed out when the executable is missing)
+        play_rect = self._play_rect(rect, option.direction)
+        painter.setPen(Qt.NoPen)
+        if missing:
+            painter.setBrush(color('muted'))
+        else:
+            painter.setBrush(color('accent_hover' if hovered else 'accent'))
+        painter.drawRoundedRect(QRectF(play_rect), 6, 6)
+        painter.setPen(color('on_accent'))
+        painter.drawText(play_rect, Qt.AlignCenter, self.t("play"))
+
+        # Title (elided to one line next to the button)
+        title_font = QFont(option.font)
+        title_font.setWeight(QFont.DemiBold)
+        painter.setFont(title_font)
+        painter.setPen(color('text'))
+        # Laid out left to right, then mirrored for RTL (alignment follows the painter's direction)
+        ltr_play = self._play_rect(rect)
+        title_rect = QStyle.visualRect(option.direction, rect, QRect(
+            img_rect.left(), ltr_play.top(), ltr_play.left() - img_rect.left() - 6, ltr_play.height()))
+        title = QFontMetrics(title_font).elidedText(card.title, Qt.ElideRight, title_rect.width())
+        painter.drawText(title_rect, Qt.AlignVCenter | Qt.AlignLeft, title)
+
+        # Category
+        cat_font = QFont(option.font)
+        cat_font.setPixelSize(12)
+        painter.setFont(cat_font)
+        painter.setPen(color('muted'))
+        cat_rect = QRect(img_rect.left(), play_rect.bottom() + 6, img_rect.width(), 18)
+        painter.drawText(cat_rect, Qt.AlignVCenter | Qt.AlignLeft, self.category_label(card.category))
+
+        painter.restore()
+
+    def editorEvent(self, event: QEvent, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and self._play_rect(option.rect, option.direction).contains(event_pos(event))
+        ):
+            card: Optional[GameCardData] = index.data(GameCardModel.CardRole)
+            if card is not None:
+                self.signals.play_clicked.emit(card.id if card.key is None else card.key)
+            return True
+        return super().editorEvent(event, model, option, index)
 
 class CardGridView(QWidget):
     # High-level grid view with search/filter
-    play_requested = Signal(str)          # emits game id
+    play_requested = Signal(object)       # emits game key (int), or id for cards without a key
     open_link_requested = Signal(str)     # emits url
+    loading_finished = Signal()           # load_stream consumed its last chunk
+    path_status_changed = Signal(str)     # a PathHealth check changed an executable's status
+    delete_requested = Signal(object)     # emits game key (int) or id; context menu with deletable=True
 
-    def __init__(self, t: Callable[[str], str]):
+    def __init__(self, t: Callable[[str], str], deletable: bool = False):
         super().__init__()
         self.t = t
-        self._data_provider: Optional[Callable[[], List[GameCardData]]] = None
+        self.deletable = deletable
+        self._data_provider: Optional[Callable[[], Iterable]] = None
         self._all_cards: List[GameCardData] = []
+        self.facets = FacetIndex(CARD_FACETS)  # bit i = card index i
+        self._facet_filters: dict = {}  # facet -> selected values
+        self._match_all: set = set()  # facets whose selected values must all match
+        self._text_rows: List[int] = []  # last search results, before facet filters
+        self._category_values: List[str] = []  # categories currently in the dropdown
+        self._category_counts: dict = {}  # category -> count shown in the dropdown
+        self._stream: Optional[Iterator[List[GameCardData]]] = None
+        self._stream_generation = 0
+        self._path_health = None
+        self._sort_view: Optional[SortedView] = None  # card indexes in the selected order
+        self._sort_descending = False
         self._build()
+        if hasattr(t, "bind"):
+            t.bind(self.retranslate, self)
 
     # Public API to connect data
-    def set_data_provider(self, provider: Callable[[], List[GameCardData]]):
-        """Attach external data provider. Call refresh() after setting."""
+    def set_data_provider(self, provider: Callable[[], Iterable]):
+        """
+        Attach external data provider. Call refresh() after setting.
+        The provider returns either a list of cards or an iterator of card chunks (see load_stream).
+        """
         self._data_provider = provider
 
+    def set_path_health(self, health):
+        """
+        Show missing executables using a core PathHealth service.
+        Its listeners run on worker threads, so changes reach the view through a queued signal.
+        """
+        if self._path_health is not None:
+            self._path_health.remove_listener(self._on_path_status)
+        self._path_health = health
+        self.delegate.path_status = health.status if health is not None else None
+        if health is not None:
+            health.add_listener(self._on_path_status)
+        self.view.viewport().update()
+
+    def _on_path_status(self, path: str, status: str):
+        self.path_status_changed.emit(path)
+
+    def retranslate(self):
+        """Relabel in place after a language switch; cards are repainted, not recreated."""
+        self.search.setPlaceholderText(self.t("search_games"))
+        for i in range(self.category.count()):
+            self.category.setItemText(i, self._category_text(self.category.itemData(i)))
+        self.view.viewport().update()
+
+    def set_sort(self, order: Optional[Union[str, Callable[[GameCardData], object]]], descending: bool = False):
+        """
+        Order the grid by a CARD_SORT_KEYS field or a key function of a card
+        (None: search ranking / load order).
+        Sort keys are computed once per card and kept in a SortedView as cards stream in,
+        so filtering only reorders the matching rows by those keys.
+        """
+        if order is None:
+            self._sort_view = None
+        else:
+            self._sort_view = SortedView(CARD_SORT_KEYS[order] if isinstance(order, str) else order)
+            self._sort_view.update(enumerate(self._all_cards))
+        self._sort_descending = descending
+        self.filter.run_now()
+
+    def _reset_sort_view(self):
+        if self._sort_view is not None:
+            self._sort_view.clear()
+            self._sort_view.update(enumerate(self._all_cards))
+
+    def set_facet_filter(self, facet: str, values: Optional[Iterable[str]], match_all: bool = False):
+        """
+        Restrict the grid to cards having any (or, with match_all, every) of the given values
+        of a CARD_FACETS facet; None or empty clears it. Facets combine with AND.
+        """
+        selected = set(values or ())
+        if selected:
+            self._facet_filters[facet] = selected
+        else:
+            self._facet_filters.pop(facet, None)
+        if match_all:
+            self._match_all.add(facet)
+        else:
+            self._match_all.discard(facet)
+        self._show_rows()
+
+    def _on_results(self, rows: List[int]):
+        self._text_rows = rows
+        self._show_rows()
+
+    def _show_rows(self):
+        """Apply facet filters to the search results with bitwise ops and update live counts."""
+        rows = self._text_rows
+        facets = self.facets
+        # Search results as a bitset (None: every card matches the search)
+        within = facets.mask_of(rows) if len(rows) < len(facets) else None
+        # Category counts honor the other facets but not the category selection itself
+        others = {f: v for f, v in self._facet_filters.items() if f != "category"}
+        if others:
+            within = facets.select(others, self._match_all, within)
+        total = len(rows) if within is None else facets.count(within)
+        self._update_category_counts(facets.counts("category", within), total)
+        if self._facet_filters:
+            allowed = set(facets.ids(facets.select(self._facet_filters, self._match_all, within)))
+            rows = [i for i in rows if i in allowed]
+        self._set_rows(rows)
+
+    def _set_rows(self, rows: List[int]):
+        view = self._sort_view
+        if view is not None:
+            if len(rows) == len(view):
+                # Every card matches: walk the view instead of sorting
+                rows = view.page_after(None, len(view), self._sort_descending)
+            else:
+                rows = sorted(rows, key=view.cursor, reverse=self._sort_descending)
+        self.model.set_rows(rows)
+
     def refresh(self):
         if self._data_provider:
-            self._all_cards = self._data_provider() or []
-        self._apply_filters()
+            data = self._data_provider()
+            if data is not None and not isinstance(data, (list, tuple)):
+                # A generator of chunks: fill the grid progressively
+                self.load_stream(data)
+                return
+            self._stream_generation += 1  # cancels a stream still loading
+            self.set_cards(data or [])
+        else:
+            self._apply_filters()
 
-    def _build(self):
-        self.setStyleSheet(
-            f"""
-            QWidget {{ background:{THEME['bg']}; color:{THEME['text']}; }}
-            QLineEdit {{ background:{THEME['panel']}; border:1px solid #273142; border-radius:8px; padding:8px; color:{THEME['text']}; }}
-            QComboBox {{ background:{THEME['panel']}; border:1px solid #273142; border-radius:8px; padding:6px; color:{THEME['text']}; }}
-            """
-        )
+    def set_cards(self, cards: List[GameCardData]):
+        """
+        Replace the cards and re-filter them with the current query and facets.
+        A stream still loading keeps appending after them (refresh() cancels it instead).
+        """
+        self.model.set_cards(cards)
+        self._all_cards = self.model.cards()
+        self._reset_sort_view()
+        self.facets.clear()
+        self.facets.update(enumerate(self._all_cards))
+        self._text_rows = []
+        # Categories only change with the data, not with the search text
+        self._sync_categories()
+        self.filter.set_items(self._all_cards)
+
+    def append_cards(self, cards: List[GameCardData]):
+        """Add cards after the current ones; only the new cards are indexed and matched."""
+        start = len(self._all_cards)
+        self.model.append_cards(cards)
+        if self._sort_view is not None:
+            self._sort_view.update((start + i, card) for i, card in enumerate(cards))
+        self.facets.update((start + i, card) for i, card in enumerate(cards))
+        self._sync_categories()
+        self.filter.extend_items(cards)
 
+    def load_stream(self, chunks: Iterable[List[GameCardData]]):
+        """
+        Replace the cards with a lazily produced sequence of chunks (e.g. straight from
+        storage). One chunk is pulled per event-loop turn, so the first cards paint
+        while the rest is still being read; loading_finished fires at the end.
+        """
+        self._stream_generation += 1
+        generation = self._stream_generation
+        self._stream = iter(chunks)
+        self.model.set_cards([])
+        self._all_cards = self.model.cards()
+        self._reset_sort_view()
+        self.facets.clear()
+        self._text_rows = []
+        self._sync_categories()
+        self.filter.set_items(self._all_cards)
+        self._pump(generation)
+
+    def _pump(self, generation: int):
+        if generation != self._stream_generation or self._stream is None:
+            return
+        chunk = next(self._stream, None)
+        if chunk is None:
+            self._stream = None
+            self.loading_finished.emit()
+            return
+        self.append_cards(chunk)
+        QTimer.singleShot(0, lambda: self._pump(generation))
+
+    def _build(self):
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
         root.setSpacing(10)
@@ -152,7 +463,7 @@ class CardGridView(QWidget):
         controls = QHBoxLayout()
         self.search = QLineEdit()
         self.search.setPlaceholderText(self.t("search_games"))
-        self.search.textChanged.connect(self._apply_filters)
+        self.search.textChanged.connect(lambda text: self.filter.set_query(text))
 
         self.category = QComboBox()
         self.category.addItem(self.t("all_categories"), "All")
@@ -162,62 +473,109 @@ class CardGridView(QWidget):
         controls.addWidget(self.category, 0)
         root.addLayout(controls)
 
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.container = QWidget()
-        self.grid = QGridLayout(self.container)
-        self.grid.setSpacing(14)
-        self.grid.setContentsMargins(4, 4, 4, 4)
-        self.scroll.setWidget(self.container)
-        root.addWidget(self.scroll, 1)
+        self.model = GameCardModel(self)
+        # Debounced, incremental search over title + tags; results only swap model rows
+        self.filter = FilterController(
+            lambda d: " ".join([d.title] + d.tags), parent=self, ranked=True, recency=lambda d: d.last_played,
+            type_ahead=True,
+        )
+        self.filter.results_ready.connect(self._on_results)
+        self.thumbnails = ThumbnailService(parent=self)
+        self.delegate = GameCardDelegate(self.t, self.thumbnails, self)
+        self.delegate.signals.play_clicked.connect(self.play_requested.emit)
+
+        self.view = QListView()
+        self.view.setViewMode(QListView.IconMode)
+        self.view.setResizeMode(QListView.Adjust)
+        self.view.setMovement(QListView.Static)
+        self.view.setUniformItemSizes(True)
+        self.view.setSpacing(7)
+        self.view.setSelectionMode(QListView.NoSelection)
+        self.view.setMouseTracking(True)
+        self.view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(self.delegate)
+        # Context menu for extra links
+        self.view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.view.customContextMenuRequested.connect(self._open_menu)
+        root.addWidget(self.view, 1)
+        # Repaint visible cards when an image finishes loading in the background
+        self.thumbnails.thumbnail_ready.connect(self._repaint_cards)
+        # A bound slot: PathHealth emits from worker threads are queued to the GUI thread
+        self.path_status_changed.connect(self._repaint_cards)
+
+    def _repaint_cards(self, _path: str = ""):
+        self.view.viewport().update()
+
+    def _open_menu(self, pos):
+        card = self.model.card_at(self.view.indexAt(pos).row())
+        if card is None:
+            return
+        menu = QMenu(self)
+        if card.store_url:
+            act_store = QAction(self.t("open_store"), menu)
+            act_store.triggered.connect(lambda: self.open_link_requested.emit(card.store_url or ""))
+            menu.addAction(act_store)
+        if card.homepage_url:
+            act_home = QAction(self.t("open_homepage"), menu)
+            act_home.triggered.connect(lambda: self.open_link_requested.emit(card.homepage_url or ""))
+            menu.addAction(act_home)
+        if self.deletable:
+            act_delete = QAction(self.t("delete"), menu)
+            act_delete.triggered.connect(lambda: self.delete_requested.emit(card.id if card.key is None else card.key))
+            menu.addAction(act_delete)
+        if not menu.isEmpty():
+            exec_(menu, self.view.viewport().mapToGlobal(pos))
 
     def _apply_filters(self):
-        # Clear grid
-        while self.grid.count():
-            item = self.grid.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
-        # Build category list
-        cats = ["All"] + sorted({c.category for c in self._all_cards if c.category})
-        self._sync_categories(cats)
-        # Filter
-        q = (self.search.text() or "").strip().lower()
+        """Re-filter immediately with the current category (search results are reused)."""
         cat = self.category.currentData() or "All"
-        filtered = []
-        for d in self._all_cards:
-            if cat != "All" and d.category != cat:
-                continue
-            hay = " ".join([d.title] + d.tags)
-            if q and q not in hay.lower():
-                continue
-            filtered.append(d)
-        # Fill grid
-        col_count = 4
-        r = c = 0
-        for d in filtered:
-            w = GameCardWidget(d, self.t)
-            w.signals.play_clicked.connect(self.play_requested.emit)
-            w.signals.card_open_menu.connect(self.open_link_requested.emit)
-            self.grid.addWidget(w, r, c)
-            c += 1
-            if c >= col_count:
-                c = 0
-                r += 1
-
-    def _sync_categories(self, cats: List[str]):
+        self.set_facet_filter("category", None if cat == "All" else (cat,))
+
+    def _sync_categories(self):
+        """Rebuild the dropdown only when the set of categories changed (counts update in place)."""
+        # "All" is the default category of cards without one: those only show under All
+        cats = sorted(c for c in self.facets.values("category") if c != "All")
+        if cats == self._category_values:
+            return
+        self._category_values = cats
         # keep current selection when possible
         current = self.category.currentData()
         self.category.blockSignals(True)
         self.category.clear()
-        for c in cats:
-            label = self.t("category_" + c.lower()) if c != "All" else self.t("all_categories")
-            self.category.addItem(label, c)
+        for c in ["All"] + cats:
+            self.category.addItem(self._category_text(c), c)
         # restore
-        if current in cats:
-            idx = cats.index(current)
-            self.category.setCurrentIndex(idx)
+        index = self.category.findData(current)
+        self.category.setCurrentIndex(max(index, 0))
         self.category.blockSignals(False)
+        if index < 0 and "category" in self._facet_filters:
+            # The selected category no longer exists: drop its filter and re-filter now,
+            # so the grid does not keep showing rows narrowed by the stale selection
+            self._facet_filters.pop("category")
+            self._show_rows()
+
+    def _update_category_counts(self, counts: dict, total: int):
+        counts = dict(counts, All=total)
+        if counts == self._category_counts:
+            return
+        old = self._category_counts
+        self._category_counts = counts
+        for i in range(self.category.count()):
+            c = self.category.itemData(i)
+            if old.get(c) != counts.get(c):
+                self.category.setItemText(i, self._category_text(c))
+
+    def _category_text(self, c: str) -> str:
+        count = self._category_counts.get(c)
+        label = self._category_label(c)
+        return label if count is None else f"{label} ({count})"
+
+    def _category_label(self, c: str) -> str:
+        if c == "All":
+            return self.t("all_categories")
+        label = getattr(self.t, "category", None)
+        return label(c) if label is not None else self.t("category_" + c.lower())
 
 # Example i18n keys used in this file:
-# play, search_games, all_categories, open_store, open_homepage, category_<name>
+# play, missing, search_games, all_categories, open_store, open_homepage, delete, category_<name>
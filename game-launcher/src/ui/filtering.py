@@ -0,0 +1,243 @@
+"""
+ui/filtering.py
+Debounced, incremental filtering shared by NavBar, CardGridView and MainWindow.
+
+- Debouncer: coalesces rapid updates (e.g. keystrokes) and emits only the last value.
+- FilterController: matches a query against precomputed, normalized haystacks.
+  * typing is debounced, so a burst of keystrokes costs one filter pass;
+  * a query that extends the previous one narrows the previous result set;
+  * work runs in chunks on the event loop and a newer query cancels a stale run.
+  * ranked=True (or set_search_provider) swaps the substring scan for the core SearchIndex:
+    typo-tolerant, Arabic/Latin transliterated, ordered by match quality and recency.
+    Ranked queries still narrow (the index searches within the previous results when
+    search.narrows() allows it) and the constraint pass still runs in cancellable chunks.
+  * type_ahead=True opts ranked 1-2 character queries into word-prefix matching (cheap while
+    typing); by default they match anywhere in the text, like the literal scan.
+"""
+from __future__ import annotations
+import time
+from typing import Callable, List, Optional, Sequence
+
+from ..core.search import SearchIndex, narrows, normalize
+from ..utils import metrics
+from .qt_compat import QObject, QTimer, Signal
+
+DEFAULT_DEBOUNCE_MS = 150
+DEFAULT_CHUNK_SIZE = 5000
+
+
+class Debouncer(QObject):
+    """Emits `triggered(value)` once input has been quiet for `delay_ms`."""
+    triggered = Signal(object)
+
+    def __init__(self, delay_ms: int = DEFAULT_DEBOUNCE_MS, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._value = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def set_delay(self, delay_ms: int):
+        self._timer.setInterval(delay_ms)
+
+    def push(self, value):
+        self._value = value
+        self._timer.start()
+
+    def is_pending(self) -> bool:
+        return self._timer.isActive()
+
+    def flush(self):
+        """Emit the pending value right away."""
+        self._timer.stop()
+        self.triggered.emit(self._value)
+
+
+class FilterController(QObject):
+    """
+    Filters a list of items by a text query and emits the matching indexes.
+
+    `haystack(item)` returns the searchable text of an item; it is normalized once in
+    set_items(), not on every keystroke. An optional constraint (e.g. category) can be
+    combined with the text match via set_constraint().
+
+    With ranked=True non-empty queries go through a SearchIndex over the items (built
+    incrementally in set_items/extend_items), and results come best match first;
+    `recency(item)` (last played, epoch seconds) breaks ties. set_search_provider() plugs
+    in an existing index instead (e.g. GameLibrary.search_games) so none is built here.
+    With type_ahead=True, ranked queries shorter than a trigram match word starts only.
+    """
+    results_ready = Signal(object)  # List[int]: indexes into the items, in order
+
+    def __init__(
+        self,
+        haystack: Callable[[object], str],
+        debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        parent: Optional[QObject] = None,
+        ranked: bool = False,
+        recency: Optional[Callable[[object], Optional[int]]] = None,
+        type_ahead: bool = False,
+    ):
+        super().__init__(parent)
+        self._haystack = haystack
+        self.chunk_size = chunk_size
+        self._hay: List[str] = []
+        self._recency = recency
+        self._type_ahead = type_ahead
+        self._index: Optional[SearchIndex] = SearchIndex() if ranked else None
+        self._search_provider: Optional[Callable[[str, Optional[Sequence[int]], bool], Sequence[int]]] = None
+        self._constraint: Optional[Callable[[int], bool]] = None
+        self._query = ""
+        # Last completed run, used to narrow a query that extends it
+        self._last_query: Optional[str] = None
+        self._last_results: List[int] = []
+        # Current run
+        self._generation = 0
+        self._run_query = ""
+        self._run_ranked = False
+        self._source: Sequence[int] = ()
+        self._pos = 0
+        self._matches: List[int] = []
+        self._running = False
+        self._started = 0.0
+
+        self._debouncer = Debouncer(debounce_ms, self)
+        self._debouncer.triggered.connect(self._on_query)
+
+    def set_debounce(self, delay_ms: int):
+        self._debouncer.set_delay(delay_ms)
+
+    def set_search_provider(self, search: Optional[Callable[[str, Optional[Sequence[int]], bool], Sequence[int]]]):
+        """
+        Rank non-empty queries with `search(text, within, prefix_only) -> item indexes, best first`
+        instead of an index built here; `within` is None or the item indexes to search among (the
+        previous results, when the query narrows them) and `prefix_only` is the type_ahead setting.
+        Pass None to go back to the built-in behavior.
+        """
+        self._search_provider = search
+        if search is not None:
+            self._index = None
+        self._invalidate()
+
+    def _index_items(self, start: int, items: Sequence[object]):
+        if self._index is None or self._search_provider is not None:
+            return
+        recency = self._recency
+        add = self._index.add
+        for offset, item in enumerate(items):
+            add(start + offset, self._haystack(item), last_played=recency(item) if recency else None)
+
+    # ========== inputs ==========
+    def set_items(self, items: Sequence[object]):
+        """Replace the item list and filter it immediately with the current query."""
+        self._hay = [normalize(self._haystack(item)) for item in items]
+        if self._index is not None:
+            self._index.clear()
+            self._index_items(0, items)
+        self._invalidate()
+        self.run_now()
+
+    def extend_items(self, items: Sequence[object]):
+        """Append items (e.g. while the library streams in); when idle only the new ones are matched."""
+        start = len(self._hay)
+        self._hay.extend(normalize(self._haystack(item)) for item in items)
+        self._index_items(start, items)
+        if (self._running or self._debouncer.is_pending() or self._last_query is None
+                or self._is_ranked(self._last_query)):
+            # Ranked results are re-ranked with the new items rather than appended
+            self._invalidate()
+            self.run_now()
+            return
+        # Previous results are still valid: continue them over the new range
+        self._generation += 1
+        self._running = True
+        self._run_query = self._last_query
+        self._run_ranked = False
+        self._matches = list(self._last_results)
+        self._source = range(start, len(self._hay))
+        self._pos = 0
+        self._started = time.perf_counter()
+        self._step(self._generation)
+
+    def set_constraint(self, constraint: Optional[Callable[[int], bool]]):
+        """Set an extra predicate over item indexes and filter immediately."""
+        self._constraint = constraint
+        self._invalidate()
+        self.run_now()
+
+    def set_query(self, text: str):
+        """Debounced: only the last query of a burst is filtered."""
+        self._debouncer.push(text or "")
+
+    def run_now(self):
+        """Filter with the latest query without waiting for the debounce delay."""
+        if self._debouncer.is_pending():
+            self._debouncer.flush()
+        else:
+            self._on_query(self._query)
+
+    def _invalidate(self):
+        self._last_query = None
+        self._last_results = []
+
+    def _is_ranked(self, query: str) -> bool:
+        return bool(query) and (self._search_provider is not None or self._index is not None)
+
+    def _search(self, query: str, within: Optional[Sequence[int]]) -> Sequence[int]:
+        if self._search_provider is not None:
+            return self._search_provider(query, within, self._type_ahead)
+        return self._index.search(query, within=within, prefix_only=self._type_ahead)
+
+    # ========== filtering ==========
+    def _on_query(self, text):
+        self._query = text or ""
+        query = normalize(self._query)
+        self._generation += 1  # cancels any run still in progress
+        self._running = True
+        self._run_query = query
+        self._run_ranked = self._is_ranked(query)
+        self._matches = []
+        self._pos = 0
+        self._started = time.perf_counter()
+        last = self._last_query
+        if self._run_ranked:
+            # One index lookup (within the previous results when they are known to contain
+            # every match); the constraint is then applied in chunks like a scan
+            within = (self._last_results
+                      if last is not None and narrows(last, query, self._type_ahead) else None)
+            self._source = self._search(self._query, within)
+        elif last is not None and last in query:
+            # Narrowing: every match of the longer query matched the previous one
+            self._source = self._last_results
+        else:
+            self._source = range(len(self._hay))
+        self._step(self._generation)
+
+    def _step(self, generation: int):
+        if generation != self._generation:
+            return  # a newer query superseded this run
+        # Ranked sources already match the query; only the constraint is left to check
+        query = "" if self._run_ranked else self._run_query
+        hay = self._hay
+        constraint = self._constraint
+        end = min(self._pos + self.chunk_size, len(self._source))
+        matches = self._matches
+        for i in self._source[self._pos:end]:
+            if query and query not in hay[i]:
+                continue
+            if constraint is not None and not constraint(i):
+                continue
+            matches.append(i)
+        self._pos = end
+        if end < len(self._source):
+            QTimer.singleShot(0, lambda: self._step(generation))
+            return
+        self._running = False
+        self._last_query = self._run_query
+        self._last_results = matches
+        if metrics.is_enabled():
+            # Wall time of the whole run, including the event-loop turns between chunks
+            metrics.registry.record("ui.filter", time.perf_counter() - self._started)
+        self.results_ready.emit(list(matches))
@@ -0,0 +1,256 @@
+"""
+ui/i18n.py
+Translation catalogs and live language switching.
+
+- CATALOGS holds one flat key -> text catalog per language; add a language by adding a catalog
+  (and listing it in RTL_LANGUAGES if it is written right to left). Missing keys fall back to English.
+- Each catalog is compiled once, on first use: English fallbacks are merged in and every string is
+  interned, so a lookup is a single dict get and no per-call string building happens.
+- tr is the shared Translator. It is a plain callable t(key), so widgets that take a translator
+  (NavBar, CardGridView, MainWindow) keep working with any callable; category labels are memoized.
+- tr.set_language(lang) swaps the catalog, sets the application layout direction (RTL/LTR) and
+  emits language_changed. Widgets retranslate their existing text in place on that signal;
+  nothing is destroyed or rebuilt.
+"""
+from __future__ import annotations
+import sys
+from typing import Callable, Dict, List, Optional
+
+from .qt_compat import QApplication, QObject, Qt, Signal
+
+DEFAULT_LANGUAGE = "ar"
+FALLBACK_LANGUAGE = "en"
+RTL_LANGUAGES = frozenset({"ar"})
+
+# Display name of each language in its own script (language pickers)
+LANGUAGE_NAMES: Dict[str, str] = {"ar": "العربية", "en": "English"}
+
+CATALOGS: Dict[str, Dict[str, str]] = {
+    "en": {
+        "app_name": "Game Launcher",
+        "window_title": "Game Library",
+        "settings": "Settings",
+        "search_games": "Search games…",
+        "search_by_name": "Search for a game by name…",
+        "all_categories": "All categories",
+        "library_label": "Library:",
+        "play": "Play",
+        "missing": "Missing",
+        "missing_file": "⚠ Game file not found",
+        "open_store": "Open store page",
+        "open_homepage": "Open homepage",
+        "untitled_game": "Untitled game",
+        "game": "Game",
+        "launch": "Launch",
+        "launch_tip": "Launch the game",
+        "delete": "Delete",
+        "delete_tip": "Remove the game from the library",
+        "add_game": "Add game",
+        "add_game_tip": "Add a new game to the library",
+        "scan_folder": "Scan folder",
+        "scan_folder_tip": "Find installed games in a folder and add them in one go",
+        "scanning": "Scanning…",
+        "reset": "Reset",
+        "reset_tip": "Clear the search and refresh the list",
+        "theme_light": "Light mode",
+        "theme_dark": "Dark mode",
+        "theme_tip": "Switch the interface theme",
+        "language_tip": "Switch the interface language",
+        "sort_default": "Sort: default",
+        "sort_name": "Sort: name",
+        "sort_added": "Sort: recently added",
+        "sort_last_played": "Sort: last played",
+        "sort_play_count": "Sort: most played",
+        "sort_play_time": "Sort: longest played",
+        "no_matches": "No matching games.",
+        "warning": "Warning",
+        "error": "Error",
+        "game_name_prompt": "Game name:",
+        "game_path_prompt": "Path/command to launch:",
+        "duplicate_name": "A game with the same name already exists.",
+        "add_failed": "The game could not be added.",
+        "library_not_loaded": "The library has not been loaded yet.",
+        "choose_games_folder": "Choose the games folder",
+        "scan_failed": "The folder could not be scanned.",
+        "scan_done": "Added {count} new games ({seconds:.1f} seconds).",
+        "confirm_delete_title": "Confirm deletion",
+        "confirm_delete": "Delete '{name}'?",
+        "launch_failed": "The game could not be launched.",
+        "launch_preview": "Will launch: {name}\nCommand: {path}",
+        "category_all": "All",
+        "category_action": "Action",
+        "category_adventure": "Adventure",
+        "category_rpg": "RPG",
+        "category_strategy": "Strategy",
+        "category_simulation": "Simulation",
+        "category_sports": "Sports",
+        "category_racing": "Racing",
+        "category_shooter": "Shooter",
+        "category_puzzle": "Puzzle",
+        "category_indie": "Indie",
+        "category_غير محدد": "Unspecified",
+    },
+    "ar": {
+        "app_name": "مشغل الألعاب",
+        "window_title": "مكتبة الألعاب",
+        "settings": "الإعدادات",
+        "search_games": "ابحث عن لعبة…",
+        "search_by_name": "ابحث عن لعبة بالاسم…",
+        "all_categories": "كل الفئات",
+        "library_label": "المكتبة:",
+        "play": "تشغيل",
+        "missing": "مفقود",
+        "missing_file": "⚠ ملف اللعبة غير موجود",
+        "open_store": "فتح صفحة المتجر",
+        "open_homepage": "فتح الموقع الرسمي",
+        "untitled_game": "لعبة بدون اسم",
+        "game": "لعبة",
+        "launch": "تشغيل",
+        "launch_tip": "تشغيل اللعبة",
+        "delete": "حذف",
+        "delete_tip": "حذف اللعبة من المكتبة",
+        "add_game": "إضافة لعبة",
+        "add_game_tip": "إضافة لعبة جديدة إلى المكتبة",
+        "scan_folder": "فحص مجلد",
+        "scan_folder_tip": "اكتشاف الألعاب المثبتة في مجلد وإضافتها دفعة واحدة",
+        "scanning": "جارٍ الفحص…",
+        "reset": "إعادة تعيين",
+        "reset_tip": "مسح البحث وتحديث القائمة",
+        "theme_light": "الوضع الفاتح",
+        "theme_dark": "الوضع الداكن",
+        "theme_tip": "تبديل سمة الواجهة",
+        "language_tip": "تبديل لغة الواجهة",
+        "sort_default": "ترتيب: الافتراضي",
+        "sort_name": "ترتيب: الاسم",
+        "sort_added": "ترتيب: الأحدث إضافة",
+        "sort_last_played": "ترتيب: آخر تشغيل",
+        "sort_play_count": "ترتيب: الأكثر تشغيلاً",
+        "sort_play_time": "ترتيب: الأطول لعباً",
+        "no_matches": "لا توجد ألعاب مطابقة.",
+        "warning": "تحذير",
+        "error": "خطأ",
+        "game_name_prompt": "اسم اللعبة:",
+        "game_path_prompt": "المسار/الأمر للتشغيل:",
+        "duplicate_name": "هناك لعبة بنفس الاسم موجودة بالفعل.",
+        "add_failed": "تعذرت إضافة اللعبة.",
+        "library_not_loaded": "المكتبة لم تُحمّل بعد.",
+        "choose_games_folder": "اختر مجلد الألعاب",
+        "scan_failed": "تعذر فحص المجلد.",
+        "scan_done": "تمت إضافة {count} لعبة جديدة ({seconds:.1f} ثانية).",
+        "confirm_delete_title": "تأكيد الحذف",
+        "confirm_delete": "هل تريد حذف '{name}'؟",
+        "launch_failed": "تعذر تشغيل اللعبة.",
+        "launch_preview": "سيتم تشغيل: {name}\nأمر التشغيل: {path}",
+        "category_all": "الكل",
+        "category_action": "أكشن",
+        "category_adventure": "مغامرات",
+        "category_rpg": "تقمص أدوار",
+        "category_strategy": "استراتيجية",
+        "category_simulation": "محاكاة",
+        "category_sports": "رياضة",
+        "category_racing": "سباقات",
+        "category_shooter": "تصويب",
+        "category_puzzle": "ألغاز",
+        "category_indie": "مستقلة",
+        "category_غير محدد": "غير محدد",
+    },
+}
+
+_compiled: Dict[str, Dict[str, str]] = {}
+
+
+def available_languages() -> List[str]:
+    return list(CATALOGS)
+
+
+def is_rtl(lang: str) -> bool:
+    return lang in RTL_LANGUAGES
+
+
+def compile_catalog(lang: str) -> Dict[str, str]:
+    """The lookup table of a language: English fallbacks merged in, all strings interned."""
+    catalog = _compiled.get(lang)
+    if catalog is None:
+        if lang not in CATALOGS:
+            raise ValueError(f"unknown language: {lang!r} (available: {', '.join(CATALOGS)})")
+        merged = dict(CATALOGS[FALLBACK_LANGUAGE])
+        merged.update(CATALOGS[lang])
+        catalog = _compiled[lang] = {sys.intern(k): sys.intern(v) for k, v in merged.items()}
+    return catalog
+
+
+class Translator(QObject):
+    """
+    Callable translator over the compiled catalogs: t(key) or t(key, **fields) for
+    templates such as "scan_done". Unknown keys return the key itself.
+    """
+    language_changed = Signal(str)
+
+    def __init__(self, lang: str = DEFAULT_LANGUAGE, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._lang = lang
+        self._catalog = compile_catalog(lang)
+        self._categories: Dict[str, str] = {}
+
+    def __call__(self, key: str, **fields) -> str:
+        text = self._catalog.get(key, key)
+        return text.format(**fields) if fields else text
+
+    @property
+    def language(self) -> str:
+        return self._lang
+
+    def is_rtl(self) -> bool:
+        return is_rtl(self._lang)
+
+    def layout_direction(self):
+        return Qt.RightToLeft if self.is_rtl() else Qt.LeftToRight
+
+    def category(self, name: str) -> str:
+        """Label of a category/genre name (memoized; unknown categories show as-is)."""
+        label = self._categories.get(name)
+        if label is None:
+            label = self._categories[name] = self._catalog.get("category_" + name.lower(), name)
+        return label
+
+    def bind(self, retranslate: Callable[[], None], owner: Optional[QObject] = None) -> None:
+        """
+        Call retranslate() after every language switch (widgets update their own text).
+
+        The connection is dropped when `owner` (by default the object retranslate is a
+        method of) is destroyed, so a deleted widget is never called back.
+        """
+        def slot(_lang: str) -> None:
+            retranslate()
+
+        self.language_changed.connect(slot)
+        if owner is None:
+            owner = getattr(retranslate, "__self__", None)
+        if isinstance(owner, QObject):
+            owner.destroyed.connect(lambda *_: self._unbind(slot))
+
+    def _unbind(self, slot: Callable[[str], None]) -> None:
+        try:
+            self.language_changed.disconnect(slot)
+        except (RuntimeError, TypeError):
+            pass  # already disconnected
+
+    def set_language(self, lang: str, app: Optional[QApplication] = None) -> None:
+        """Switch language: one catalog swap, one layout-direction change, one signal."""
+        if lang == self._lang:
+            return
+        self._catalog = compile_catalog(lang)
+        self._lang = lang
+        self._categories = {}
+        self.apply_direction(app)
+        self.language_changed.emit(lang)
+
+    def apply_direction(self, app: Optional[QApplication] = None) -> None:
+        """Set the application layout direction for the active language (mirrors every widget)."""
+        app = app or QApplication.instance()
+        if app is not None:
+            app.setLayoutDirection(self.layout_direction())
+
+
+# Shared translator for the whole UI (created on import; Qt signals need no running app)
+tr = Translator()
@@ -1,68 +1,42 @@
-from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QGridLayout, QApplication,
-    QLabel, QLineEdit, QPushButton, QFrame, QMessageBox, QInputDialog
+import itertools
+import sys
+import threading
+from collections import Counter
+
+from .qt_compat import (
+    QWidget, QVBoxLayout, QHBoxLayout, QApplication, QComboBox,
+    QLabel, QLineEdit, QPushButton, QFrame, QMessageBox, QInputDialog, QFileDialog,
+    Qt, QObject, QEvent, QTimer, QShortcut, QKeySequence, Signal, exec_
 )
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QIcon
-
-QSS_STYLE = """
-/* Global dark theme */
-* { font-family: 'Segoe UI', 'Cairo', sans-serif; }
-QWidget { background-color: #1f2330; color: #e6e6e6; }
-QLineEdit { background: #2a2f3b; border: 1px solid #3a4252; border-radius: 8px; padding: 8px 12px; color: #e6e6e6; }
-QLineEdit:focus { border: 1px solid #4f93ff; }
-QPushButton { background: #2d3443; border: 1px solid #3a4252; border-radius: 8px; padding: 8px 12px; color: #e6e6e6; }
-QPushButton:hover { background: #344055; }
-QPushButton:pressed { background: #2a3344; }
-QScrollArea { border: none; }
-#Toolbar { background: #1c2030; border-bottom: 1px solid #2b3244; }
-#GameCard { background: #242a39; border: 1px solid #353e51; border-radius: 12px; }
-#GameCard:hover { border: 1px solid #4f93ff; }
-#Header { color: #f4f7ff; font-size: 18px; font-weight: 600; }
-#Subtle { color: #b9c0cf; }
-"""
-
-class GameCard(QFrame):
-    """بطاقة لعبة فردية تعرض الاسم والإجراءات."""
-    def __init__(self, game: dict, on_launch, on_delete, parent=None):
-        super().__init__(parent)
-        self.setObjectName("GameCard")
-        self.setMinimumSize(220, 120)
-        self.setMaximumHeight(140)
-        self.game = game
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(8)
-
-        # الاسم
-        name_row = QHBoxLayout()
-        title = QLabel(game.get("name", "لعبة بدون اسم"))
-        title.setObjectName("Header")
-        title.setWordWrap(True)
-        name_row.addWidget(title, 1)
-
-        # زر تشغيل
-        launch_btn = QPushButton("تشغيل")
-        launch_btn.setToolTip("تشغيل اللعبة")
-        launch_btn.clicked.connect(lambda: on_launch(self.game))
-        name_row.addWidget(launch_btn)
-        layout.addLayout(name_row)
-
-        # سطر معلومات/مسار
-        info = QLabel(game.get("path", ""))
-        info.setObjectName("Subtle")
-        info.setWordWrap(True)
-        layout.addWidget(info)
-
-        # أزرار أسفل البطاقة
-        actions = QHBoxLayout()
-        actions.addStretch(1)
-        delete_btn = QPushButton("حذف")
-        delete_btn.setToolTip("حذف اللعبة من المكتبة")
-        delete_btn.clicked.connect(lambda: on_delete(self.game))
-        actions.addWidget(delete_btn)
-        layout.addLayout(actions)
+from ..core.search import normalize
+from .card_view import CardGridView, GameCardData, game_to_card
+from .i18n import LANGUAGE_NAMES, tr
+from . import theme
+
+DEFAULT_DB_PATH = "games.db"
+LOAD_CHUNK_SIZE = 500  # عدد الألعاب المضافة للواجهة في كل دورة من حلقة الأحداث
+
+# خيارات الترتيب: (مفتاح الترجمة، (حقل العرض المرتب، تنازلي)) - None لترتيب البحث/الإضافة
+SORT_OPTIONS = (
+    ("sort_default", None),
+    ("sort_name", ("name", False)),
+    ("sort_added", ("added_date", True)),
+    ("sort_last_played", ("last_played", True)),
+    ("sort_play_count", ("play_count", True)),
+    ("sort_play_time", ("play_time", True)),
+)
+
+
+def _field(game, key, default=""):
+    """قراءة حقل من لعبة سواء كانت قاموساً (بدون مكتبة) أو كائن Game من المكتبة"""
+    if isinstance(game, dict):
+        return game.get(key, default)
+    return getattr(game, key, default)
+
+
+class _ScanSignals(QObject):
+    """نقل نتيجة الفحص من الخيط الخلفي إلى خيط الواجهة"""
+    finished = Signal(object)
 
 
 class MainWindow(QWidget):
@@ -70,26 +44,41 @@ class MainWindow(QWidget):
     نافذة مكتبة الألعاب (واجهة رئيسية)
 
     الميزات:
-    - وضع داكن عبر QSS_STYLE
-    - شريط علوي: حقل بحث، إضافة لعبة، إعادة تعيين
-    - عرض كبطاقات شبكة مع تمرير
-    - وظائف: بحث، إضافة، حذف (على مستوى الواجهة)
+    - وضع داكن أو فاتح عبر ui/theme.py (ورقة أنماط واحدة على مستوى التطبيق)
+    - العربية أو الإنجليزية عبر ui/i18n.py: التبديل يعيد ترجمة النوافذ والبطاقات الحالية في مكانها
+    - شريط علوي: حقل بحث، ترتيب، إضافة لعبة، إعادة تعيين
+    - شبكة البطاقات CardGridView (ui/card_view.py): نموذج Qt يرسم البطاقات الظاهرة فقط،
+      فلا تُنشأ عناصر لكل لعبة؛ البحث والفئات والملفات المفقودة من الشبكة نفسها
+    - الترتيب من عروض المكتبة المرتبة (core/views.py): مؤشر اللعبة في العرض مفتاح ترتيب بطاقتها
+    - وظائف: بحث، إضافة، حذف (من قائمة البطاقة بالزر الأيمن)
 
     ملاحظات التكامل مع المشروع:
-    - يفترض أن هناك مدير ألعاب خارجي يمكن ربطه لاحقاً.
-      حالياً نخزن قائمة الألعاب محلياً self.games.
-    - دوال on_add_game, on_delete_game, on_launch_game قابلة للتوصيل مع backend.
+    - يمكن ربط مكتبة ألعاب (GameLibrary) عبر load_library بعد ظهور النافذة،
+      وتُضاف الألعاب للشبكة تدريجياً (self.games تحمل كائنات Game نفسها دون نسخ).
+      بدونها نخزن قائمة الألعاب محلياً كقواميس في self.games.
+    - self.games وبطاقات الشبكة بنفس الترتيب: موقع اللعبة هو رقم بطاقتها في الشبكة.
+    - دوال on_add_game, on_delete_game, on_launch_game تستخدم المكتبة إن وُجدت.
     """
 
-    def __init__(self, games=None):
+    def __init__(self, games=None, library=None, t=tr):
         super().__init__()
-        self.setWindowTitle("مكتبة الألعاب")
-        self.setStyleSheet(QSS_STYLE)
+        self.library = library
+        self.t = t
+        self._db_path = DEFAULT_DB_PATH
+        self._profiler = None  # قياس الإقلاع حتى انتهاء تحميل المكتبة
+        self._scan_signals = _ScanSignals(self)
+        self._scan_signals.finished.connect(self._on_scan_finished)
+        # الأنماط تُطبق مرة واحدة على التطبيق (theme.apply_theme) وليس لكل بطاقة
         self.resize(980, 640)
 
         # بيانات أولية
-        self.games = list(games) if games else []  # [{"name": ..., "path": ...}]
-        self.filtered = list(self.games)
+        self.games = []  # [{"name": ..., "path": ...}] أو كائنات Game، بترتيب بطاقات الشبكة
+        # فهرس الأسماء الموحدة لمنع التكرار دون المرور على كل الألعاب
+        # (للألعاب بلا مكتبة فقط؛ مع المكتبة يُستخدم فهرس أسمائها)
+        self._name_keys = Counter()
+        self._positions = None  # {مفتاح اللعبة: موقعها في self.games}، يُبنى عند أول بحث
+        self._by_ref = {}  # {مفتاح اللعبة أو معرف بطاقتها: اللعبة} لأحداث التشغيل والحذف من الشبكة
+        self._local_ids = itertools.count()  # معرفات بطاقات الألعاب المحلية (بلا مكتبة)
 
         # تخطيط رئيسي عمودي
         root = QVBoxLayout(self)
@@ -104,88 +93,395 @@ class MainWindow(QWidget):
         toolbar_layout.setSpacing(8)
 
         self.search_edit = QLineEdit()
-        self.search_edit.setPlaceholderText("ابحث عن لعبة بالاسم…")
         self.search_edit.textChanged.connect(self.apply_search)
 
-        add_btn = QPushButton("إضافة لعبة")
-        add_btn.setToolTip("إضافة لعبة جديدة إلى المكتبة")
-        add_btn.clicked.connect(self.prompt_add_game)
+        self.add_btn = QPushButton()
+        self.add_btn.clicked.connect(self.prompt_add_game)
 
-        reset_btn = QPushButton("إعادة تعيين")
-        reset_btn.setToolTip("مسح البحث وتحديث القائمة")
-        reset_btn.clicked.connect(self.reset_filters)
+        self.scan_btn = QPushButton()
+        self.scan_btn.clicked.connect(self.prompt_scan_folder)
+        self._scanning = False
 
-        toolbar_layout.addWidget(QLabel("المكتبة:"))
-        toolbar_layout.addWidget(self.search_edit, 1)
-        toolbar_layout.addWidget(add_btn)
-        toolbar_layout.addWidget(reset_btn)
-        root.addWidget(toolbar)
+        self.theme_btn = QPushButton()
+        self.theme_btn.clicked.connect(self.toggle_theme)
+
+        # زر اللغة يعرض اسم اللغة الأخرى؛ التبديل يعيد ترجمة الواجهة الحالية في مكانها
+        self.lang_btn = QPushButton()
+        self.lang_btn.clicked.connect(self.toggle_language)
 
-        # منطقة التمرير لبطاقات الألعاب
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # الترتيب من عروض المكتبة المرتبة (متاح بعد ربط المكتبة)
+        self.sort_combo = QComboBox()
+        for key, order in SORT_OPTIONS:
+            self.sort_combo.addItem(key, order)
+        self.sort_combo.setEnabled(self.library is not None)
+        self.sort_combo.currentIndexChanged.connect(self._on_sort_changed)
 
-        self.cards_container = QWidget()
-        self.grid = QGridLayout(self.cards_container)
-        self.grid.setContentsMargins(4, 4, 4, 4)
-        self.grid.setHorizontalSpacing(12)
-        self.grid.setVerticalSpacing(12)
-        self.scroll.setWidget(self.cards_container)
-        root.addWidget(self.scroll, 1)
+        self.reset_btn = QPushButton()
+        self.reset_btn.clicked.connect(self.reset_filters)
 
+        self.library_label = QLabel()
+        toolbar_layout.addWidget(self.library_label)
+        toolbar_layout.addWidget(self.search_edit, 1)
+        toolbar_layout.addWidget(self.sort_combo)
+        toolbar_layout.addWidget(self.add_btn)
+        toolbar_layout.addWidget(self.scan_btn)
+        toolbar_layout.addWidget(self.theme_btn)
+        toolbar_layout.addWidget(self.lang_btn)
+        toolbar_layout.addWidget(self.reset_btn)
+        root.addWidget(toolbar)
+
+        # شبكة البطاقات: البحث من حقل الشريط العلوي بدلاً من حقل الشبكة
+        # الفلترة مؤجلة (ضغطات المفاتيح المتتالية = بحث واحد) والنتائج مرتبة حسب جودة المطابقة
+        # (تتحمل الأخطاء الإملائية والكتابة بالعربية أو اللاتينية) ثم حداثة آخر تشغيل
+        self.cards = CardGridView(t, deletable=True)
+        self.cards.search.hide()
+        self.filter = self.cards.filter
+        self.cards.play_requested.connect(self._on_play_requested)
+        self.cards.delete_requested.connect(self._on_delete_requested)
+        self.cards.loading_finished.connect(self._on_loading_finished)
+        self.cards.model.modelReset.connect(self._sync_empty)
+        self.cards.model.rowsInserted.connect(self._sync_empty)
+
+        # تنبيه "لا توجد ألعاب مطابقة" عندما لا تعرض الشبكة أي بطاقة
+        self._empty_label = QLabel()
+        self._empty_label.setObjectName("Subtle")
+        self._empty_label.setAlignment(Qt.AlignCenter)
+        root.addWidget(self._empty_label)
+        root.addWidget(self.cards, 1)
+
+        # لوحة قياسات الأداء (F12)، تُنشأ عند أول استخدام
+        self._metrics_overlay = None
+        metrics_shortcut = QShortcut(QKeySequence("F12"), self)
+        metrics_shortcut.activated.connect(self.toggle_metrics_overlay)
+
+        self.retranslate()
+        if hasattr(self.t, "bind"):
+            self.t.bind(self.retranslate, self)
+
+        if library is not None:
+            self._attach_library()
         # أول عرض
-        self.refresh_cards()
+        self._set_games(games or [])
+
+    def retranslate(self):
+        """
+        تطبيق اللغة الحالية على الواجهة الموجودة: النصوص تُستبدل في مكانها
+        (الشبكة تعيد ترجمة نفسها) واتجاه التخطيط يأتي من التطبيق، دون إعادة بناء الشبكة
+        """
+        t = self.t
+        self.setWindowTitle(t("window_title"))
+        self.library_label.setText(t("library_label"))
+        self.search_edit.setPlaceholderText(t("search_by_name"))
+        self.add_btn.setText(t("add_game"))
+        self.add_btn.setToolTip(t("add_game_tip"))
+        self.scan_btn.setText(t("scanning") if self._scanning else t("scan_folder"))
+        self.scan_btn.setToolTip(t("scan_folder_tip"))
+        self.reset_btn.setText(t("reset"))
+        self.reset_btn.setToolTip(t("reset_tip"))
+        for i, (key, _order) in enumerate(SORT_OPTIONS):
+            self.sort_combo.setItemText(i, t(key))
+        self._sync_theme_button()
+        self._sync_language_button()
+        self._empty_label.setText(t("no_matches"))
+
+    def toggle_language(self):
+        """التبديل بين العربية والإنجليزية (مع اتجاه التخطيط) دون إعادة إنشاء البطاقات"""
+        if hasattr(self.t, "set_language"):
+            self.t.set_language("en" if self.t.language == "ar" else "ar")
+
+    def _sync_language_button(self):
+        language = getattr(self.t, "language", None)
+        self.lang_btn.setVisible(language is not None)
+        if language is not None:
+            self.lang_btn.setText(LANGUAGE_NAMES["en" if language == "ar" else "ar"])
+            self.lang_btn.setToolTip(self.t("language_tip"))
+
+    def toggle_metrics_overlay(self):
+        """إظهار/إخفاء زمن العمليات (p50/p99) فوق النافذة"""
+        if self._metrics_overlay is None:
+            from .metrics_overlay import MetricsOverlay
+            self._metrics_overlay = MetricsOverlay(self)
+        self._metrics_overlay.toggle()
+
+    def toggle_theme(self):
+        """التبديل بين الوضع الداكن والفاتح في تمريرة واحدة"""
+        theme.apply_theme("light" if theme.current_theme() == "dark" else "dark")
+        self._sync_theme_button()
+
+    def _sync_theme_button(self):
+        dark = theme.current_theme() == "dark"
+        self.theme_btn.setText(self.t("theme_light") if dark else self.t("theme_dark"))
+        self.theme_btn.setToolTip(self.t("theme_tip"))
 
     # ========== وظائف البيانات ==========
     def apply_search(self):
-        term = self.search_edit.text().strip().lower()
-        if not term:
-            self.filtered = list(self.games)
+        self.filter.set_query(self.search_edit.text())
+
+    def _sync_empty(self, *_args):
+        self._empty_label.setVisible(self.cards.model.rowCount() == 0)
+
+    def _on_sort_changed(self, _index):
+        order = self.sort_combo.currentData()
+        if order is None or self.library is None:
+            self.cards.set_sort(None)
+            return
+        order_by, descending = order
+        # مؤشر اللعبة في عرض المكتبة المرتب مفتاح جاهز: لا تُرتب كل الألعاب في الواجهة
+        cursor = self.library.view(order_by).cursor
+        self.cards.set_sort(lambda card: cursor(card.key), descending)
+
+    def load_library(self, db_path=DEFAULT_DB_PATH, profiler=None, chunk_size=LOAD_CHUNK_SIZE):
+        """
+        تحميل مكتبة الألعاب بعد ظهور النافذة وإضافة الألعاب للشبكة على دفعات
+
+        الملف يُقرأ تدريجياً (دفعة لكل دورة من حلقة الأحداث) فتظهر أول الألعاب
+        دون انتظار تحميل المكتبة كاملة. الاستيراد مؤجل هنا حتى لا يبطئ إقلاع الواجهة.
+        """
+        from ..core.library import GameLibrary
+        from ..database.sqlite_storage import open_sqlite_storage
+
+        self._db_path = db_path
+        self._profiler = profiler
+        # SQLite: كل تعديل upsert للعبة واحدة بدلاً من إعادة كتابة الملف (ملف pickle القديم يُرحّل مرة واحدة)
+        self.library = GameLibrary(open_sqlite_storage(db_path), autoload=False)
+        self._attach_library()
+        # ألعاب المكتبة تحل محل أي قائمة محلية سابقة
+        self.games = []
+        self._positions = None
+        self._by_ref = {}
+        stream = self.library.iter_load(chunk_size)
+
+        def chunks():
+            # كل دفعة تُقرأ من القرص وتُفهرس ثم تُعرض (دفعة لكل دورة من حلقة الأحداث) قبل قراءة التالية
+            if profiler is not None:
+                with profiler.measure("load first chunk"):
+                    games = next(stream, None)
+                if games is None:
+                    return
+                yield self._track_games(games)
+                profiler.mark("first games shown")
+            for games in stream:
+                yield self._track_games(games)
+
+        self.cards.load_stream(chunks())
+
+    def _attach_library(self):
+        """ربط الشبكة بخدمات المكتبة: صحة المسارات، الترتيب وفهرس البحث"""
+        # نتائج فحص المسارات في الخلفية (مثل لعبة أضيفت للتو) تُحدّث البطاقات
+        self.cards.set_path_health(self.library.path_health)
+        self.sort_combo.setEnabled(True)
+        # فهرس بحث المكتبة يُستخدم مباشرة بدلاً من بناء فهرس ثانٍ في الواجهة
+        self.filter.set_search_provider(self._library_search)
+
+    def _on_loading_finished(self):
+        if self.library is None:
+            return
+        # فحص كل الملفات في الخلفية؛ البطاقات تتحدث عند وصول النتائج
+        self.library.check_paths(watch=True)
+        profiler, self._profiler = self._profiler, None
+        if profiler is not None:
+            profiler.mark("library shown (interactive)")
+            profiler.report(interactive_mark="library shown (interactive)")
+
+    def _to_card(self, game):
+        """بيانات بطاقة لعبة (كائن Game من المكتبة أو قاموس محلي) مع تسجيلها لأحداث الشبكة"""
+        if isinstance(game, dict):
+            card = GameCardData(
+                id=f"local-{next(self._local_ids)}",
+                title=game.get("name", ""),
+                image_path="",
+                category=game.get("genre") or "All",
+                executable=game.get("path") or None,
+            )
+            self._by_ref[card.id] = game
         else:
-            self.filtered = [g for g in self.games if term in g.get("name", "").lower()]
-        self.refresh_cards()
+            card = game_to_card(game)
+            self._by_ref[card.key] = game
+        return card
+
+    def _track_games(self, games):
+        """
+        إلحاق ألعاب بالقائمة وتحويلها لبطاقات تُلحق بالشبكة بنفس الترتيب
+
+        Returns:
+            list: بطاقات الألعاب
+        """
+        if self._positions is not None:
+            start = len(self.games)
+            self._positions.update((_field(g, "key", None), start + i) for i, g in enumerate(games))
+        self.games.extend(games)
+        if self.library is None:
+            self._name_keys.update(self._name_key(g) for g in games)
+        return [self._to_card(g) for g in games]
+
+    def _set_games(self, games):
+        """استبدال كل الألعاب وبطاقاتها"""
+        self.games = []
+        self._name_keys = Counter()
+        self._positions = None
+        self._by_ref = {}
+        self.cards.set_cards(self._track_games(games))
+
+    def _append_games(self, games):
+        """إضافة ألعاب للقائمة والشبكة (مثلاً لعبة جديدة أو نتائج فحص) مع فلترة الجديدة فقط"""
+        self.cards.append_cards(self._track_games(games))
+
+    def _library_search(self, text, within=None, prefix_only=False):
+        """
+        نتائج فهرس المكتبة كمواقع في self.games (بنفس ترتيب الأفضلية)
+
+        Args:
+            text: نص البحث
+            within: مواقع يُبحث بينها فقط (نتائج الاستعلام السابق عند تضييقه)
+            prefix_only: الاستعلامات القصيرة تُطابق بدايات الكلمات فقط (أثناء الكتابة)
+
+        Returns:
+            list: مواقع الألعاب المطابقة
+        """
+        if self._positions is None:
+            self._positions = {_field(g, "key", None): i for i, g in enumerate(self.games)}
+        positions = self._positions
+        if within is not None:
+            within = {_field(self.games[i], "key", None) for i in within}
+        games = self.library.search_games(text, within=within, prefix_only=prefix_only)
+        return [positions[g.key] for g in games if g.key in positions]
+
+    def _on_play_requested(self, ref):
+        game = self._by_ref.get(ref)
+        if game is not None:
+            self.on_launch_game(game)
+
+    def _on_delete_requested(self, ref):
+        game = self._by_ref.get(ref)
+        if game is not None:
+            self.on_delete_game(game)
+
+    def closeEvent(self, event):
+        if self.library is not None:
+            # خيوط فحص المسارات لا ترسل للشبكة بعد إغلاق النافذة
+            self.cards.set_path_health(None)
+            self.library.close()
+        super().closeEvent(event)
 
     def reset_filters(self):
         self.search_edit.clear()
-        self.filtered = list(self.games)
-        self.refresh_cards()
+        self.filter.run_now()
 
     def prompt_add_game(self):
         """حوار بسيط لإدخال اسم اللعبة ومسارها (بدون حوارات ملفات لإبقاء الاعتماديات بسيطة)."""
-        name, ok = QInputDialog.getText(self, "إضافة لعبة", "اسم اللعبة:")
+        name, ok = QInputDialog.getText(self, self.t("add_game"), self.t("game_name_prompt"))
         if not ok or not name.strip():
             return
-        path, ok2 = QInputDialog.getText(self, "إضافة لعبة", "المسار/الأمر للتشغيل:")
+        path, ok2 = QInputDialog.getText(self, self.t("add_game"), self.t("game_path_prompt"))
         if not ok2 or not path.strip():
             return
         self.on_add_game({"name": name.strip(), "path": path.strip()})
 
+    def prompt_scan_folder(self):
+        """اختيار مجلد ألعاب وفحصه في الخلفية (مع مجلدات Steam و GOG و Epic إن وجدت)"""
+        if self.library is None:
+            QMessageBox.information(self, self.t("scan_folder"), self.t("library_not_loaded"))
+            return
+        folder = QFileDialog.getExistingDirectory(self, self.t("choose_games_folder"))
+        if not folder:
+            return
+        from ..core.scanner import LibraryScanner, default_store_locations
+
+        stores = default_store_locations()
+        scanner = LibraryScanner(
+            self.library,
+            roots=[folder],
+            steam_libraries=stores['steam'],
+            gog_roots=stores['gog'],
+            epic_manifest_dirs=stores['epic'],
+            cache_path=self._db_path + ".scan.json",
+        )
+        self._scanning = True
+        self.scan_btn.setEnabled(False)
+        self.scan_btn.setText(self.t("scanning"))
+
+        def run():
+            try:
+                result = scanner.scan()
+            except Exception as e:
+                print(f"خطأ في فحص المجلد: {e}")
+                result = None
+            self._scan_signals.finished.emit(result)
+
+        threading.Thread(target=run, name="library-scan", daemon=True).start()
+
+    def _on_scan_finished(self, result):
+        self._scanning = False
+        self.scan_btn.setEnabled(True)
+        self.scan_btn.setText(self.t("scan_folder"))
+        if result is None:
+            QMessageBox.warning(self, self.t("error"), self.t("scan_failed"))
+            return
+        added = result.added
+        if added:
+            self._append_games(added)
+        QMessageBox.information(
+            self, self.t("scan_folder"),
+            self.t("scan_done", count=len(added), seconds=result.elapsed)
+        )
+
+    @staticmethod
+    def _name_key(game) -> str:
+        # نفس توحيد فهرس أسماء المكتبة (find_by_name)
+        return normalize(_field(game, "name"))
+
+    def _has_name(self, game) -> bool:
+        """هل توجد لعبة بنفس الاسم (فهرس أسماء المكتبة، أو الفهرس المحلي دون مكتبة)"""
+        if self.library is not None:
+            return bool(self.library.find_by_name(_field(game, "name")))
+        return bool(self._name_keys[self._name_key(game)])
+
     # Hooks قابلة للتخصيص/الربط مع منظومة المشروع
     def on_add_game(self, game: dict):
         """إضافة لعبة للقائمة وتحديث العرض. استبدل المنطق هنا بحفظ دائم إذا لزم."""
         # منع تكرار الاسم البسيط
-        if any(g.get("name", "").strip().lower() == game.get("name", "").strip().lower() for g in self.games):
-            QMessageBox.warning(self, "تحذير", "هناك لعبة بنفس الاسم موجودة بالفعل.")
+        if self._has_name(game):
+            QMessageBox.warning(self, self.t("warning"), self.t("duplicate_name"))
             return
-        self.games.append(game)
-        self.apply_search()  # سيعيد بناء البطاقات بناءً على البحث الحالي
-
-    def on_delete_game(self, game: dict):
-        reply = QMessageBox.question(self, "تأكيد الحذف", f"هل تريد حذف '{game.get('name','')}'؟")
+        if self.library is not None:
+            added = self.library.add_game(game["name"], game["path"])
+            if added is None:
+                QMessageBox.warning(self, self.t("warning"), self.t("add_failed"))
+                return
+            game = added
+        # بطاقة واحدة تُلحق بالشبكة وتُطابق مع البحث الحالي
+        self._append_games([game])
+
+    def on_delete_game(self, game):
+        reply = QMessageBox.question(
+            self, self.t("confirm_delete_title"), self.t("confirm_delete", name=_field(game, "name"))
+        )
         if reply != QMessageBox.Yes:
             return
-        try:
-            self.games.remove(game)
-        except ValueError:
-            pass
-        self.apply_search()
-
-    def on_launch_game(self, game: dict):
-        """تشغيل اللعبة. حالياً يعرض رسالة، ويمكن ربطه لاحقاً بتنفيذ فعلي."""
-        name = game.get("name", "لعبة")
-        path = game.get("path", "")
-        QMessageBox.information(self, "تشغيل", f"سيتم تشغيل: {name}\nأمر التشغيل: {path}")
+        if self.library is not None and _field(game, "key", None) is not None:
+            self.library.remove_game(game.key)
+        index = next((i for i, g in enumerate(self.games) if g is game), None)
+        if index is None:
+            return
+        del self.games[index]
+        if self.library is None:
+            self._name_keys[self._name_key(game)] -= 1
+        # بطاقات الشبكة بنفس ترتيب self.games: تُحذف بطاقة اللعبة ويُعاد فهرسة الباقي
+        cards = list(self.cards.model.cards())
+        card = cards.pop(index)
+        self._by_ref.pop(card.id if card.key is None else card.key, None)
+        self._positions = None
+        self.cards.set_cards(cards)
+
+    def on_launch_game(self, game):
+        """تشغيل اللعبة عبر المكتبة (دون حجب الواجهة)، أو عرض رسالة إن لم تُربط مكتبة."""
+        if self.library is not None and _field(game, "key", None) is not None:
+            if not self.library.launch_game(game.key):
+                QMessageBox.warning(self, self.t("error"), self.t("launch_failed"))
+            return
+        name = _field(game, "name") or self.t("game")
+        path = _field(game, "path")
+        QMessageBox.information(self, self.t("launch"), self.t("launch_preview", name=name, path=path))
         # مثال للتشغيل الحقيقي لاحقاً:
         # import subprocess, shlex
         # try:
@@ -193,37 +489,54 @@ class MainWindow(QWidget):
         # except Exception as e:
         #     QMessageBox.critical(self, "خطأ", str(e))
 
-    # ========== بناء الواجهة ==========
-    def refresh_cards(self):
-        # تنظيف الشبكة
-        for i in reversed(range(self.grid.count())):
-            w = self.grid.itemAt(i).widget()
-            if w is not None:
-                w.setParent(None)
-                w.deleteLater()
-
-        # إنشاء بطاقات جديدة
-        if not self.filtered:
-            empty = QLabel("لا توجد ألعاب مطابقة.")
-            empty.setObjectName("Subtle")
-            empty.setAlignment(Qt.AlignCenter)
-            self.grid.addWidget(empty, 0, 0)
-            return
 
-        cols = 3  # أعمدة البطاقة
-        row = col = 0
-        for game in self.filtered:
-            card = GameCard(game, self.on_launch_game, self.on_delete_game)
-            self.grid.addWidget(card, row, col)
-            col += 1
-            if col >= cols:
-                col = 0
-                row += 1
+class _FirstPaintWatcher(QObject):
+    """يسجل لحظة أول رسم للنافذة ثم يبدأ تحميل المكتبة"""
+
+    def __init__(self, on_first_paint, parent=None):
+        super().__init__(parent)
+        self._on_first_paint = on_first_paint
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self._on_first_paint is not None:
+            callback, self._on_first_paint = self._on_first_paint, None
+            obj.removeEventFilter(self)
+            # بعد انتهاء الرسم الحالي
+            QTimer.singleShot(0, callback)
+        return False
+
+
+def run_application(db_path=DEFAULT_DB_PATH, profiler=None, theme_name=theme.DEFAULT_THEME,
+                    language=None):
+    """
+    تشغيل التطبيق: إظهار النافذة أولاً ثم تحميل المكتبة بعد أول رسم
+
+    Args:
+        db_path: مسار قاعدة بيانات الألعاب
+        profiler: StartupProfiler اختياري لقياس زمن الإقلاع
+        theme_name: سمة الواجهة ("dark" أو "light")
+        language: لغة الواجهة ("ar" أو "en")، الافتراضي العربية
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    theme.apply_theme(theme_name, app)
+    tr.set_language(language or tr.language, app)
+    tr.apply_direction(app)
+    window = MainWindow()
+
+    def on_first_paint():
+        if profiler is not None:
+            profiler.mark("first paint")
+        window.load_library(db_path, profiler=profiler)
+
+    window.installEventFilter(_FirstPaintWatcher(on_first_paint, window))
+    window.show()
+    if profiler is not None:
+        profiler.mark("window shown")
+    return exec_(app)
 
 
-# اختباري محلي فقط
+# اختباري محلي فقط: python -m src.ui.main_window
 if __name__ == "__main__":
-    import sys
     sample = [
         {"name": "Chess", "path": "chess.exe"},
         {"name": "Sudoku", "path": "sudoku.exe"},
@@ -231,6 +544,8 @@ if __name__ == "__main__":
         {"name": "Pacman", "path": "pacman.exe"},
     ]
     app = QApplication(sys.argv)
+    theme.apply_theme(app=app)
+    tr.apply_direction(app)
     w = MainWindow(sample)
     w.show()
-    sys.exit(app.exec_())
+    sys.exit(exec_(app))
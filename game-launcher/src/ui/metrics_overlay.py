@@ -0,0 +1,50 @@
+"""
+ui/metrics_overlay.py
+Debug overlay that shows live p50/p99 latencies from src.utils.metrics.
+
+- Attach to any widget: MetricsOverlay(parent).toggle() shows/hides it in the top-left corner.
+- Refreshes once per second while visible; does nothing while hidden.
+- When metrics are disabled it says so instead of showing an empty table.
+"""
+from __future__ import annotations
+from typing import Optional
+
+from ..utils import metrics
+from .qt_compat import Qt, QTimer, QFont, QLabel, QWidget
+
+REFRESH_MS = 1000
+
+
+class MetricsOverlay(QLabel):
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        font = QFont("monospace")
+        font.setStyleHint(QFont.TypeWriter)
+        font.setPointSize(9)
+        self.setFont(font)
+        self.setTextFormat(Qt.PlainText)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setObjectName("MetricsOverlay")  # colors from the app stylesheet (ui/theme.py)
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def toggle(self, visible: Optional[bool] = None):
+        visible = not self.isVisible() if visible is None else visible
+        if visible:
+            self.refresh()
+            self.show()
+            self.raise_()
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self.hide()
+
+    def refresh(self):
+        if metrics.is_enabled():
+            self.setText(metrics.report())
+        else:
+            self.setText("metrics disabled (run with --metrics or GAME_LAUNCHER_METRICS=1)")
+        self.adjustSize()
+        self.move(8, 8)
@@ -5,14 +5,18 @@ Top navigation bar with brand, language switch (ar/en), category quick filters,
 Expansion guide:
 - Add more actions (e.g., Settings, Downloads) by appending QAction buttons.
 - i18n keys central; use translator callable t(key) for all user-visible strings.
+- With a ui.i18n.Translator, picking a language switches it and retranslate() updates the
+  existing widgets in place (text, category labels, selected language); nothing is rebuilt.
+- set_categories() rebuilds the quick filter only when the category set changes; live counts
+  (e.g. from CardGridView.facets) go through set_category_counts(), which only relabels items.
 - Emits signals that parent windows can connect to for filtering and language changes.
+- No per-widget stylesheet: colors come from the app-wide theme (ui/theme.py).
 """
 from __future__ import annotations
 from typing import Callable
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox
-
-from PySide6.QtGui import QAction
+from .qt_compat import Signal, QWidget, QHBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox
+from .filtering import Debouncer
+from .i18n import LANGUAGE_NAMES
 
 class NavBar(QWidget):
     # Signals to communicate with main window
@@ -23,20 +27,17 @@ class NavBar(QWidget):
     def __init__(self, t: Callable[[str], str]):
         super().__init__()
         self.t = t
+        self._categories: list[str] = []  # categories in the quick filter (without "All")
+        self._counts: dict = {}  # category -> count shown next to it ("All" for the total)
         self._build()
+        # Live switching when t is a ui.i18n.Translator; a plain callable only gets the signal
+        if hasattr(t, "set_language"):
+            self.language_changed.connect(t.set_language)
+            t.bind(self.retranslate, self)
 
     def _build(self):
+        # Styled by the application stylesheet (ui/theme.py) via #NavBar / #Brand
         self.setObjectName("NavBar")
-        self.setStyleSheet(
-            """
-            QWidget#NavBar { background:#0b0f14; }
-            QLabel#Brand { color:#e6eaf0; font-weight:700; }
-            QLineEdit { background:#141a22; border:1px solid #273142; border-radius:8px; padding:6px 10px; color:#e6eaf0; }
-            QPushButton { background:#1a212b; color:#e6eaf0; border:1px solid #273142; border-radius:8px; padding:6px 10px; }
-            QPushButton:hover { border-color:#4cc2ff; }
-            QComboBox { background:#141a22; color:#e6eaf0; border:1px solid #273142; border-radius:8px; padding:6px 10px; }
-            """
-        )
         h = QHBoxLayout(self)
         h.setContentsMargins(12, 12, 12, 12)
         h.setSpacing(8)
@@ -46,36 +47,80 @@ class NavBar(QWidget):
 
         self.search = QLineEdit()
         self.search.setPlaceholderText(self.t("search_games"))
-        self.search.textChanged.connect(self.search_changed)
+        # Coalesce keystrokes: search_changed fires once typing pauses
+        self._search_debounce = Debouncer(parent=self)
+        self._search_debounce.triggered.connect(self.search_changed.emit)
+        self.search.textChanged.connect(self._search_debounce.push)
 
         self.quick_category = QComboBox()
         self.quick_category.addItem(self.t("all_categories"), "All")
         self.quick_category.currentIndexChanged.connect(lambda: self.category_changed.emit(self.quick_category.currentData()))
 
         self.lang = QComboBox()
-        self.lang.addItem("العربية", "ar")
-        self.lang.addItem("English", "en")
+        for code, name in LANGUAGE_NAMES.items():
+            self.lang.addItem(name, code)
+        self._sync_language()
         self.lang.currentIndexChanged.connect(lambda: self.language_changed.emit(self.lang.currentData()))
 
-        btn_settings = QPushButton(self.t("settings"))
+        self.btn_settings = QPushButton(self.t("settings"))
 
         h.addWidget(self.brand, 0)
         h.addWidget(self.search, 1)
         h.addWidget(self.quick_category, 0)
         h.addWidget(self.lang, 0)
-        h.addWidget(btn_settings, 0)
+        h.addWidget(self.btn_settings, 0)
+
+    def retranslate(self):
+        """Update visible strings in place after a language switch."""
+        self.brand.setText(self.t("app_name"))
+        self.search.setPlaceholderText(self.t("search_games"))
+        self.btn_settings.setText(self.t("settings"))
+        for i in range(self.quick_category.count()):
+            self.quick_category.setItemText(i, self._category_text(self.quick_category.itemData(i)))
+        self._sync_language()
+
+    def _sync_language(self):
+        lang = getattr(self.t, "language", None)
+        index = self.lang.findData(lang) if lang else -1
+        if index >= 0 and index != self.lang.currentIndex():
+            self.lang.blockSignals(True)
+            self.lang.setCurrentIndex(index)
+            self.lang.blockSignals(False)
+
+    def _category_label(self, name: str) -> str:
+        if name == "All":
+            return self.t("all_categories")
+        category = getattr(self.t, "category", None)
+        return category(name) if category is not None else name
+
+    def _category_text(self, name: str) -> str:
+        count = self._counts.get(name)
+        label = self._category_label(name)
+        return label if count is None else f"{label} ({count})"
 
     # Helper for parent to sync categories centrally
-    def set_categories(self, cats: list[str]):
+    def set_categories(self, cats: list[str], counts: dict | None = None):
+        cats = [c for c in cats if c != "All"]
+        if counts is not None:
+            self.set_category_counts(counts)
+        if cats == self._categories:
+            return  # same facet set: leave the dropdown alone
+        self._categories = cats
         current = self.quick_category.currentData()
         self.quick_category.blockSignals(True)
         self.quick_category.clear()
-        self.quick_category.addItem(self.t("all_categories"), "All")
-        for c in cats:
-            if c == "All":
-                continue
-            self.quick_category.addItem(c, c)
+        for c in ["All"] + cats:
+            self.quick_category.addItem(self._category_text(c), c)
         # restore
-        if current in [self.quick_category.itemData(i) for i in range(self.quick_category.count())]:
-            self.quick_category.setCurrentText(current)
+        index = self.quick_category.findData(current)
+        if index >= 0:
+            self.quick_category.setCurrentIndex(index)
         self.quick_category.blockSignals(False)
+
+    def set_category_counts(self, counts: dict):
+        """Show live counts next to categories; only items whose count changed are relabeled."""
+        old, self._counts = self._counts, dict(counts)
+        for i in range(self.quick_category.count()):
+            c = self.quick_category.itemData(i)
+            if old.get(c) != self._counts.get(c):
+                self.quick_category.setItemText(i, self._category_text(c))
@@ -0,0 +1,55 @@
+"""
+ui/qt_compat.py
+Single place that picks the Qt binding for the whole UI package.
+
+- Honors the QT_API environment variable ("pyside6" or "pyqt5") when set.
+- Otherwise reuses whichever binding the process already imported, so no module
+  ever pulls a second binding in; then falls back to PySide6, then PyQt5.
+- Re-exports QtCore/QtGui/QtWidgets names plus Signal/Slot, and smooths over the
+  few API differences the UI uses (event positions, exec vs exec_).
+"""
+from __future__ import annotations
+import os
+import sys
+
+
+def _select_api() -> str:
+    requested = os.environ.get("QT_API", "").lower()
+    if requested in ("pyside6", "pyqt5"):
+        return requested
+    if "PySide6.QtCore" in sys.modules:
+        return "pyside6"
+    if "PyQt5.QtCore" in sys.modules:
+        return "pyqt5"
+    try:
+        import PySide6.QtCore  # noqa: F401
+        return "pyside6"
+    except ImportError:
+        return "pyqt5"
+
+
+QT_API = _select_api()
+
+if QT_API == "pyside6":
+    from PySide6.QtCore import *  # noqa: F401,F403
+    from PySide6.QtGui import *  # noqa: F401,F403
+    from PySide6.QtWidgets import *  # noqa: F401,F403
+    from PySide6.QtCore import Signal, Slot
+else:
+    from PyQt5.QtCore import *  # noqa: F401,F403
+    from PyQt5.QtGui import *  # noqa: F401,F403
+    from PyQt5.QtWidgets import *  # noqa: F401,F403
+    from PyQt5.QtCore import pyqtSignal as Signal, pyqtSlot as Slot
+
+
+def event_pos(event) -> "QPoint":  # noqa: F405
+    """Mouse event position as a QPoint (Qt6 position() / Qt5 pos())."""
+    if hasattr(event, "position"):
+        return event.position().toPoint()
+    return event.pos()
+
+
+def exec_(obj, *args):
+    """Run obj.exec() (Qt6) or obj.exec_() (Qt5): applications, menus and dialogs."""
+    method = getattr(obj, "exec", None) or getattr(obj, "exec_")
+    return method(*args)
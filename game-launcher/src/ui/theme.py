@@ -0,0 +1,128 @@
+"""
+ui/theme.py
+Central theming: one palette per theme, one stylesheet for the whole application.
+
+- PALETTES holds the color tokens of every theme (dark, light); add a theme by adding a palette.
+- The QSS template is compiled once per theme and installed on the QApplication, so Qt parses
+  it a single time instead of once per widget. Widgets only set object names (#Toolbar, #NavBar...).
+- THEME is the live palette of the active theme, updated in place on switch; painters
+  (e.g. GameCardDelegate) read it, or use color(key) for cached QColor objects.
+- apply_theme(name) switches at runtime in one pass: Qt re-polishes and repaints every widget.
+"""
+from __future__ import annotations
+from string import Template
+from typing import Dict, List, Optional
+
+from .qt_compat import QApplication, QColor
+
+DEFAULT_THEME = "dark"
+
+PALETTES: Dict[str, Dict[str, str]] = {
+    "dark": {
+        "bg": "#0e141b",
+        "surface": "#0b0f14",        # toolbars / nav bar
+        "panel": "#141a22",          # inputs
+        "card": "#1a212b",
+        "border": "#273142",
+        "button": "#1a212b",
+        "button_hover": "#222b38",
+        "button_pressed": "#161c25",
+        "accent": "#4cc2ff",
+        "accent_hover": "#71d2ff",
+        "on_accent": "#0b0f14",      # text drawn on accent / danger fills
+        "placeholder": "#0b0f14",    # image area before the thumbnail arrives
+        "text": "#e6eaf0",
+        "heading": "#f4f7ff",
+        "muted": "#98a2b3",
+        "danger": "#ff5d5d",
+        "overlay_bg": "rgba(0, 0, 0, 200)",
+        "overlay_text": "#b8f5b0",
+    },
+    "light": {
+        "bg": "#f4f6fa",
+        "surface": "#e9edf3",
+        "panel": "#ffffff",
+        "card": "#ffffff",
+        "border": "#cfd6e2",
+        "button": "#ffffff",
+        "button_hover": "#eef2f8",
+        "button_pressed": "#e1e7f0",
+        "accent": "#1a73e8",
+        "accent_hover": "#3b8cf0",
+        "on_accent": "#ffffff",
+        "placeholder": "#dfe4ec",
+        "text": "#1c2430",
+        "heading": "#0f1723",
+        "muted": "#5f6b7a",
+        "danger": "#d93025",
+        "overlay_bg": "rgba(255, 255, 255, 230)",
+        "overlay_text": "#1e5a16",
+    },
+}
+
+_QSS_TEMPLATE = Template(
+    """
+* { font-family: 'Segoe UI', 'Cairo', sans-serif; }
+QWidget { background-color: $bg; color: $text; }
+QLineEdit, QComboBox { background: $panel; border: 1px solid $border; border-radius: 8px; padding: 6px 10px; color: $text; }
+QLineEdit:focus, QComboBox:focus { border: 1px solid $accent; }
+QPushButton { background: $button; border: 1px solid $border; border-radius: 8px; padding: 6px 12px; color: $text; }
+QPushButton:hover { background: $button_hover; border-color: $accent; }
+QPushButton:pressed { background: $button_pressed; }
+QPushButton:disabled { color: $muted; }
+QScrollArea, QListView { border: none; }
+#Toolbar, #NavBar { background: $surface; border-bottom: 1px solid $border; }
+#Brand { font-weight: 700; background: transparent; }
+#Header { color: $heading; font-size: 18px; font-weight: 600; }
+#Subtle { color: $muted; }
+#MetricsOverlay { background: $overlay_bg; color: $overlay_text; padding: 8px; border-radius: 6px; }
+"""
+)
+
+# Live palette of the active theme (mutated in place so importers keep a valid reference)
+THEME: Dict[str, str] = dict(PALETTES[DEFAULT_THEME])
+
+_current = DEFAULT_THEME
+_compiled: Dict[str, str] = {}
+_colors: Dict[str, QColor] = {}
+
+
+def available_themes() -> List[str]:
+    return list(PALETTES)
+
+
+def current_theme() -> str:
+    return _current
+
+
+def stylesheet(name: str = DEFAULT_THEME) -> str:
+    """The application stylesheet for a theme, compiled on first use."""
+    qss = _compiled.get(name)
+    if qss is None:
+        qss = _compiled[name] = _QSS_TEMPLATE.substitute(PALETTES[name])
+    return qss
+
+
+def color(key: str) -> QColor:
+    """QColor for a palette token of the active theme (cached until the next switch)."""
+    c = _colors.get(key)
+    if c is None:
+        c = _colors[key] = QColor(THEME[key])
+    return c
+
+
+def apply_theme(name: str = DEFAULT_THEME, app: Optional[QApplication] = None) -> None:
+    """
+    Install a theme on the application. Switching is a single setStyleSheet call on the
+    QApplication; Qt re-polishes and repaints all widgets, including delegate-painted cards.
+    """
+    global _current
+    if name not in PALETTES:
+        raise ValueError(f"unknown theme: {name!r} (available: {', '.join(PALETTES)})")
+    app = app or QApplication.instance()
+    _current = name
+    THEME.clear()
+    THEME.update(PALETTES[name])
+    _colors.clear()
+    if app is not None:
+        app.setStyleSheet(stylesheet(name))
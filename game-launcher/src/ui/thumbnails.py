@@ -0,0 +1,183 @@
+"""
+ui/thumbnails.py
+Asynchronous thumbnail pipeline for game card images.
+
+- Images are decoded and scaled to card size on a QThreadPool (QImage is safe off the GUI thread).
+- Ready thumbnails live in an LRU memory cache bounded by bytes.
+- Pre-scaled thumbnails are also written to an on-disk cache keyed by path + mtime + size,
+  so the next launch skips decoding the full-size artwork.
+- Callers ask get(path): a pixmap when ready, otherwise None (draw a placeholder) and
+  thumbnail_ready(path) fires once the image arrives.
+"""
+from __future__ import annotations
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Optional, Set
+
+from ..utils import metrics
+from .qt_compat import Qt, QSize, QObject, QRunnable, QThreadPool, QStandardPaths, Signal, QImage, QPixmap
+
+THUMBNAIL_SIZE = QSize(240, 135)  # matches the 16:9 card image
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_cache_dir() -> str:
+    base = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".cache", "game-launcher")
+    return os.path.join(base, "thumbnails")
+
+
+def scale_to_thumbnail(image: QImage, size: QSize = THUMBNAIL_SIZE) -> QImage:
+    """Scale to cover `size` and center-crop, like KeepAspectRatioByExpanding on the card."""
+    scaled = image.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    x = max(0, (scaled.width() - size.width()) // 2)
+    y = max(0, (scaled.height() - size.height()) // 2)
+    return scaled.copy(x, y, size.width(), size.height())
+
+
+class PixmapLRUCache:
+    """LRU cache of pixmaps whose total size is bounded in bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._items: "OrderedDict[str, QPixmap]" = OrderedDict()
+
+    @staticmethod
+    def _cost(pix: QPixmap) -> int:
+        return pix.width() * pix.height() * max(1, pix.depth() // 8)
+
+    def get(self, key: str) -> Optional[QPixmap]:
+        pix = self._items.get(key)
+        if pix is not None:
+            self._items.move_to_end(key)
+        return pix
+
+    def put(self, key: str, pix: QPixmap):
+        self.discard(key)
+        self._items[key] = pix
+        self.total_bytes += self._cost(pix)
+        while self.total_bytes > self.max_bytes and len(self._items) > 1:
+            _, old = self._items.popitem(last=False)
+            self.total_bytes -= self._cost(old)
+
+    def discard(self, key: str):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.total_bytes -= self._cost(old)
+
+    def clear(self):
+        self._items.clear()
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class _ThumbnailSignals(QObject):
+    loaded = Signal(str, QImage)  # source path, thumbnail (null on failure)
+
+
+class _ThumbnailTask(QRunnable):
+    def __init__(self, path: str, size: QSize, cache_dir: Optional[str], signals: _ThumbnailSignals):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.cache_dir = cache_dir
+        self.signals = signals
+
+    def _disk_path(self) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        raw = f"{os.path.abspath(self.path)}|{st.st_mtime_ns}|{st.st_size}|{self.size.width()}x{self.size.height()}"
+        return os.path.join(self.cache_dir, hashlib.sha1(raw.encode("utf-8")).hexdigest() + ".png")
+
+    def run(self):
+        with metrics.timer("ui.thumbnail.load"):
+            image = self._load()
+        self.signals.loaded.emit(self.path, image)
+
+    def _load(self) -> QImage:
+        image = QImage()
+        disk_path = self._disk_path()
+        if disk_path and os.path.exists(disk_path):
+            image = QImage(disk_path)
+            if not image.isNull():
+                metrics.count("ui.thumbnail.disk_hit")
+        if image.isNull():
+            src = QImage(self.path)
+            if not src.isNull():
+                image = scale_to_thumbnail(src, self.size)
+                if disk_path:
+                    try:
+                        os.makedirs(self.cache_dir, exist_ok=True)
+                        tmp = disk_path + ".tmp.png"
+                        if image.save(tmp, "PNG"):
+                            os.replace(tmp, disk_path)
+                    except OSError:
+                        pass
+        return image
+
+
+class ThumbnailService(QObject):
+    """Loads card thumbnails off the GUI thread and caches them in memory and on disk."""
+    thumbnail_ready = Signal(str)  # source path
+
+    def __init__(
+        self,
+        size: QSize = THUMBNAIL_SIZE,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        cache_dir: Optional[str] = None,
+        max_threads: Optional[int] = None,
+        parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self.size = size
+        self.cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+        self.cache = PixmapLRUCache(max_bytes)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads or max(2, QThreadPool.globalInstance().maxThreadCount() - 1))
+        self._pending: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._signals = _ThumbnailSignals()
+        self._signals.loaded.connect(self._on_loaded)
+
+    def get(self, path: str) -> Optional[QPixmap]:
+        """Return the thumbnail if ready; otherwise schedule it and return None."""
+        if not path:
+            return None
+        pix = self.cache.get(path)
+        if pix is None:
+            metrics.count("ui.thumbnail.memory_miss")
+            self.request(path)
+        return pix
+
+    def request(self, path: str):
+        if not path or path in self._pending or path in self._failed:
+            return
+        self._pending.add(path)
+        self.pool.start(_ThumbnailTask(path, self.size, self.cache_dir, self._signals))
+
+    def invalidate(self, path: Optional[str] = None):
+        """Forget a cached thumbnail (or all of them), e.g. after the artwork changed."""
+        if path is None:
+            self.cache.clear()
+            self._failed.clear()
+        else:
+            self.cache.discard(path)
+            self._failed.discard(path)
+
+    def _on_loaded(self, path: str, image: QImage):
+        # Runs on the GUI thread: QPixmap must not be created elsewhere
+        self._pending.discard(path)
+        if image.isNull():
+            self._failed.add(path)
+            return
+        self.cache.put(path, QPixmap.fromImage(image))
+        self.thumbnail_ready.emit(path)
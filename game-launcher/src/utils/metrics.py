@@ -0,0 +1,245 @@
+# src/utils/metrics.py
+# قياسات المسارات الساخنة (المؤقتات والعدادات)
+"""
+Metrics Module
+طبقة قياس خفيفة للمكتبة والتخزين والواجهة:
+- timed(name): مزخرف يقيس زمن دالة
+- timer(name): سياق يقيس زمن مقطع
+- count(name): عداد
+عند التعطيل (الافتراضي) تكلفة كل استدعاء فحص متغير واحد فقط.
+
+عند التفعيل:
+- سجل داخل العملية يحتفظ بآخر window قياس لكل عملية (p50 / p99 / الأقصى)
+- ملف تتبع اختياري بصيغة JSON lines (سطر لكل قياس)
+- report() لطباعة جدول الأزمنة (أو عرضه في الواجهة)
+
+التفعيل: enable() أو متغيرات البيئة GAME_LAUNCHER_METRICS=1 و GAME_LAUNCHER_TRACE=مسار
+"""
+
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+DEFAULT_WINDOW = 1024  # عدد القياسات المحفوظة لكل عملية
+
+
+class _Series:
+    """قياسات عملية واحدة: نافذة متدحرجة ومجاميع كلية"""
+    __slots__ = ('samples', 'count', 'total')
+
+    def __init__(self, window):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+
+
+def _percentile(ordered, fraction):
+    """النسبة المئوية بطريقة nearest-rank من قائمة مرتبة"""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class MetricsRegistry:
+    """
+    سجل القياسات
+
+    آمن للاستخدام من عدة خيوط (مشرف التشغيل، الحفظ المؤجل، تحميل الصور المصغرة)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.window = DEFAULT_WINDOW
+        self._series = {}  # {الاسم: _Series}
+        self._counters = {}  # {الاسم: عدد}
+        self._lock = threading.Lock()
+        self._trace = None
+
+    # ========== التفعيل ==========
+    def enable(self, trace_path=None, window=DEFAULT_WINDOW):
+        """
+        تفعيل القياس
+        Args:
+            trace_path: ملف JSON lines لتسجيل كل قياس (اختياري)
+            window: عدد القياسات المحفوظة لكل عملية
+        """
+        with self._lock:
+            self.window = window
+            if trace_path:
+                self._close_trace()
+                self._trace = open(trace_path, "a", encoding="utf-8", buffering=1)
+            self.enabled = True
+
+    def disable(self):
+        """إيقاف القياس وإغلاق ملف التتبع (القياسات السابقة تبقى)"""
+        with self._lock:
+            self.enabled = False
+            self._close_trace()
+
+    def _close_trace(self):
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+
+    def reset(self):
+        """حذف كل القياسات"""
+        with self._lock:
+            self._series.clear()
+            self._counters.clear()
+
+    # ========== التسجيل ==========
+    def record(self, name, seconds):
+        """تسجيل مدة عملية بالثواني"""
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = _Series(self.window)
+            series.samples.append(seconds)
+            series.count += 1
+            series.total += seconds
+            if self._trace is not None:
+                self._trace.write(json.dumps({
+                    'ts': time.time(),
+                    'name': name,
+                    'ms': round(seconds * 1000.0, 3),
+                    'thread': threading.current_thread().name,
+                }, ensure_ascii=False) + "\n")
+
+    def count(self, name, n=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    # ========== القراءة ==========
+    def snapshot(self):
+        """
+        Returns:
+            dict: {'timers': {الاسم: {count, mean_ms, p50_ms, p99_ms, max_ms}}, 'counters': {...}}
+        """
+        with self._lock:
+            series = {name: (list(s.samples), s.count, s.total) for name, s in self._series.items()}
+            counters = dict(self._counters)
+        timers = {}
+        for name, (samples, total_count, total) in series.items():
+            ordered = sorted(samples)
+            timers[name] = {
+                'count': total_count,
+                'mean_ms': total / total_count * 1000.0 if total_count else 0.0,
+                'p50_ms': _percentile(ordered, 0.50) * 1000.0,
+                'p99_ms': _percentile(ordered, 0.99) * 1000.0,
+                'max_ms': (ordered[-1] if ordered else 0.0) * 1000.0,
+            }
+        return {'timers': timers, 'counters': counters}
+
+    def report(self):
+        """جدول نصي بأزمنة كل عملية وقيم العدادات"""
+        data = self.snapshot()
+        lines = [f"{'operation':<32}{'count':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        for name in sorted(data['timers']):
+            t = data['timers'][name]
+            lines.append(f"{name:<32}{t['count']:>8}{t['p50_ms']:>10.2f}{t['p99_ms']:>10.2f}{t['max_ms']:>10.2f}")
+        for name in sorted(data['counters']):
+            lines.append(f"{name:<32}{data['counters'][name]:>8}")
+        return "\n".join(lines)
+
+    def dump(self, stream=None):
+        """طباعة التقرير (افتراضياً إلى stderr)"""
+        print(self.report(), file=stream or sys.stderr)
+
+
+class _Timer:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        registry.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    """سياق لا يفعل شيئاً (يُعاد استخدامه عند التعطيل)"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+registry = MetricsRegistry()
+
+
+def enable(trace_path=None, window=DEFAULT_WINDOW):
+    registry.enable(trace_path, window)
+
+
+def disable():
+    registry.disable()
+
+
+def is_enabled():
+    return registry.enabled
+
+
+def timer(name):
+    """
+    قياس مقطع من الكود
+
+    مثال:
+        with metrics.timer("ui.grid.rebuild"):
+            ...
+    """
+    return _Timer(name) if registry.enabled else _NULL_TIMER
+
+
+def timed(name):
+    """مزخرف يقيس زمن كل استدعاء للدالة باسم name"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                registry.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def count(name, n=1):
+    """زيادة عداد (لا شيء عند التعطيل)"""
+    if registry.enabled:
+        registry.count(name, n)
+
+
+def snapshot():
+    return registry.snapshot()
+
+
+def report():
+    return registry.report()
+
+
+def dump(stream=None):
+    registry.dump(stream)
+
+
+# التفعيل من متغيرات البيئة دون تعديل الكود
+if os.environ.get("GAME_LAUNCHER_METRICS") or os.environ.get("GAME_LAUNCHER_TRACE"):
+    enable(trace_path=os.environ.get("GAME_LAUNCHER_TRACE") or None)
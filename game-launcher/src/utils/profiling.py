@@ -0,0 +1,87 @@
+# src/utils/profiling.py
+# قياس زمن الإقلاع
+"""
+Startup Profiler
+يقيس زمن الاستيرادات وأول رسم للنافذة وزمن الوصول للتفاعل (time-to-interactive)
+ويطبع تقريراً مع مقارنة اختيارية بميزانية زمنية
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """
+    مسجل أزمنة الإقلاع
+
+    - measure(name): يقيس مدة مقطع (مثل استيراد الواجهة)
+    - mark(name): يسجل لحظة منذ بدء العملية (مثل أول رسم)
+    - report(): يطبع التقرير إلى stderr
+    عند التعطيل لا يسجل شيئاً
+    """
+
+    def __init__(self, enabled=False, budget_ms=None, start=None, stream=None):
+        """
+        Args:
+            enabled: تفعيل القياس
+            budget_ms: ميزانية زمن الوصول للتفاعل بالمللي ثانية (اختياري)
+            start: لحظة البدء من time.perf_counter (افتراضياً: الآن)
+            stream: وجهة التقرير (افتراضياً: sys.stderr)
+        """
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.start = start if start is not None else time.perf_counter()
+        self.stream = stream
+        self.sections = []  # (الاسم، المدة بالمللي ثانية)
+        self.marks = []  # (الاسم، المللي ثانية منذ البدء)
+        self._reported = False
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.start) * 1000.0
+
+    @contextmanager
+    def measure(self, name):
+        """قياس مدة مقطع من الكود"""
+        if not self.enabled:
+            yield
+            return
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections.append((name, (time.perf_counter() - t) * 1000.0))
+
+    def mark(self, name):
+        """تسجيل لحظة منذ بدء العملية"""
+        if self.enabled:
+            self.marks.append((name, self.elapsed_ms()))
+
+    def report(self, interactive_mark=None):
+        """
+        طباعة التقرير (مرة واحدة)
+
+        Args:
+            interactive_mark: اسم اللحظة التي تمثل الوصول للتفاعل لمقارنتها بالميزانية
+        Returns:
+            bool: False إذا تجاوز زمن التفاعل الميزانية
+        """
+        if not self.enabled or self._reported:
+            return True
+        self._reported = True
+        out = self.stream or sys.stderr
+        print("=" * 50, file=out)
+        print("⏱️ Startup profile / قياس الإقلاع", file=out)
+        for name, ms in self.sections:
+            print(f"  {name:<28}{ms:>10.1f} ms", file=out)
+        for name, ms in self.marks:
+            print(f"  @ {name:<26}{ms:>10.1f} ms", file=out)
+        within_budget = True
+        if self.budget_ms is not None and interactive_mark is not None:
+            reached = dict(self.marks).get(interactive_mark)
+            if reached is not None:
+                within_budget = reached <= self.budget_ms
+                status = "OK" if within_budget else "OVER BUDGET / تجاوز الميزانية"
+                print(f"  budget {self.budget_ms:.0f} ms -> {status}", file=out)
+        print("=" * 50, file=out)
+        return within_budget
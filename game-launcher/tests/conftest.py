@@ -0,0 +1,16 @@
+# tests/conftest.py
+# إعداد مشترك للاختبارات: جعل حزمة src قابلة للاستيراد من جذر المشروع
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """تطبيق Qt بلا شاشة لاختبارات الواجهة (تُتخطى الاختبارات إن لم تكن Qt مثبتة)"""
+    qt = pytest.importorskip("src.ui.qt_compat", reason="يتطلب PySide6 أو PyQt5")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return qt.QApplication.instance() or qt.QApplication([])
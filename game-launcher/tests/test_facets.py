@@ -0,0 +1,51 @@
+# tests/test_facets.py
+# اختبارات فهرس الأوجه: العدادات والفلترة بعد الإضافة والحذف والتعديل
+from src.core.facets import FacetIndex
+
+
+def make_index():
+    return FacetIndex({
+        "category": lambda item: [item["category"]],
+        "tags": lambda item: item["tags"],
+    })
+
+
+def test_counts_follow_add_update_and_remove():
+    index = make_index()
+    index.update([
+        (1, {"category": "RPG", "tags": ["co-op"]}),
+        (2, {"category": "RPG", "tags": []}),
+        (3, {"category": "Action", "tags": ["co-op", "vr"]}),
+    ])
+    assert index.counts("category") == {"RPG": 2, "Action": 1}
+    assert index.counts("tags") == {"co-op": 2, "vr": 1}
+
+    version = index.version("category")
+    index.add(2, {"category": "Action", "tags": ["vr"]})
+    assert index.counts("category") == {"RPG": 1, "Action": 2}
+    assert index.counts("tags") == {"co-op": 2, "vr": 2}
+    assert index.version("category") == version  # نفس القيم، عدادات مختلفة فقط
+
+    index.discard(1)
+    assert index.counts("category") == {"Action": 2}
+    assert index.version("category") != version  # اختفت قيمة RPG
+    assert len(index) == 2
+
+    # الموضع المحرر يُعاد استخدامه دون خلط قيم العنصر السابق
+    index.add(4, {"category": "Puzzle", "tags": []})
+    assert index.counts("category") == {"Action": 2, "Puzzle": 1}
+    assert sorted(index.ids(index.select({}))) == [2, 3, 4]
+
+
+def test_select_combines_facets_and_counts_within_mask():
+    index = make_index()
+    index.update([
+        (1, {"category": "RPG", "tags": ["co-op"]}),
+        (2, {"category": "Action", "tags": ["co-op", "vr"]}),
+        (3, {"category": "Action", "tags": ["vr"]}),
+    ])
+    assert index.ids(index.select({"category": {"RPG", "Action"}, "tags": {"vr"}})) == [2, 3]
+    assert index.ids(index.select({"tags": {"co-op", "vr"}}, match_all={"tags"})) == [2]
+    within = index.mask_of([1, 2])
+    assert index.counts("tags", within) == {"co-op": 2, "vr": 1}
+    assert index.count(index.select({"category": {"Action"}}, within=within)) == 1
@@ -0,0 +1,101 @@
+# tests/test_filtering.py
+# اختبارات الفلترة المؤجلة في الواجهة: تجميع ضغطات المفاتيح وإلغاء الفلترة القديمة
+# (تتطلب Qt: تُتخطى إن لم تكن مثبتة)
+import time
+
+import pytest
+
+pytest.importorskip("src.ui.qt_compat", reason="يتطلب PySide6 أو PyQt5")
+
+from src.ui.filtering import FilterController  # noqa: E402
+
+NAMES = [f"Game {i}" for i in range(1000)]
+
+
+def wait_until(app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "انتهت المهلة"
+        app.processEvents()
+        time.sleep(0.002)
+
+
+@pytest.fixture
+def controller(qapp):
+    controller = FilterController(lambda name: name, debounce_ms=30, chunk_size=50)
+    emitted = []
+    controller.results_ready.connect(emitted.append)
+    controller.emitted = emitted
+    controller.set_items(NAMES)
+    wait_until(qapp, lambda: emitted)
+    emitted.clear()
+    yield controller
+    controller.deleteLater()
+
+
+def test_keystroke_burst_filters_once(qapp, controller):
+    for text in ("g", "ga", "gam", "game 99"):
+        controller.set_query(text)
+    assert controller.emitted == []  # لا فلترة قبل انتهاء مهلة التأجيل
+    wait_until(qapp, lambda: controller.emitted)
+    time.sleep(0.1)
+    qapp.processEvents()
+    assert len(controller.emitted) == 1
+    assert [NAMES[i] for i in controller.emitted[0]] == ["Game 99", "Game 990", "Game 991", "Game 992",
+                                                         "Game 993", "Game 994", "Game 995", "Game 996",
+                                                         "Game 997", "Game 998", "Game 999"]
+
+
+def test_run_now_skips_the_debounce_delay(qapp, controller):
+    controller.set_query("game 5")
+    controller.run_now()
+    wait_until(qapp, lambda: controller.emitted, timeout=0.5)
+    assert all("5" in NAMES[i] for i in controller.emitted[0])
+
+
+def test_newer_query_cancels_a_run_in_progress(qapp, controller):
+    controller.set_query("game 1")
+    controller.run_now()
+    # الدفعة الأولى فقط تمت، والبقية مجدولة على حلقة الأحداث
+    assert controller._running
+    controller.set_query("game 2")
+    controller.run_now()
+    wait_until(qapp, lambda: not controller._running)
+    qapp.processEvents()
+    assert len(controller.emitted) == 1
+    assert controller.emitted[0] == [i for i, name in enumerate(NAMES) if "game 2" in name.lower()]
+
+
+def test_narrowing_query_scans_previous_results_only(qapp, controller):
+    controller.set_query("game 4")
+    controller.run_now()
+    wait_until(qapp, lambda: controller.emitted)
+    previous = controller.emitted[0]
+    controller.set_query("game 42")
+    controller.run_now()
+    assert controller._source == previous
+    wait_until(qapp, lambda: len(controller.emitted) == 2)
+    assert set(controller.emitted[1]) <= set(previous)
+
+
+def test_ranked_provider_receives_narrowed_results(qapp):
+    calls = []
+
+    def search(text, within, prefix_only):
+        calls.append((text, within, prefix_only))
+        return [i for i in (within if within is not None else range(len(NAMES))) if text in NAMES[i].lower()]
+
+    controller = FilterController(lambda name: name, debounce_ms=10, type_ahead=True)
+    controller.set_search_provider(search)
+    emitted = []
+    controller.results_ready.connect(emitted.append)
+    controller.set_items(NAMES)
+    controller.set_query("g")
+    controller.run_now()
+    controller.set_query("ga")
+    controller.run_now()
+    wait_until(qapp, lambda: len(emitted) == 3)
+    # الاستعلام الأطول يُبحث عنه داخل نتائج الأقصر فقط، مع إعداد الكتابة السريعة
+    assert calls == [("g", None, True), ("ga", emitted[1], True)]
+    assert emitted[2] == list(range(len(NAMES)))
+    controller.deleteLater()
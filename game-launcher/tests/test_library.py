@@ -0,0 +1,298 @@
+# tests/test_library.py
+# اختبارات مكتبة الألعاب: فحص المسارات عند الإضافة وتسجيل جلسات اللعب
+import os
+import threading
+import time
+
+import pytest
+
+from src.core.library import Game, GameLibrary, format_timestamp
+from src.core.path_health import MISSING, PRESENT
+
+
+def test_add_game_does_not_wait_for_disk_and_checks_in_background(tmp_path, monkeypatch):
+    exe = tmp_path / "game.exe"
+    exe.write_text("")
+    missing = str(tmp_path / "nothing.exe")
+    library = GameLibrary()
+    changes = []
+    library.path_health.add_listener(lambda path, status: changes.append((path, status)))
+    checked_on = []
+    real_exists = os.path.exists
+
+    def exists(path):
+        checked_on.append(threading.current_thread())
+        return real_exists(path)
+
+    monkeypatch.setattr("src.core.path_health.os.path.exists", exists)
+    try:
+        assert library.add_game("Present", str(exe)) is not None
+        assert library.add_game("Missing", missing) is not None
+        deadline = time.monotonic() + 5
+        while len(changes) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # النتائج تصل للمستمعين (البطاقات) لاحقاً، والقرص لم يُلمس من خيط المستدعي
+        assert sorted(changes) == sorted([(str(exe), PRESENT), (missing, MISSING)])
+        assert threading.current_thread() not in checked_on
+    finally:
+        library.close()
+
+
+def test_add_game_warns_for_known_missing_path(tmp_path, capsys):
+    missing = str(tmp_path / "nothing.exe")
+    library = GameLibrary()
+    try:
+        library.path_health.update({missing: False})
+        library.add_game("Missing", missing)
+        assert "تحذير: المسار غير موجود" in capsys.readouterr().out
+    finally:
+        library.close()
+
+
+def test_add_games_bulk_reports_paths(tmp_path):
+    exe = tmp_path / "game.exe"
+    exe.write_text("")
+    library = GameLibrary()
+    try:
+        results = library.add_games_bulk([
+            {'name': "A", 'path': str(exe)},
+            {'name': "B", 'path': str(tmp_path / "b.exe")},
+            {'name': "A", 'path': str(exe)},
+        ])
+        assert [r['status'] for r in results] == ['added', 'added', 'duplicate']
+        assert [r['path_exists'] for r in results] == [True, False, True]
+    finally:
+        library.close()
+
+
+@pytest.mark.skipif(not os.path.exists("/bin/true"), reason="needs /bin/true")
+def test_launcher_batches_session_stats_until_flush():
+    from src.core.launcher import LaunchSupervisor
+    library = GameLibrary()
+    game = library.add_game("True", "/bin/true")
+    supervisor = LaunchSupervisor(library, flush_interval=60)
+    try:
+        assert supervisor.launch(game).result(timeout=10) is not None
+        deadline = time.monotonic() + 10
+        while supervisor.active_sessions() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # انتهاء الجلسة لا يوقظ المُفرغ: الإحصائيات تنتظر الفاصل أو امتلاء الدفعة
+        time.sleep(0.05)
+        assert (game.play_count, game.play_time) == (0, 0)
+        supervisor.flush()
+        # جلسة أقصر من دقيقة تُحسب دقيقة
+        assert (game.play_count, game.play_time) == (1, 1)
+    finally:
+        supervisor.shutdown()
+        library.close()
+
+
+@pytest.mark.skipif(not os.path.exists("/bin/sleep"), reason="needs /bin/sleep")
+def test_launcher_shutdown_records_running_sessions_once(tmp_path):
+    from src.core.launcher import LaunchSupervisor
+    script = tmp_path / "game.sh"
+    script.write_text("#!/bin/sh\nexec /bin/sleep 5\n")
+    script.chmod(0o755)
+    library = GameLibrary()
+    game = library.add_game("Sleeper", str(script))
+    supervisor = LaunchSupervisor(library, flush_interval=60)
+    session = supervisor.launch(game).result(timeout=10)
+    assert session is not None
+    try:
+        supervisor.shutdown()
+        # الجلسة الجارية تُسجل قبل التفريغ الأخير
+        assert (game.play_count, game.play_time) == (1, 1)
+        session.process.kill()
+        session.process.wait(timeout=10)
+        time.sleep(0.05)
+        supervisor.flush()
+        # خروج العملية لاحقاً لا يحسبها مرة ثانية
+        assert (game.play_count, game.play_time) == (1, 1)
+    finally:
+        if session.process.poll() is None:
+            session.process.kill()
+        library.close()
+
+
+@pytest.mark.parametrize("backend", ["pickle", "journal", "sqlite", "columnar"])
+def test_surrogate_keys_are_stable_across_reload(tmp_path, backend):
+    from src.database.columnar import ColumnarDatabaseManager
+    from src.database.sqlite_storage import SQLiteDatabaseManager
+    from src.database.storage import DatabaseManager, JournaledDatabaseManager
+    path = str(tmp_path / "games.db")
+    storage_class = {"pickle": DatabaseManager, "journal": JournaledDatabaseManager,
+                     "sqlite": SQLiteDatabaseManager, "columnar": ColumnarDatabaseManager}[backend]
+
+    def open_library():
+        return GameLibrary(storage_class(path))
+
+    library = open_library()
+    keys = {library.add_game(f"Game {i}", f"/games/{i}").id: None for i in range(5)}
+    keys = {game_id: library.get_game(game_id).key for game_id in keys}
+    library.close()
+
+    library = open_library()
+    assert {game.id: game.key for game in library.get_all_games()} == keys
+    # مفاتيح الألعاب الجديدة بعد إعادة التحميل لا تتكرر ولا تتراجع
+    assert library.add_game("New", "/games/new").key > max(keys.values())
+    library.close()
+
+
+def test_legacy_games_get_keys_once(tmp_path):
+    from src.database.storage import DatabaseManager
+    path = str(tmp_path / "games.db")
+    DatabaseManager(path).save_games([{'id': f"game_legacy_{i}", 'name': f"Old {i}", 'path': f"/old/{i}"}
+                                      for i in range(3)])
+    library = GameLibrary(DatabaseManager(path))
+    first = {game.id: game.key for game in library.get_all_games()}
+    library.close()
+    assert None not in first.values() and len(set(first.values())) == 3
+    # المفاتيح الممنوحة عند أول تحميل حُفظت فتبقى كما هي
+    library = GameLibrary(DatabaseManager(path))
+    assert {game.id: game.key for game in library.get_all_games()} == first
+    library.close()
+
+
+def test_short_search_matches_substrings_like_the_literal_search():
+    library = GameLibrary()
+    try:
+        library.path_health.update({"/games/witcher": True, "/games/dragon": True})
+        library.add_game("The Witcher 3", "/games/witcher")
+        library.add_game("Dragon Age", "/games/dragon")
+        for fuzzy in (True, False):
+            assert [g.name for g in library.search_games("it", fuzzy=fuzzy)] == ["The Witcher 3"]
+        assert library.search_games("it", prefix_only=True) == []
+        assert [g.name for g in library.search_games("dr", prefix_only=True)] == ["Dragon Age"]
+    finally:
+        library.close()
+
+
+# ========== التمثيل المضغوط للعبة ==========
+def test_game_has_no_instance_dict_and_interns_genres():
+    game = Game("Chess", "/games/chess", genre="".join(["Str", "ategy"]))
+    other = Game("Go", "/games/go", genre="".join(["Strat", "egy"]))
+    assert not hasattr(game, "__dict__")
+    assert game.genre is other.genre
+    with pytest.raises(AttributeError):
+        game.rating = 5
+
+
+def test_game_epoch_fields_round_trip_through_dict():
+    game = Game("Chess", "/games/chess", genre="Strategy", description="لعبة")
+    game.added_ts = 1_700_000_000
+    game.last_played_ts = 1_700_003_600
+    game.play_time = 90
+    game.play_count = 3
+    data = game.to_dict()
+    # التواريخ تُنسق كنص عند الحفظ فقط
+    assert data['added_date'] == format_timestamp(1_700_000_000)
+    assert data['last_played'] == format_timestamp(1_700_003_600)
+    loaded = Game.from_dict(data)
+    assert loaded.to_dict() == data
+    assert (loaded.added_ts, loaded.last_played_ts) == (1_700_000_000, 1_700_003_600)
+    assert (loaded.key, loaded.id, loaded.genre) == (game.key, game.id, "Strategy")
+
+
+def test_game_reads_legacy_dates():
+    data = {'id': "game_1", 'name': "Old", 'path': "/old",
+            'added_date': "2024-01-02T03:04:05", 'last_played': None}
+    game = Game.from_dict(data)
+    assert game.key is None  # المفتاح تمنحه المكتبة عند التحميل
+    assert game.added_date == "2024-01-02 03:04:05"
+    assert game.last_played is None and game.play_count == 0
+    game.last_played = "2024-02-03 04:05:06"
+    assert format_timestamp(game.last_played_ts) == "2024-02-03 04:05:06"
+    assert game.to_dict()['added_date'] == "2024-01-02 03:04:05"  # يُحفظ بالصيغة الحالية
+
+
+# ========== الدفعات والإضافة الجماعية ==========
+class RecordingStorage:
+    """تخزين في الذاكرة يسجل كل دفعة تغييرات"""
+
+    def __init__(self):
+        self.writes = []
+
+    def load_games(self):
+        return []
+
+    def apply_changes(self, changes):
+        self.writes.append(list(changes))
+
+
+@pytest.fixture
+def stored_library():
+    storage = RecordingStorage()
+    library = GameLibrary(storage, write_behind=False)
+    library.storage_log = storage.writes
+    yield library
+    library.close()
+
+
+def snapshot(library):
+    return sorted((g.key, g.name, g.genre, g.play_count) for g in library.get_all_games())
+
+
+def test_batch_saves_once_at_the_end(stored_library):
+    with stored_library.batch():
+        first = stored_library.add_game("Chess", "/games/chess")
+        stored_library.add_game("Go", "/games/go")
+        stored_library.update_game(first.key, genre="Board")
+        with stored_library.batch():  # دفعة داخلية تُحفظ مع الخارجية
+            stored_library.remove_game(first.key)
+        assert stored_library.storage_log == []
+    assert [[op for op, _ in write] for write in stored_library.storage_log] == [
+        ["insert", "insert", "update", "delete"]]
+
+
+def test_batch_rolls_back_on_error(stored_library):
+    kept = stored_library.add_game("Chess", "/games/chess")
+    before = snapshot(stored_library)
+    writes = len(stored_library.storage_log)
+    with pytest.raises(RuntimeError):
+        with stored_library.batch():
+            stored_library.add_game("Go", "/games/go")
+            stored_library.update_game(kept.key, name="Chess 2", genre="Board")
+            stored_library.record_play(kept.key, 30)
+            stored_library.remove_game(kept.key)
+            raise RuntimeError("فشل الاستيراد")
+    assert snapshot(stored_library) == before
+    assert len(stored_library.storage_log) == writes  # لا شيء يُحفظ
+    # الفهارس عادت أيضاً
+    assert [g.name for g in stored_library.search_games("chess")] == ["Chess"]
+    assert stored_library.search_games("go", fuzzy=False) == []
+    assert stored_library.find_by_name("Chess 2") == []
+    assert stored_library.filter_by_genre("Board") == []
+    assert stored_library.get_statistics()['total_games'] == 1
+
+
+def test_inner_batch_error_rolls_back_only_the_inner_changes(stored_library):
+    with stored_library.batch():
+        stored_library.add_game("Chess", "/games/chess")
+        try:
+            with stored_library.batch():
+                stored_library.add_game("Go", "/games/go")
+                raise ValueError
+        except ValueError:
+            pass
+    assert [g.name for g in stored_library.get_all_games()] == ["Chess"]
+    assert [[op for op, _ in write] for write in stored_library.storage_log] == [["insert"]]
+
+
+def test_bulk_add_update_remove_report_per_item(stored_library, capsys):
+    results = stored_library.add_games_bulk([
+        {'name': "Chess", 'path': "/games/chess", 'genre': "Board"},
+        {'name': "Chess", 'path': "/games/chess"},
+        {'name': "", 'path': "/games/empty"},
+        {'name': "Go", 'path': "/games/go"},
+    ], check_paths=False)
+    assert [r['status'] for r in results] == ["added", "duplicate", "invalid", "added"]
+    assert results[0]['game'].genre == "Board" and results[2]['error']
+    chess, go = results[0]['game'], results[3]['game']
+    assert stored_library.update_games_bulk({chess.key: {'genre': "Strategy"}, "game_missing": {}}) == {
+        chess.key: True, "game_missing": False}
+    assert stored_library.remove_games_bulk([go.id, "game_missing"]) == {go.id: True, "game_missing": False}
+    assert [g.name for g in stored_library.get_all_games()] == ["Chess"]
+    assert capsys.readouterr().out == ""  # العمليات الجماعية لا تطبع
+    # حفظ واحد لكل عملية جماعية
+    assert [[op for op, _ in write] for write in stored_library.storage_log] == [
+        ["insert", "insert"], ["update"], ["delete"]]
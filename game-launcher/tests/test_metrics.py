@@ -0,0 +1,113 @@
+# tests/test_metrics.py
+# اختبارات القياسات: لا تسجيل عند التعطيل، والمؤقتات والعدادات والتتبع عند التفعيل
+import json
+
+import pytest
+
+from src.core.library import GameLibrary
+from src.utils import metrics
+
+
+@pytest.fixture
+def registry():
+    was_enabled = metrics.is_enabled()
+    metrics.disable()
+    metrics.registry.reset()
+    yield metrics.registry
+    metrics.disable()
+    metrics.registry.reset()
+    if was_enabled:
+        metrics.enable()
+
+
+@metrics.timed("test.work")
+def work(value):
+    return value * 2
+
+
+def test_disabled_metrics_record_nothing(registry):
+    assert not metrics.is_enabled()
+    assert work(2) == 4
+    with metrics.timer("test.block") as timer:
+        pass
+    assert timer is metrics.timer("other")  # سياق واحد مشترك لا يقيس شيئاً
+    metrics.count("test.counter")
+    assert metrics.snapshot() == {'timers': {}, 'counters': {}}
+
+
+def test_enabled_metrics_record_timers_and_counters(registry):
+    metrics.enable()
+    for value in range(5):
+        work(value)
+    with metrics.timer("test.block"):
+        pass
+    metrics.count("test.counter")
+    metrics.count("test.counter", 4)
+    data = metrics.snapshot()
+    assert data['timers']['test.work']['count'] == 5
+    assert data['timers']['test.block']['count'] == 1
+    assert data['counters'] == {'test.counter': 5}
+    stats = data['timers']['test.work']
+    assert 0 <= stats['p50_ms'] <= stats['p99_ms'] <= stats['max_ms']
+    report = metrics.report()
+    assert "test.work" in report and "test.counter" in report
+
+
+def test_timed_records_calls_that_raise(registry):
+    metrics.enable()
+
+    @metrics.timed("test.fails")
+    def fails():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        fails()
+    assert metrics.snapshot()['timers']['test.fails']['count'] == 1
+
+
+def test_rolling_window_keeps_totals(registry):
+    metrics.enable(window=3)
+    for seconds in (0.001, 0.002, 0.003, 0.004, 0.005):
+        registry.record("test.window", seconds)
+    stats = metrics.snapshot()['timers']['test.window']
+    assert stats['count'] == 5
+    assert stats['mean_ms'] == pytest.approx(3.0)
+    assert stats['p50_ms'] == pytest.approx(4.0)  # آخر ثلاث قياسات فقط
+    assert stats['max_ms'] == pytest.approx(5.0)
+
+
+def test_trace_file_gets_one_json_line_per_measurement(registry, tmp_path):
+    trace = tmp_path / "trace.jsonl"
+    metrics.enable(trace_path=str(trace))
+    work(1)
+    with metrics.timer("test.block"):
+        pass
+    metrics.disable()
+    work(2)  # بعد الإيقاف لا شيء يُكتب
+    lines = [json.loads(line) for line in trace.read_text(encoding="utf-8").splitlines()]
+    assert [line['name'] for line in lines] == ["test.work", "test.block"]
+    assert all(line['ms'] >= 0 and line['thread'] for line in lines)
+
+
+def test_disable_keeps_previous_measurements(registry):
+    metrics.enable()
+    work(1)
+    metrics.disable()
+    work(2)
+    assert metrics.snapshot()['timers']['test.work']['count'] == 1
+    registry.reset()
+    assert metrics.snapshot() == {'timers': {}, 'counters': {}}
+
+
+def test_library_hot_paths_are_instrumented(registry):
+    library = GameLibrary()
+    try:
+        library.path_health.update({"/games/chess": True})
+        library.add_game("Chess", "/games/chess")
+        library.search_games("chess")
+        assert metrics.snapshot()['timers'] == {}
+        metrics.enable()
+        library.search_games("chess")
+        assert "library.search" in metrics.snapshot()['timers']
+    finally:
+        library.close()
@@ -0,0 +1,129 @@
+# tests/test_persistence.py
+# اختبارات الحفظ المؤجل: الدمج، flush، الإغلاق وفشل الكتابة
+import threading
+
+import pytest
+
+from src.core.persistence import WriteBehind
+
+
+class Recorder:
+    """دالة كتابة تسجل الدفعات، ويمكن جعلها تفشل"""
+
+    def __init__(self, failures=0):
+        self.batches = []
+        self.failures = failures
+        self.written = threading.Event()
+
+    def __call__(self, changes):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("القرص ممتلئ")
+        self.batches.append(changes)
+        self.written.set()
+
+
+def upsert(game_id, **fields):
+    return ("upsert", {'id': game_id, **fields})
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+def test_updates_to_one_game_coalesce_into_one_write(recorder):
+    writer = WriteBehind(recorder, delay=60)
+    try:
+        writer.submit([upsert("a", play_count=1)])
+        writer.submit([upsert("a", play_count=2), upsert("b")])
+        writer.submit([upsert("a", play_count=3)])
+        assert writer.pending == 2
+        writer.flush()
+        assert recorder.batches == [[upsert("a", play_count=3), upsert("b")]]
+        assert writer.pending == 0
+    finally:
+        writer.close()
+
+
+def test_delete_replaces_pending_upsert(recorder):
+    writer = WriteBehind(recorder, delay=60)
+    try:
+        writer.submit([upsert("a"), ("delete", "a")])
+        writer.flush()
+        assert recorder.batches == [[("delete", "a")]]
+    finally:
+        writer.close()
+
+
+def test_flush_writes_before_returning(recorder):
+    writer = WriteBehind(recorder, delay=60)
+    try:
+        writer.submit([upsert("a")])
+        assert recorder.batches == []  # لا كتابة قبل انتهاء المهلة
+        writer.flush()
+        assert recorder.batches == [[upsert("a")]]
+        writer.flush()  # لا شيء معلّق: لا كتابة فارغة
+        assert len(recorder.batches) == 1
+    finally:
+        writer.close()
+
+
+def test_background_thread_writes_after_delay(recorder):
+    writer = WriteBehind(recorder, delay=0.01)
+    try:
+        writer.submit([upsert("a")])
+        assert recorder.written.wait(5)
+        assert recorder.batches == [[upsert("a")]]
+    finally:
+        writer.close()
+
+
+def test_max_pending_forces_write(recorder):
+    writer = WriteBehind(recorder, delay=60, max_pending=3)
+    try:
+        writer.submit([upsert(str(i)) for i in range(3)])
+        assert recorder.written.wait(5)
+        assert len(recorder.batches[0]) == 3
+    finally:
+        writer.close()
+
+
+def test_close_drains_pending_writes(recorder):
+    writer = WriteBehind(recorder, delay=60)
+    writer.submit([upsert("a"), upsert("b")])
+    writer.close()
+    assert recorder.batches == [[upsert("a"), upsert("b")]]
+    assert not writer._thread.is_alive()
+    writer.close()  # إغلاق ثانٍ لا يكتب مرة أخرى
+    assert len(recorder.batches) == 1
+
+
+def test_failed_write_keeps_changes_for_retry(capsys):
+    recorder = Recorder(failures=1)
+    writer = WriteBehind(recorder, delay=60)
+    try:
+        writer.submit([upsert("a", play_count=1), upsert("b")])
+        writer.flush()
+        assert "خطأ في حفظ الألعاب" in capsys.readouterr().out
+        assert recorder.batches == []
+        assert writer.pending == 2
+        # تغيير أحدث أثناء الفشل لا يُستبدل بالسجل القديم
+        writer.submit([upsert("a", play_count=2)])
+        writer.flush()
+        assert sorted(recorder.batches[0], key=lambda c: c[1]['id']) == [
+            upsert("a", play_count=2), upsert("b")]
+        assert writer.pending == 0
+    finally:
+        writer.close()
+
+
+def test_failed_write_does_not_stop_background_thread():
+    recorder = Recorder(failures=1)
+    writer = WriteBehind(recorder, delay=0.01)
+    try:
+        writer.submit([upsert("a")])
+        assert recorder.written.wait(5)  # المحاولة التالية بعد المهلة تنجح
+        assert recorder.batches == [[upsert("a")]]
+    finally:
+        writer.close()
@@ -0,0 +1,123 @@
+# tests/test_scanner.py
+# اختبارات فاحص المكتبة: الفحص الأول، الفحص التدريجي والمجلدات المحذوفة
+import json
+import shutil
+
+import pytest
+
+from src.core.library import GameLibrary
+from src.core.scanner import LibraryScanner
+
+
+def touch(path, size=1):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / "Games"
+    touch(root / "Alpha" / "Alpha.exe")
+    touch(root / "Beta" / "bin" / "x64" / "beta_game.exe", size=50)
+    touch(root / "Beta" / "bin" / "x64" / "unins000.exe", size=500)
+    touch(root / "Beta" / "redist" / "vc_redist.exe")
+    return root
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "games.db.scan.json")
+
+
+def make_scanner(root, cache_path, library=None):
+    return LibraryScanner(library or GameLibrary(), roots=[str(root)], cache_path=cache_path, max_workers=2)
+
+
+def count_listings(scanner):
+    """تغليف _list_dir لعدّ المجلدات التي مُر عليها في القرص"""
+    calls = []
+    list_dir = scanner._list_dir
+
+    def counting(path, use_cache=True):
+        calls.append(path)
+        return list_dir(path, use_cache)
+
+    scanner._list_dir = counting
+    return calls
+
+
+def found(result):
+    return {c['name']: c['path'] for c in result.candidates}
+
+
+def test_first_scan_adds_games_and_writes_cache(root, cache_path):
+    library = GameLibrary()
+    result = make_scanner(root, cache_path, library).scan()
+    assert found(result) == {
+        "Alpha": str(root / "Alpha" / "Alpha.exe"),
+        "Beta": str(root / "Beta" / "bin" / "x64" / "beta_game.exe"),
+    }
+    assert {game.name for game in result.added} == {"Alpha", "Beta"}
+    assert result.dirs_cached == 0
+    assert result.dirs_listed == 5  # الجذر، Alpha، Beta، bin، x64 (redist متخطى)
+    with open(cache_path, encoding="utf-8") as f:
+        assert str(root / "Beta" / "bin" / "x64") in json.load(f)['dirs']
+
+
+def test_known_games_are_not_walked_again(root, cache_path):
+    library = GameLibrary()
+    make_scanner(root, cache_path, library).scan()
+    result = make_scanner(root, cache_path, library).scan()
+    assert result.candidates == []
+    assert result.dirs_skipped == 2
+
+
+def test_rescan_skips_unchanged_subtrees(root, cache_path):
+    first = make_scanner(root, cache_path).scan(dry_run=True)
+    scanner = make_scanner(root, cache_path)
+    calls = count_listings(scanner)
+    result = scanner.scan(dry_run=True)
+    assert found(result) == found(first)
+    # الجذر ومجلدا اللعبتين فقط: شجرة Beta الفرعية من الذاكرة المؤقتة
+    assert sorted(calls) == sorted([str(root), str(root / "Alpha"), str(root / "Beta")])
+    assert result.dirs_listed == 0
+    assert result.dirs_cached == 5
+
+
+def test_rescan_finds_new_game_directories(root, cache_path):
+    make_scanner(root, cache_path).scan(dry_run=True)
+    touch(root / "Gamma" / "data" / "gamma.sh")
+    scanner = make_scanner(root, cache_path)
+    calls = count_listings(scanner)
+    result = scanner.scan(dry_run=True)
+    assert found(result)["Gamma"] == str(root / "Gamma" / "data" / "gamma.sh")
+    assert set(found(result)) == {"Alpha", "Beta", "Gamma"}
+    assert str(root / "Beta" / "bin") not in calls
+    assert result.dirs_listed == 3  # الجذر، Gamma، data
+
+
+def test_full_scan_sees_changes_inside_unchanged_directories(root, cache_path):
+    make_scanner(root, cache_path).scan(dry_run=True)
+    # تغيير عميق لا يغير mtime مجلد Beta نفسه
+    touch(root / "Beta" / "bin" / "x64" / "Beta.exe")
+    assert found(make_scanner(root, cache_path).scan(dry_run=True))["Beta"].endswith("beta_game.exe")
+    result = make_scanner(root, cache_path).scan(dry_run=True, full=True)
+    assert found(result)["Beta"] == str(root / "Beta" / "bin" / "x64" / "Beta.exe")
+    assert result.dirs_cached == 0
+
+
+def test_removed_directories_are_dropped(root, cache_path):
+    make_scanner(root, cache_path).scan(dry_run=True)
+    shutil.rmtree(root / "Beta")
+    scanner = make_scanner(root, cache_path)
+    result = scanner.scan(dry_run=True)
+    assert set(found(result)) == {"Alpha"}
+    assert not any(path.startswith(str(root / "Beta")) for path in scanner._cache)
+    with open(cache_path, encoding="utf-8") as f:
+        assert not any(path.startswith(str(root / "Beta")) for path in json.load(f)['dirs'])
+
+
+def test_missing_root_is_ignored(tmp_path, cache_path):
+    result = make_scanner(tmp_path / "missing", cache_path).scan()
+    assert result.candidates == []
+    assert result.dirs_listed == 0
@@ -0,0 +1,125 @@
+# tests/test_search.py
+# اختبارات فهرس البحث: التوحيد، الترتيب، البحث التقريبي والكتابة بين العربية واللاتينية
+import random
+
+import pytest
+
+from src.core.search import SearchIndex, narrows, normalize, skeleton, substring_distance
+
+
+def reference_distance(pattern, text):
+    # برمجة ديناميكية مباشرة (Sellers) للمقارنة
+    column = list(range(len(pattern) + 1))
+    best = column[-1]
+    for char in text:
+        previous, column = column, [0]
+        for i, p in enumerate(pattern, 1):
+            column.append(min(previous[i - 1] + (p != char), previous[i] + 1, column[i - 1] + 1))
+        best = min(best, column[-1])
+    return best
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    names = ["Cyberpunk 2077", "Red Dead Redemption", "The Witcher 3", "Dragon Age",
+             "Dragon Quest", "فارس الصحراء", "Desert Knight", "سايبر سيتي", "Age of Empires"]
+    for doc_id, name in enumerate(names):
+        index.add(doc_id, name, genre="RPG" if "Dragon" in name else "Action")
+    return index
+
+
+def test_substring_distance_matches_reference():
+    rng = random.Random(3)
+    for _ in range(3000):
+        pattern = "".join(rng.choice("abcد") for _ in range(rng.randrange(9)))
+        text = "".join(rng.choice("abcد") for _ in range(rng.randrange(16)))
+        assert substring_distance(pattern, text) == reference_distance(pattern, text)
+
+
+def test_normalize_and_skeleton():
+    assert normalize("  أَلْعَاب   Games ") == "العاب games"
+    assert skeleton(normalize("سايبربنك")) == skeleton(normalize("Cyberpunk")) == "sbrbnk"
+
+
+def test_exact_matches_rank_by_field_and_prefix(index):
+    assert index.search("dragon") == [3, 4]
+    assert index.search("age") == [8, 3]  # بداية الاسم قبل وسطه
+    assert index.search("rpg") == [3, 4]  # النوع
+
+
+def test_typo_tolerant_search(index):
+    assert index.search("witchr")[0] == 2
+    assert index.search("redemptoin")[0] == 1
+    assert index.search("witchr", fuzzy=False) == []
+
+
+def test_transliterated_search(index):
+    assert index.search("سايبربنك")[0] == 0
+    assert 6 not in index.search("سايبربنك")
+
+
+def test_recency_breaks_ties():
+    index = SearchIndex()
+    index.add(1, "Dragon One")
+    index.add(2, "Dragon Two", last_played=2_000_000_000)
+    assert index.search("dragon") == [2, 1]
+
+
+def test_short_queries_match_substrings_by_default(index):
+    # مطابقة حرفية لأي جزء من النص كما في LIKE، مع البحث التقريبي أو بدونه
+    assert index.search("it") == index.search("it", fuzzy=False) == [2]
+    assert index.search("ag") == index.search("ag", fuzzy=False) == [8, 3, 4]
+    assert 1 in index.search("ed")
+
+
+def test_short_queries_match_word_starts_when_prefix_only(index):
+    assert index.search("dr", prefix_only=True) == [3, 4]
+    assert set(index.search("ag", prefix_only=True)) == {3, 8}
+    assert index.search("it", prefix_only=True) == []
+    assert 1 not in index.search("ed", prefix_only=True)
+
+
+def test_remove_and_update(index):
+    index.remove(3)
+    assert index.search("dragon") == [4]
+    index.add(4, "Space Quest")
+    assert index.search("dragon") == []
+    assert index.search("dr", prefix_only=True) == []
+
+
+def test_search_within(index):
+    assert index.search("dragon", within={4, 5}) == [4]
+    assert index.search("witchr", within={0, 1}) == []
+
+
+def test_narrows():
+    assert narrows("drag", "drago")
+    assert narrows("dragon k", "dragon kn")
+    assert not narrows("drago", "dragon")  # الهيكل drj يُطابق بداية الاسم فقط و drjn أي جزء منه
+    assert narrows("d", "dr")
+    assert narrows("d", "ad")  # أي جزء من النص
+    assert not narrows("d", "ad", prefix_only=True)  # بدايات الكلمات
+    assert not narrows("dr", "dra")  # بدايات الكلمات ثم أي جزء من النص
+    assert not narrows("dragon", "dragon age")  # حد الأخطاء يزيد مع الطول
+    assert not narrows("", "dragon")
+
+
+def test_narrowed_results_are_a_subset():
+    rng = random.Random(11)
+    words = ["dragon", "drake", "desert", "sand", "knight", "night", "فارس", "الصحراء", "سيف"]
+    index = SearchIndex()
+    for doc_id in range(150):
+        index.add(doc_id, " ".join(rng.sample(words, 2)))
+    narrowed = 0
+    for word in words:
+        for end in range(1, len(word)):
+            previous, query = word[:end], word[:end + 1]
+            for prefix_only in (False, True):
+                if narrows(previous, query, prefix_only):
+                    before = index.search(previous, prefix_only=prefix_only)
+                    after = index.search(query, prefix_only=prefix_only)
+                    assert set(after) <= set(before)
+                    assert index.search(query, within=before, prefix_only=prefix_only) == after
+                    narrowed += 1
+    assert narrowed > len(words)
@@ -0,0 +1,131 @@
+# tests/test_sqlite_storage.py
+# اختبارات تخزين SQLite: التعديل لعبة لعبة، الاستعلامات، والترحيل من pickle
+import os
+
+import pytest
+
+from src.database.sqlite_storage import SQLiteDatabaseManager, migrate_pickle_to_sqlite, open_sqlite_storage
+from src.database.storage import DatabaseManager, JournaledDatabaseManager
+
+
+def make_game(i, **fields):
+    game = {'id': f"game_{i}", 'name': f"Game {i}", 'path': f"/games/{i}", 'genre': "Action",
+            'description': "", 'added_date': None, 'last_played': None,
+            'play_time': 0, 'play_count': 0, 'key': i}
+    game.update(fields)
+    return game
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = SQLiteDatabaseManager(str(tmp_path / "games.sqlite3"))
+    yield manager
+    manager.close()
+
+
+def test_migration_copies_pickle_once(tmp_path):
+    pickle_path = str(tmp_path / "games.db")
+    sqlite_path = str(tmp_path / "games.sqlite3")
+    DatabaseManager(pickle_path).save_games([make_game(i) for i in range(3)])
+    assert migrate_pickle_to_sqlite(pickle_path, sqlite_path) == 3
+    assert migrate_pickle_to_sqlite(pickle_path, sqlite_path) == 0
+    manager = SQLiteDatabaseManager(sqlite_path)
+    assert [g['id'] for g in manager.load_games()] == ["game_0", "game_1", "game_2"]
+    manager.close()
+
+
+def test_open_sqlite_storage_migrates_on_first_run(tmp_path):
+    pickle_path = str(tmp_path / "games.db")
+    DatabaseManager(pickle_path).save_games([make_game(i) for i in range(2)])
+    manager = open_sqlite_storage(pickle_path)
+    assert manager.db_path == str(tmp_path / "games.sqlite3")
+    assert len(manager.load_games()) == 2
+    manager.upsert_game(make_game(5))
+    manager.close()
+    # التشغيل التالي يفتح قاعدة SQLite كما هي دون ترحيل جديد
+    manager = open_sqlite_storage(pickle_path)
+    assert len(manager.load_games()) == 3
+    manager.close()
+    assert os.path.exists(pickle_path)
+
+
+def test_migration_replays_the_journal(tmp_path):
+    pickle_path = str(tmp_path / "games.db")
+    journaled = JournaledDatabaseManager(pickle_path, background=False)
+    journaled.save_games([make_game(i) for i in range(3)])
+    # تعديلات بعد آخر دمج: موجودة في games.db.journal فقط
+    journaled.apply_changes([("update", make_game(0, name="Renamed")), ("delete", "game_1"),
+                             ("insert", make_game(7))])
+    journaled.close()
+    assert os.path.getsize(pickle_path + ".journal") > 0
+    manager = open_sqlite_storage(pickle_path)
+    assert [(g['id'], g['name']) for g in manager.load_games()] == [
+        ("game_0", "Renamed"), ("game_2", "Game 2"), ("game_7", "Game 7")]
+    manager.close()
+
+
+def test_migration_from_journal_without_snapshot(tmp_path):
+    pickle_path = str(tmp_path / "games.db")
+    journaled = JournaledDatabaseManager(pickle_path, background=False)
+    journaled.apply_changes([("insert", make_game(1))])
+    journaled.close()
+    assert not os.path.exists(pickle_path)
+    manager = open_sqlite_storage(pickle_path)
+    assert [g['id'] for g in manager.load_games()] == ["game_1"]
+    manager.close()
+
+
+def test_open_sqlite_storage_uses_sqlite_paths_directly(tmp_path):
+    path = str(tmp_path / "library.sqlite")
+    manager = open_sqlite_storage(path)
+    assert manager.db_path == path
+    assert manager.load_games() == []
+    manager.close()
+
+
+def test_upsert_updates_in_place_and_delete_removes(db):
+    db.upsert_game(make_game(1))
+    db.upsert_game(make_game(2))
+    db.upsert_game(make_game(1, name="Renamed", play_count=3))
+    assert [(g['id'], g['name'], g['play_count']) for g in db.load_games()] == [
+        ("game_1", "Renamed", 3), ("game_2", "Game 2", 0)]
+    db.delete_game("game_1")
+    db.delete_game("missing")
+    assert [g['id'] for g in db.load_games()] == ["game_2"]
+
+
+def test_query_games_filters_orders_and_pages(db):
+    db.save_games([make_game(i, genre="RPG" if i % 2 else "Action", play_count=i) for i in range(6)])
+    assert [g['id'] for g in db.query_games(genre="RPG")] == ["game_1", "game_3", "game_5"]
+    assert [g['id'] for g in db.query_games(keyword="game 4")] == ["game_4"]
+    assert [g['id'] for g in db.query_games(order_by="play_count", descending=True, limit=2)] == [
+        "game_5", "game_4"]
+    assert [g['id'] for g in db.query_games(genre="Action", order_by="play_count", limit=2, offset=1)] == [
+        "game_2", "game_4"]
+    with pytest.raises(ValueError):
+        db.query_games(order_by="path; DROP TABLE games")
+
+
+def test_library_pushes_reads_down_until_loaded(db):
+    from src.core.library import GameLibrary
+    db.save_games([make_game(i, genre="RPG" if i % 2 else "Action") for i in range(4)])
+    library = GameLibrary(db, autoload=False, write_behind=False)
+    try:
+        # لم يُحمّل شيء في الذاكرة: الإحصائيات والفلترة من قاعدة البيانات
+        assert library.games == {}
+        assert library.get_statistics()['total_games'] == 4
+        assert [g.id for g in library.filter_by_genre("RPG")] == ["game_1", "game_3"]
+        assert [g.id for g in library.search_games("game 2", fuzzy=False)] == ["game_2"]
+        assert library.get_recently_played() == []
+        for _ in library.iter_load():
+            pass
+        game = library.get_game("game_2")
+        library.record_play(game.id, 30)
+        # بعد التحميل: الإحصائيات الجارية في الذاكرة، ومطابقة لقاعدة البيانات
+        assert library.get_statistics() == db.get_statistics()
+        assert [g.id for g in library.get_most_played(1)] == ["game_2"]
+        assert [g.id for g in library.get_recently_played()] == ["game_2"]
+        assert [g.id for g in library.query_games(genre="Action", order_by="play_count", descending=True)] == [
+            "game_2", "game_0"]
+    finally:
+        library.close()
@@ -0,0 +1,70 @@
+# tests/test_stats.py
+# اختبارات الإحصائيات الجارية وترتيب الأكثر لعباً
+import random
+
+from src.core.library import GameLibrary
+from src.core.stats import RankedIndex
+
+
+def expected_top(keys, order, n):
+    ranked = sorted(keys.items(), key=lambda item: (-item[1], order[item[0]]))
+    return ranked[:n]
+
+
+def test_ranked_index_top_under_updates():
+    rng = random.Random(7)
+    index = RankedIndex()
+    keys, order = {}, {}
+    for step in range(3000):
+        item_id = rng.randrange(200)
+        if rng.random() < 0.2:
+            index.discard(item_id)
+            keys.pop(item_id, None)
+        else:
+            key = rng.randrange(50)
+            index.set(item_id, key)
+            keys[item_id] = key
+            order.setdefault(item_id, step)
+        if step % 50 == 0:
+            for n in (1, 5, 40, 500):
+                assert index.top(n) == expected_top(keys, order, n)
+    assert len(index) == len(keys)
+
+
+def test_ranked_index_top_does_not_modify_heap():
+    index = RankedIndex()
+    for item_id in range(20):
+        index.set(item_id, item_id % 7)
+    index.set(3, 100)
+    index.discard(5)
+    heap = list(index._heap)
+    assert index.top(3) == [(3, 100), (6, 6), (13, 6)]
+    assert index._heap == heap
+
+
+def test_ranked_index_forget_resets_tie_order():
+    index = RankedIndex()
+    index.set("a", 1)
+    index.set("b", 1)
+    index.forget("a")
+    index.set("a", 1)
+    assert index.top(2) == [("b", 1), ("a", 1)]
+
+
+def test_library_statistics_follow_updates():
+    library = GameLibrary(write_behind=False)
+    games = [library.add_game(f"Game {i}", f"/games/{i}.exe", genre="Action" if i % 2 else "RPG")
+             for i in range(6)]
+    library.record_play(games[2].key, 30)
+    library.record_play(games[2].key, 10)
+    library.record_play(games[4].key, 5)
+    library.update_game(games[4].key, genre="Action")
+    library.remove_game(games[2].key)
+
+    stats = library.get_statistics()
+    assert stats['total_games'] == 5
+    assert stats['total_plays'] == 1
+    assert stats['most_played'] == "Game 4"
+    assert [g.name for g in library.get_most_played(2)] == ["Game 4", "Game 0"]
+    assert library.get_genre_breakdown()["Action"]['count'] == 4
+    library.close()
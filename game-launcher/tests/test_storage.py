@@ -0,0 +1,119 @@
+# tests/test_storage.py
+# اختبارات التخزين: صيغة pickle المقسّمة والسجل الإلحاقي
+import pickle
+
+import pytest
+
+from src.database.storage import DEFAULT_CHUNK_SIZE, DatabaseManager, JournaledDatabaseManager
+
+
+def make_games(count, start=0):
+    return [{'id': f"game_{i}", 'name': f"Game {i}", 'path': f"/games/{i}"}
+            for i in range(start, start + count)]
+
+
+def iter_all(db, chunk_size=DEFAULT_CHUNK_SIZE):
+    return [game for chunk in db.iter_games(chunk_size) for game in chunk]
+
+
+# ========== الصيغة المقسّمة ==========
+def test_chunked_round_trip(tmp_path):
+    db = DatabaseManager(str(tmp_path / "games.db"))
+    games = make_games(2 * DEFAULT_CHUNK_SIZE + 7)
+    db.save_games(games)
+    assert db.load_games() == games
+    chunks = list(db.iter_games(300))
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    assert [game for chunk in chunks for game in chunk] == games
+
+
+def test_legacy_single_list_is_readable(tmp_path):
+    path = tmp_path / "games.db"
+    games = make_games(25)
+    with open(path, "wb") as f:
+        pickle.dump(games, f)
+    db = DatabaseManager(str(path))
+    assert db.load_games() == games
+    assert [len(chunk) for chunk in db.iter_games(10)] == [10, 10, 5]
+
+
+def test_missing_file_loads_empty(tmp_path):
+    db = DatabaseManager(str(tmp_path / "none.db"))
+    assert db.load_games() == []
+    assert iter_all(db) == []
+
+
+# ========== السجل الإلحاقي ==========
+@pytest.fixture
+def journaled(tmp_path):
+    db = JournaledDatabaseManager(str(tmp_path / "games.db"), background=False)
+    yield db
+    db.close()
+
+
+def test_journal_replays_over_snapshot(journaled):
+    games = make_games(5)
+    journaled.save_games(games)
+    renamed = dict(games[1], name="Renamed")
+    journaled.apply_changes([("update", renamed), ("delete", "game_2"),
+                             ("insert", make_games(1, start=9)[0])])
+    expected = [games[0], renamed, games[3], games[4], make_games(1, start=9)[0]]
+    assert journaled.load_games() == expected
+    assert iter_all(journaled, 2) == expected
+
+
+def tear_journal(db):
+    # سجل مبتور: بداية pickle صالحة دون نهايتها (كانقطاع أثناء الإلحاق)
+    record = pickle.dumps(("insert", make_games(1, start=99)[0]), protocol=pickle.HIGHEST_PROTOCOL)
+    with open(db.journal_path, "ab") as f:
+        f.write(record[:len(record) // 2])
+
+
+@pytest.mark.parametrize("load", ["load_games", "iter_games"])
+def test_torn_journal_tail_is_truncated(tmp_path, load):
+    path = str(tmp_path / "games.db")
+    db = JournaledDatabaseManager(path, background=False)
+    db.save_games(make_games(3))
+    db.apply_changes([("insert", make_games(1, start=3)[0])])
+    db.close()
+    tear_journal(db)
+
+    reopened = JournaledDatabaseManager(path, background=False)
+    loaded = reopened.load_games() if load == "load_games" else iter_all(reopened)
+    assert [g['id'] for g in loaded] == ["game_0", "game_1", "game_2", "game_3"]
+    assert reopened._journal_records == 1
+
+    # سجل جديد بعد الاسترجاع لا يضيع خلف الذيل التالف
+    reopened.apply_changes([("insert", make_games(1, start=4)[0])])
+    reopened.close()
+    again = JournaledDatabaseManager(path, background=False)
+    assert [g['id'] for g in again.load_games()][-2:] == ["game_3", "game_4"]
+    assert [g['id'] for g in iter_all(again)][-2:] == ["game_3", "game_4"]
+    assert again._journal_records == 2
+    again.close()
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path):
+    db = JournaledDatabaseManager(str(tmp_path / "games.db"), compact_threshold=3, background=False)
+    db.save_games(make_games(2))
+    db.apply_changes([("insert", g) for g in make_games(3, start=2)])
+    assert db._journal_records == 0
+    assert [g['id'] for g in DatabaseManager(db.db_path).load_games()] == [f"game_{i}" for i in range(5)]
+    db.close()
+
+
+# ========== اللقطة العمودية ==========
+def test_columnar_chunks_decode_shared_and_scattered_strings(tmp_path):
+    from src.database.columnar import ColumnarSnapshot, write_snapshot
+    games = [{'id': f"game_{i}", 'name': f"لعبة {i}", 'path': f"/games/{i}",
+              'genre': "RPG" if i % 2 else "Action",
+              # وصف مشترك كُتب في أول الجدول مع أوصاف فريدة متفرقة
+              'description': "" if i % 3 else f"وصف {i}",
+              'added_date': None, 'last_played': None, 'play_time': i, 'play_count': 0, 'key': i + 1}
+             for i in range(1000)]
+    path = str(tmp_path / "games.glcs")
+    write_snapshot(path, games)
+    with ColumnarSnapshot(path) as snapshot:
+        rows = [row for chunk in snapshot.iter_rows(128) for row in chunk]
+        assert rows == games
+        assert snapshot.row(999) == games[999]
@@ -0,0 +1,107 @@
+# tests/test_thumbnails.py
+# اختبارات الصور المصغرة: ذاكرة LRU محدودة بالبايت والتحميل في الخلفية
+# (تتطلب Qt: تُتخطى إن لم تكن مثبتة)
+import os
+import time
+
+import pytest
+
+pytest.importorskip("src.ui.qt_compat", reason="يتطلب PySide6 أو PyQt5")
+
+from src.ui.qt_compat import QColor, QImage, QPixmap  # noqa: E402
+from src.ui.thumbnails import THUMBNAIL_SIZE, PixmapLRUCache, ThumbnailService  # noqa: E402
+
+
+def wait_until(app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "انتهت المهلة"
+        app.processEvents()
+        time.sleep(0.002)
+
+
+def pixmap(size=10):
+    pix = QPixmap(size, size)
+    pix.fill(QColor("red"))
+    return pix
+
+
+def test_lru_evicts_least_recently_used_by_bytes(qapp):
+    cost = PixmapLRUCache._cost(pixmap())
+    cache = PixmapLRUCache(max_bytes=2 * cost)
+    cache.put("a", pixmap())
+    cache.put("b", pixmap())
+    assert cache.get("a") is not None  # "a" أحدث استخداماً الآن
+    cache.put("c", pixmap())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert len(cache) == 2 and cache.total_bytes == 2 * cost
+
+
+def test_lru_replacing_and_discarding_keep_byte_count(qapp):
+    cache = PixmapLRUCache()
+    cache.put("a", pixmap(10))
+    cache.put("a", pixmap(20))
+    assert len(cache) == 1 and cache.total_bytes == PixmapLRUCache._cost(pixmap(20))
+    cache.discard("a")
+    cache.discard("missing")
+    assert len(cache) == 0 and cache.total_bytes == 0
+
+
+def test_lru_keeps_a_single_oversized_item(qapp):
+    cache = PixmapLRUCache(max_bytes=1)
+    cache.put("big", pixmap(50))
+    assert cache.get("big") is not None
+    cache.put("next", pixmap(50))
+    assert cache.get("big") is None and cache.get("next") is not None
+
+
+@pytest.fixture
+def artwork(tmp_path):
+    path = str(tmp_path / "art.png")
+    image = QImage(960, 540, QImage.Format_RGB32)
+    image.fill(QColor("blue"))
+    assert image.save(path, "PNG")
+    return path
+
+
+def test_service_loads_in_background_and_caches_on_disk(qapp, tmp_path, artwork):
+    cache_dir = str(tmp_path / "thumbs")
+    service = ThumbnailService(cache_dir=cache_dir, max_threads=1)
+    ready = []
+    service.thumbnail_ready.connect(ready.append)
+    assert service.get(artwork) is None  # عنصر نائب حتى تصل الصورة
+    wait_until(qapp, lambda: ready)
+    assert ready == [artwork]
+    pix = service.get(artwork)
+    assert (pix.width(), pix.height()) == (THUMBNAIL_SIZE.width(), THUMBNAIL_SIZE.height())
+    assert len(os.listdir(cache_dir)) == 1
+    service.deleteLater()
+
+
+def test_service_memory_is_bounded(qapp, tmp_path, artwork):
+    one = PixmapLRUCache._cost(QPixmap.fromImage(QImage(THUMBNAIL_SIZE, QImage.Format_RGB32)))
+    service = ThumbnailService(max_bytes=one, cache_dir="", max_threads=1)
+    ready = []
+    service.thumbnail_ready.connect(ready.append)
+    other = str(tmp_path / "other.png")
+    QImage(artwork).save(other, "PNG")
+    service.get(artwork)
+    wait_until(qapp, lambda: len(ready) == 1)
+    service.get(other)
+    wait_until(qapp, lambda: len(ready) == 2)
+    assert len(service.cache) == 1 and service.cache.get(other) is not None
+    service.deleteLater()
+
+
+def test_service_does_not_retry_failed_images(qapp, tmp_path):
+    service = ThumbnailService(cache_dir="", max_threads=1)
+    missing = str(tmp_path / "missing.png")
+    assert service.get(missing) is None
+    wait_until(qapp, lambda: not service._pending)
+    assert missing in service._failed
+    service.get(missing)
+    assert not service._pending  # لا مهمة جديدة
+    service.invalidate(missing)
+    assert missing not in service._failed
+    service.deleteLater()
@@ -0,0 +1,74 @@
+# tests/test_views.py
+# اختبارات العروض المرتبة: التصفح بالمؤشر عند حدود الدلاء والحذف والتعديل
+import pytest
+
+from src.core.views import BUCKET_SIZE, SortedView, collation_key
+
+
+def make_view(count):
+    # قيم متكررة: التعادل يُحسم بالمعرف
+    view = SortedView(lambda value: value)
+    view.update((i, i % 97) for i in range(count))
+    return view
+
+
+def expected_order(view):
+    return [item_id for _, item_id in sorted(view._entries.values())]
+
+
+def pages(view, size, reverse=False):
+    result, after = [], None
+    while True:
+        page = view.page_after(after, size, reverse)
+        if not page:
+            return result
+        result.extend(page)
+        after = page[-1]
+
+
+@pytest.mark.parametrize("size", [1, 7, BUCKET_SIZE, BUCKET_SIZE + 1])
+def test_pages_cover_every_item_once_across_buckets(size):
+    view = make_view(3 * BUCKET_SIZE + 5)
+    # الإضافة بعد البناء تقسم الدلاء فتمر الصفحات بحدود غير منتظمة
+    for i in range(3 * BUCKET_SIZE + 5, 5 * BUCKET_SIZE):
+        view.add(i, i % 97)
+    order = expected_order(view)
+    assert pages(view, size) == order
+    assert pages(view, size, reverse=True) == order[::-1]
+
+
+def test_page_after_edges():
+    view = make_view(2 * BUCKET_SIZE)
+    order = expected_order(view)
+    assert view.page_after(order[-1], 10) == []
+    assert view.page_after(order[0], 10, reverse=True) == []
+    assert view.page_after(None, 0) == []
+    with pytest.raises(KeyError):
+        view.page_after("missing", 10)
+    assert SortedView(lambda v: v).page_after(None, 10, reverse=True) == []
+
+
+def test_cursor_survives_removal_and_update():
+    view = make_view(1000)
+    order = expected_order(view)
+    cursor = view.cursor(order[499])
+    view.discard(order[499])
+    assert view.page_after(cursor, 3) == order[500:503]
+    assert view.page_after(cursor, 3, reverse=True) == order[496:499][::-1]
+    # تعديل القيمة ينقل العنصر دون تكرار
+    view.add(order[0], 10 ** 6)
+    assert view.page_after(None, len(view))[-1] == order[0]
+    assert len(pages(view, 50)) == len(view) == 999
+
+
+def test_window_matches_pages():
+    view = make_view(BUCKET_SIZE * 2 + 3)
+    order = expected_order(view)
+    assert view.window(BUCKET_SIZE - 2, 5) == order[BUCKET_SIZE - 2:BUCKET_SIZE + 3]
+    assert view.window(0, 4, reverse=True) == order[::-1][:4]
+    assert view.index(order[BUCKET_SIZE]) == BUCKET_SIZE
+
+
+def test_collation_orders_numbers_and_arabic_digits():
+    names = ["Game 10", "game 2", "لعبة ٣", "لعبة 12", "Game 1"]
+    assert sorted(names, key=collation_key) == ["Game 1", "game 2", "Game 10", "لعبة ٣", "لعبة 12"]